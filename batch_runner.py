@@ -0,0 +1,141 @@
+# Loads modules for batch simulation
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from frame_profiler import percentile
+from game_log import logger
+from headless import HeadlessEngine, random_policy, run_right_policy
+
+# Constants: Batch Settings
+BATCH_LEVELS = (1, 2)
+BATCH_MAX_TICKS = 20000
+DEATH_BIN_WIDTH = 200
+CHUNKS_PER_WORKER = 4
+
+# Policies: Named policy factories, each called with the run's seed
+POLICIES = {
+    "random": random_policy,
+    "run_right": lambda seed: run_right_policy
+}
+
+# Worker: Sets each process's log level; level files are compiled once per process and shared by its runs
+def init_worker(log_level):
+    logger.set_level(log_level)
+
+# Play-Through: Runs one level on a fresh engine and in-memory save, so nothing carries over from earlier runs
+# Returns (level, seed, result, ticks, completion ms, death x)
+def play(job):
+    level, policy_name, seed, max_ticks = job
+    engine = HeadlessEngine(level)
+    result = engine.run(POLICIES[policy_name](seed), max_ticks)
+    state = engine.state
+    engine.close()
+    completion_ms = (state.end_timer - state.start_timer) - state.paused_time if result == "won" else None
+    death_x = state.player_x if result == "died" else None
+    return level, seed, result, engine.tick_count, completion_ms, death_x
+
+# Summary: Summary statistics of a list of numbers
+def describe(values):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "min": ordered[0],
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "max": ordered[-1]
+    }
+
+# Aggregate: Outcome counts, completion times and death positions per level
+def aggregate(runs, bin_width=DEATH_BIN_WIDTH):
+    levels = {}
+    for level, seed, result, ticks, completion_ms, death_x in runs:
+        entry = levels.setdefault(level, {"runs": 0, "won": 0, "died": 0, "running": 0, "ticks": 0, "completion_ms": [], "death_x": []})
+        entry["runs"] += 1
+        entry[result] += 1
+        entry["ticks"] += ticks
+        if completion_ms is not None:
+            entry["completion_ms"].append(completion_ms)
+        if death_x is not None:
+            entry["death_x"].append(death_x)
+    summary = {}
+    for level in sorted(levels):
+        entry = levels[level]
+        bins = {}
+        for x in entry["death_x"]:
+            start = x // bin_width * bin_width
+            bins[start] = bins.get(start, 0) + 1
+        summary[level] = {
+            "runs": entry["runs"],
+            "won": entry["won"],
+            "died": entry["died"],
+            "timed_out": entry["running"],
+            "win_rate": entry["won"] / entry["runs"],
+            "ticks": entry["ticks"],
+            "completion_ms": describe(entry["completion_ms"]),
+            "death_x": describe(entry["death_x"]),
+            "death_x_bins": {start: bins[start] for start in sorted(bins)}
+        }
+    return summary
+
+# Batch: Spreads play-throughs over a process pool, returning the runs in job order
+def run_batch(levels, runs_per_level, policy_name, seed=0, max_ticks=BATCH_MAX_TICKS, workers=None, log_level="WARNING"):
+    workers = workers or os.cpu_count() or 1
+    jobs = [(level, policy_name, seed + i, max_ticks) for level in levels for i in range(runs_per_level)]
+    chunksize = max(1, len(jobs) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(log_level,)) as executor:
+        return list(executor.map(play, jobs, chunksize=chunksize))
+
+# Command Line: Runs the batch, prints a per-level summary and optionally writes it as JSON
+def main():
+    parser = argparse.ArgumentParser(description="Run many headless play-throughs in parallel and summarize the outcomes")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(BATCH_LEVELS))
+    parser.add_argument("--runs", type=int, default=1000, help="play-throughs per level")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run, later runs count up from it")
+    parser.add_argument("--max-ticks", type=int, default=BATCH_MAX_TICKS, help="ticks before a run counts as timed out")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--death-bin", type=int, default=DEATH_BIN_WIDTH, help="width in pixels of the death position histogram bins")
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", help="write the summary and every run to this JSON file")
+    args = parser.parse_args()
+    logger.set_level(args.log_level)
+
+    start = time.perf_counter()
+    runs = run_batch(args.levels, args.runs, args.policy, args.seed, args.max_ticks, args.workers, args.log_level)
+    elapsed = time.perf_counter() - start
+    summary = aggregate(runs, args.death_bin)
+
+    for level, entry in summary.items():
+        print(f"Level {level}: {entry['runs']} runs, {entry['won']} won, {entry['died']} died, {entry['timed_out']} timed out ({entry['win_rate']:.1%} win rate)")
+        if entry["completion_ms"]:
+            times = entry["completion_ms"]
+            print(f"  completion: mean {times['mean'] / 1000:.2f}s, p50 {times['p50'] / 1000:.2f}s, best {times['min'] / 1000:.2f}s")
+        if entry["death_x"]:
+            deaths = entry["death_x"]
+            worst = sorted(entry["death_x_bins"].items(), key=lambda item: -item[1])[:3]
+            hotspots = ", ".join(f"x {start}-{start + args.death_bin}: {count}" for start, count in worst)
+            print(f"  deaths: mean x {deaths['mean']:.0f}, p50 x {deaths['p50']}; most at {hotspots}")
+    ticks = sum(entry["ticks"] for entry in summary.values())
+    print(f"Simulated {len(runs)} runs ({ticks} ticks) in {elapsed:.2f}s with {args.workers} workers ({len(runs) / elapsed:.0f} runs/s, {ticks / elapsed:.0f} ticks/s)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "policy": args.policy,
+                "seed": args.seed,
+                "max_ticks": args.max_ticks,
+                "workers": args.workers,
+                "elapsed_s": elapsed,
+                "summary": summary,
+                "runs": [dict(zip(("level", "seed", "result", "ticks", "completion_ms", "death_x"), run)) for run in runs]
+            }, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
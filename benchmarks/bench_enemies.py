@@ -0,0 +1,129 @@
+# Loads modules for the enemy system benchmark
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame  # type: ignore  # noqa: E402
+
+import platformer  # noqa: E402
+from enemy_arrays import EnemyArrays  # noqa: E402
+from game_log import ERROR, logger  # noqa: E402
+from headless import HeadlessEngine  # noqa: E402
+from spatial import GroundSpans  # noqa: E402
+
+# Constants: Benchmark Settings
+HORDE_SIZES = (1000, 10000)
+VERIFY_LEVEL = 1
+VERIFY_SEEDS = 6
+
+# Horde: Seeded enemies spread over level 1's ground with mixed speeds
+def make_horde(count, seed=0):
+    rnd = random.Random(seed)
+    y = platformer.HEIGHT - 40 - platformer.ENEMY_HEIGHT
+    return [platformer.Enemy(rnd.randrange(platformer.WORLD_WIDTH - platformer.ENEMY_WIDTH), y, platformer.ENEMY_WIDTH, platformer.ENEMY_HEIGHT, rnd.randint(2, 4)) for _ in range(count)]
+
+# Player Path: The player sweeps across the world and back so enemies chase, stop and turn around
+def player_path(ticks):
+    span = platformer.WORLD_WIDTH - platformer.PLAYER_WIDTH
+    for tick in range(ticks):
+        distance = tick * platformer.PLAYER_SPEED % (2 * span)
+        player_x = distance if distance <= span else 2 * span - distance
+        camera_x = max(0, min(player_x - platformer.WIDTH // 2 + platformer.PLAYER_WIDTH // 2, platformer.WORLD_WIDTH - platformer.WIDTH))
+        yield tick, player_x, camera_x, int(tick * 1000 / 60)
+
+# Enemy Systems: One tick of movement plus the player overlap test, as GameState.update runs it
+def step_objects(enemies, player_rect, ground_spans, camera_x, now):
+    hit = False
+    for enemy in enemies:
+        enemy.update(player_rect.x, platformer.PLAYER_WIDTH, ground_spans, camera_x, now)
+        if player_rect.colliderect(enemy.rect):
+            hit = True
+    return hit
+
+def step_arrays(enemies, player_rect, ground_spans, camera_x, now):
+    enemies.update(player_rect.x, platformer.PLAYER_WIDTH, ground_spans, camera_x, now)
+    return enemies.collides(player_rect)
+
+# Enemy State: Every field Enemy.update changes, per enemy, read the same way from either system
+def enemy_state(enemies):
+    if isinstance(enemies, EnemyArrays):
+        return list(zip(enemies.x.tolist(), enemies.y.tolist(), enemies.current_speed.tolist(),
+                        enemies.is_chasing.tolist(), enemies.speed_increase_timer.tolist()))
+    return [(enemy.rect.x, enemy.rect.y, enemy.current_speed, enemy.is_chasing, enemy.speed_increase_timer) for enemy in enemies]
+
+# Benchmark: Ticks per second for one system and horde size, with the hits and final state for comparison
+def bench_enemy_system(system, count, ticks):
+    ground_spans = GroundSpans(platformer.level_data[1]["platforms"], platformer.HEIGHT - 40)
+    enemies = make_horde(count)
+    step = step_objects
+    if system == "arrays":
+        enemies = EnemyArrays(enemies, platformer.WIDTH, platformer.WORLD_WIDTH)
+        step = step_arrays
+    player_y = platformer.HEIGHT - 40 - platformer.PLAYER_HEIGHT
+    hits = 0
+    start = time.perf_counter()
+    for tick, player_x, camera_x, now in player_path(ticks):
+        player_rect = pygame.Rect(player_x, player_y, platformer.PLAYER_WIDTH, platformer.PLAYER_HEIGHT)
+        hits += step(enemies, player_rect, ground_spans, camera_x, now)
+    elapsed = time.perf_counter() - start
+    return ticks / elapsed, hits, enemy_state(enemies)
+
+# Verification Policy: Seeded inputs that nearly always run right and jump often, so runs get past the hole to the enemies
+def forward_policy(seed):
+    rnd = random.Random(seed)
+    return lambda engine: (rnd.random() < 0.05, rnd.random() < 0.95, not engine.state.is_jumping and rnd.random() < 0.5, rnd.random() < 0.05)
+
+# Verification: Plays seeded runs with both systems side by side and compares player and enemy state every tick
+# A death restarts from the last reached checkpoint, as the game over screen's R does, so runs carry on to later enemies
+# Returns (identical, ticks, ticks with an enemy chasing) so a run that never met an enemy is not counted as a pass
+def verify_level(level, seeds, max_ticks):
+    ticks = 0
+    chasing_ticks = 0
+    for seed in range(seeds):
+        engines = [HeadlessEngine(level, enemy_arrays=False), HeadlessEngine(level, enemy_arrays=True)]
+        policy = forward_policy(seed)
+        for _ in range(max_ticks):
+            inputs = policy(engines[0])
+            results = [engine.step(*inputs) for engine in engines]
+            states = [engine.state.replay_end_state() for engine in engines]
+            enemies = [enemy_state(engine.state.enemies) for engine in engines]
+            ticks += 1
+            if results[0] != results[1] or states[0] != states[1] or enemies[0] != enemies[1]:
+                return False, ticks, chasing_ticks
+            chasing_ticks += any(is_chasing for _, _, _, is_chasing, _ in enemies[0])
+            if results[0] == "won":
+                break
+            if results[0] == "died":
+                for engine in engines:
+                    engine.state.reset(full_reset=False, level=level)
+        for engine in engines:
+            engine.close()
+    return True, ticks, chasing_ticks
+
+# Command Line: Checks both systems agree, then prints ticks per second at each horde size
+def main():
+    parser = argparse.ArgumentParser(description="Compare the Enemy object and NumPy array enemy systems")
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--verify-ticks", type=int, default=10000)
+    args = parser.parse_args()
+
+    logger.set_level(ERROR)
+    failed = False
+    identical, ticks, chasing_ticks = verify_level(VERIFY_LEVEL, VERIFY_SEEDS, args.verify_ticks)
+    failed |= not identical or not chasing_ticks
+    print(f"level {VERIFY_LEVEL}: {'identical' if identical else 'DIFFERENT'} over {ticks} ticks, {chasing_ticks} with enemies chasing")
+
+    print(f"{'enemies':<10}{'objects':>14}{'arrays':>14}{'speedup':>10}   (ticks/s, {args.ticks} ticks)")
+    for count in HORDE_SIZES:
+        object_rate, object_hits, object_state = bench_enemy_system("objects", count, args.ticks)
+        array_rate, array_hits, array_state = bench_enemy_system("arrays", count, args.ticks)
+        identical = object_hits == array_hits and object_state == array_state
+        failed |= not identical
+        print(f"{count:<10}{object_rate:>14.1f}{array_rate:>14.1f}{array_rate / object_rate:>9.1f}x{'' if identical else '   DIFFERENT'}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
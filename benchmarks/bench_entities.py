@@ -0,0 +1,166 @@
+# Loads modules for the entity memory benchmark
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import platformer  # noqa: E402
+from checkpoint_registry import Checkpoint  # noqa: E402
+from game_log import ERROR, logger  # noqa: E402
+from spatial import GroundSpans  # noqa: E402
+
+# Constants: Benchmark Settings
+UPDATE_CAMERA_X = 2000
+UPDATE_ENEMIES = 1000
+
+# Dict Layout: The same class without __slots__, so instances keep a per-instance __dict__ as they used to
+def unslotted(cls):
+    namespace = {name: value for name, value in vars(cls).items() if name not in ("__slots__", "__dict__", "__weakref__") and name not in cls.__slots__}
+    return type(f"Dict{cls.__name__}", (), namespace)
+
+# Entity Factories: (slotted, dict layout) constructors for the i-th entity of each type
+def entity_factories():
+    DictEnemy = unslotted(platformer.Enemy)
+    DictPlatform = unslotted(platformer.Platform)
+    DictInteractable = unslotted(platformer.Interactable)
+    return {
+        "Enemy": (lambda i: platformer.Enemy(i % 5000, 530, 30, 30, 3), lambda i: DictEnemy(i % 5000, 530, 30, 30, 3)),
+        "Platform": (lambda i: platformer.Platform(i % 5000, 560, 200, 40), lambda i: DictPlatform(i % 5000, 560, 200, 40)),
+        "Interactable": (lambda i: platformer.Interactable(i % 5000, 500, 20, 20, "blaster"), lambda i: DictInteractable(i % 5000, 500, 20, 20, "blaster")),
+        "Checkpoint": (lambda i: Checkpoint(f"1.{i}", i, 370, 20, 30, False, i, 370),
+                       lambda i: Checkpoint(f"1.{i}", i, 370, 20, 30, False, i, 370).to_dict())
+    }
+
+# Memory: Bytes allocated per entity while building count of them, measured with tracemalloc
+def bytes_per_entity(factory, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / count
+
+# Access: Nanoseconds per read of the fields the game loop reads most
+def access_ns(entities, read, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for entity in entities:
+            read(entity)
+    return (time.perf_counter() - start) / (repeat * len(entities)) * 1e9
+
+def field_readers():
+    return {
+        "Enemy": lambda e: (e.rect, e.current_speed, e.is_chasing, e.speed_increase_timer),
+        "Platform": lambda p: p.rect,
+        "Interactable": lambda b: (b.rect, b.name),
+        "Checkpoint": (lambda cp: (cp.id, cp.reached, cp.player_x), lambda cp: (cp["id"], cp["reached"], cp["player_x"]))
+    }
+
+# Hot Loop: Enemy.update as it was before the slotted types, reading self.rect on every access
+def legacy_enemy_update(self, player_x, player_width, ground_spans, camera_x, current_time):
+    if camera_x <= self.rect.x <= camera_x + platformer.WIDTH:
+        player_center = player_x + player_width / 2
+        enemy_center = self.rect.x + self.rect.width / 2
+        is_trying_to_move = False
+        next_x = self.rect.x
+
+        if player_center < enemy_center:
+            next_x = self.rect.x - self.current_speed
+            can_move = ground_spans.has_ground(next_x)
+            if can_move and next_x >= 0:
+                self.rect.x = next_x
+                is_trying_to_move = True
+        elif player_center > enemy_center:
+            next_x = self.rect.x + self.current_speed
+            next_right = next_x + self.rect.width
+            can_move = ground_spans.has_ground(next_right)
+            if can_move and next_right <= platformer.WORLD_WIDTH:
+                self.rect.x = next_x
+                is_trying_to_move = True
+
+        if is_trying_to_move:
+            if not self.is_chasing:
+                self.is_chasing = True
+                self.chase_start_time = current_time
+                self.speed_increase_timer = current_time
+            if current_time - self.speed_increase_timer >= 2000:
+                self.current_speed += 1
+                self.speed_increase_timer = current_time
+        else:
+            if self.is_chasing:
+                self.is_chasing = False
+                self.current_speed = self.base_speed
+
+    self.rect.x = max(0, min(self.rect.x, platformer.WORLD_WIDTH - self.rect.width))
+
+# Hot Loop: (before, after) Enemy factories, dict layout with the old update against the slotted Enemy
+def enemy_update_factories():
+    LegacyEnemy = unslotted(platformer.Enemy)
+    LegacyEnemy.update = legacy_enemy_update
+    return (
+        lambda i: LegacyEnemy(UPDATE_CAMERA_X + i * 7 % platformer.WIDTH, 530, 30, 30, 2 + i % 3),
+        lambda i: platformer.Enemy(UPDATE_CAMERA_X + i * 7 % platformer.WIDTH, 530, 30, 30, 2 + i % 3)
+    )
+
+# Hot Loop: Seconds for ticks of Enemy.update over on-screen enemies chasing a player that sweeps the view
+def enemy_update_time(enemies, ticks):
+    ground_spans = GroundSpans(platformer.level_data[1]["platforms"], platformer.HEIGHT - 40)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        player_x = UPDATE_CAMERA_X + tick * 37 % platformer.WIDTH
+        for enemy in enemies:
+            enemy.update(player_x, platformer.PLAYER_WIDTH, ground_spans, UPDATE_CAMERA_X, tick * 16)
+    return time.perf_counter() - start
+
+# Hot Loop: Median ticks per second for (before, after) and the median of their per-round ratios
+# Each round times both on fresh enemies back to back, alternating which goes first, after one warmup round
+def enemy_update_rates(factories, count, ticks, rounds):
+    times = ([], [])
+    states = []
+    for n in range(rounds + 1):
+        round_times = [0.0, 0.0]
+        for i in ((0, 1) if n % 2 else (1, 0)):
+            enemies = [factories[i](e) for e in range(count)]
+            round_times[i] = enemy_update_time(enemies, ticks)
+            if n == 0:
+                states.append([(e.rect.x, e.current_speed, e.is_chasing) for e in enemies])
+        if n:
+            times[0].append(round_times[0])
+            times[1].append(round_times[1])
+    speedup = statistics.median(before / after for before, after in zip(*times))
+    return ticks / statistics.median(times[0]), ticks / statistics.median(times[1]), speedup, states[0] == states[1]
+
+# Command Line: Prints memory and access time per entity for the slotted and dict layouts
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory and attribute access of the slotted entity types")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--ticks", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=15)
+    args = parser.parse_args()
+
+    logger.set_level(ERROR)
+    readers = field_readers()
+    print(f"{'type':<14}{'dict B':>9}{'slots B':>9}{'saved':>8}{'dict ns':>10}{'slots ns':>10}   (per entity, {args.count} entities)")
+    for name, (slotted, dict_layout) in entity_factories().items():
+        dict_bytes = bytes_per_entity(dict_layout, args.count)
+        slot_bytes = bytes_per_entity(slotted, args.count)
+        read = readers[name]
+        slot_read, dict_read = read if isinstance(read, tuple) else (read, read)
+        dict_ns = access_ns([dict_layout(i) for i in range(args.count)], dict_read, args.repeat)
+        slot_ns = access_ns([slotted(i) for i in range(args.count)], slot_read, args.repeat)
+        print(f"{name:<14}{dict_bytes:>9.0f}{slot_bytes:>9.0f}{1 - slot_bytes / dict_bytes:>8.0%}{dict_ns:>10.1f}{slot_ns:>10.1f}")
+
+    before_rate, after_rate, speedup, identical = enemy_update_rates(enemy_update_factories(), UPDATE_ENEMIES, args.ticks, args.rounds)
+    print(f"Enemy.update over {UPDATE_ENEMIES} on-screen enemies, median of {args.rounds} rounds: "
+          f"{before_rate:.0f} ticks/s before, {after_rate:.0f} ticks/s after ({speedup - 1:+.0%})"
+          f"{'' if identical else '   DIFFERENT'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Loads modules for the save store micro-benchmark
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import platformer  # noqa: E402
+from game_log import ERROR, logger  # noqa: E402
+from save_stores import create_save_store  # noqa: E402
+
+# Constants: Benchmark Settings
+BACKENDS = (
+    ("sqlite (WAL, NORMAL)", "sqlite", {"journal_mode": "WAL", "synchronous": "NORMAL"}),
+    ("sqlite (WAL, FULL)", "sqlite", {"journal_mode": "WAL", "synchronous": "FULL"}),
+    ("sqlite (DELETE, FULL)", "sqlite", {"journal_mode": "DELETE", "synchronous": "FULL"}),
+    ("memory", "memory", {}),
+    ("log", "log", {"fsync": False}),
+    ("log (fsync)", "log", {"fsync": True}),
+)
+
+# Timing: Runs an operation repeatedly and returns the mean latency in microseconds
+def time_operation(operation, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+# Benchmark: Measures save_game/load_game/update_checkpoint through CheckpointManager for one backend
+def bench_backend(backend, options, directory, iterations):
+    path = os.path.join(directory, f"bench_{backend}_{len(os.listdir(directory))}.save")
+    store = create_save_store(backend, path, **options)
+    manager = platformer.CheckpointManager(path, store=store)
+    results = {
+        "save_game": time_operation(manager.save_game, iterations),
+        "load_game": time_operation(manager.load_game, iterations),
+        "update_checkpoint": time_operation(lambda: manager.update_checkpoint("1.1", True, player_x=2990, player_y=370), iterations),
+    }
+    manager.close()
+    return results
+
+# Command Line: Prints mean latency per backend and operation
+def main():
+    parser = argparse.ArgumentParser(description="Compare save store latency on the save_game/load_game workload")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    logger.set_level(ERROR)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, backend, options in BACKENDS:
+            rows.append((name, bench_backend(backend, options, directory, args.iterations)))
+
+    print(f"{'backend':<24}{'save_game':>14}{'load_game':>14}{'update_checkpoint':>20}   (mean us/op, {args.iterations} iterations)")
+    for name, results in rows:
+        print(f"{name:<24}{results['save_game']:>14.1f}{results['load_game']:>14.1f}{results['update_checkpoint']:>20.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# Loads modules for the benchmark suite
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame  # type: ignore  # noqa: E402
+
+import platformer  # noqa: E402
+from bench_enemies import HORDE_SIZES, bench_enemy_system  # noqa: E402
+from bench_save_stores import bench_backend  # noqa: E402
+from game_log import ERROR, logger  # noqa: E402
+from headless import HeadlessEngine, random_policy  # noqa: E402
+
+# Constants: Benchmark Settings
+SIM_LEVELS = (1, 2)
+SYNTHETIC_SCALES = (10, 100)
+SYNTHETIC_LEVEL_BASE = 100
+SAVE_BACKENDS = (("sqlite", {"journal_mode": "WAL", "synchronous": "NORMAL"}), ("memory", {}))
+ENEMY_SYSTEMS = ("objects", "arrays")
+DEFAULT_TOLERANCE = 0.10
+
+# Synthetic Level: Level 1 with every platform and enemy repeated scale times
+# Extra platforms are stacked above the screen so they load the broadphase without changing the route
+def add_synthetic_level(scale):
+    level = SYNTHETIC_LEVEL_BASE + scale
+    base = platformer.level_data[1]
+    platforms = list(base["platforms"])
+    enemies = list(base["enemies"])
+    for copy in range(1, scale):
+        platforms += [platformer.Platform(p.rect.x, p.rect.y - copy * platformer.HEIGHT, p.rect.width, p.rect.height) for p in base["platforms"]]
+        enemies += [platformer.Enemy(e.rect.x + copy * 11, e.rect.y, e.rect.width, e.rect.height, e.base_speed) for e in base["enemies"]]
+    platformer.level_data[level] = dict(base, platforms=platforms, enemies=enemies)
+    return level
+
+# Simulation: Gameplay ticks per second on one level
+def bench_ticks(engine, level, ticks):
+    engine.reset(level)
+    policy = random_policy(level)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if engine.step(*policy(engine)) != "running":
+            engine.reset(level)
+    return ticks / (time.perf_counter() - start)
+
+# Rendering: render_game frames per second into an off-screen surface, stepping gameplay between frames
+def bench_render(engine, level, frames):
+    platformer.screen = pygame.Surface((platformer.WIDTH, platformer.HEIGHT))
+    platformer.game = engine.state
+    engine.reset(level)
+    policy = random_policy(level)
+    elapsed = 0.0
+    for frame in range(frames + 30):
+        if engine.step(*policy(engine)) != "running":
+            engine.reset(level)
+        start = time.perf_counter()
+        platformer.render_game()
+        if frame >= 30:
+            elapsed += time.perf_counter() - start
+    return frames / elapsed
+
+# Metric: Keeps the best of several runs, a rate is best when highest and a latency when lowest
+def best_of(repeat, measure, higher_is_better):
+    results = [measure() for _ in range(repeat)]
+    return max(results) if higher_is_better else min(results)
+
+def metric(value, unit, higher_is_better):
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+# Suite: Runs every benchmark and returns {name: metric}
+def run_suite(ticks, frames, save_iterations, repeat, enemy_ticks):
+    platformer.init_display()
+    engine = HeadlessEngine()
+    metrics = {}
+    levels = [(f"level{level}", level) for level in SIM_LEVELS]
+    levels += [(f"synthetic{scale}x", add_synthetic_level(scale)) for scale in SYNTHETIC_SCALES]
+    for name, level in levels:
+        metrics[f"sim.{name}.ticks_per_s"] = metric(best_of(repeat, lambda: bench_ticks(engine, level, ticks), True), "ticks/s", True)
+    for name, level in levels:
+        metrics[f"render.{name}.fps"] = metric(best_of(repeat, lambda: bench_render(engine, level, frames), True), "frames/s", True)
+    engine.close()
+    for count in HORDE_SIZES:
+        for system in ENEMY_SYSTEMS:
+            metrics[f"enemies.{system}.{count}.ticks_per_s"] = metric(best_of(repeat, lambda: bench_enemy_system(system, count, enemy_ticks)[0], True), "ticks/s", True)
+    with tempfile.TemporaryDirectory() as directory:
+        for backend, options in SAVE_BACKENDS:
+            runs = [bench_backend(backend, options, directory, save_iterations) for _ in range(repeat)]
+            for operation in runs[0]:
+                metrics[f"save.{backend}.{operation}_us"] = metric(min(run[operation] for run in runs), "us/op", False)
+    return metrics
+
+# Baseline: Relative change per metric, flagged as a regression when it is worse than the tolerance
+def compare(metrics, baseline, tolerance):
+    rows = []
+    for name, entry in metrics.items():
+        previous = baseline.get("metrics", {}).get(name)
+        if previous is None or not previous["value"]:
+            rows.append((name, entry, None, False))
+            continue
+        change = (entry["value"] - previous["value"]) / previous["value"]
+        worse = -change if entry["higher_is_better"] else change
+        rows.append((name, entry, change, worse > tolerance))
+    return rows
+
+# Command Line: Prints the results, optionally writes them as JSON and compares against a baseline
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark simulation, rendering and save throughput")
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--save-iterations", type=int, default=300)
+    parser.add_argument("--enemy-ticks", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against a JSON file written by --output")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown before a metric counts as a regression")
+    args = parser.parse_args()
+
+    logger.set_level(ERROR)
+    metrics = run_suite(args.ticks, args.frames, args.save_iterations, args.repeat, args.enemy_ticks)
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "metrics": metrics
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    rows = compare(metrics, baseline or {}, args.tolerance)
+    regressions = 0
+    for name, entry, change, regressed in rows:
+        line = f"{name:<40}{entry['value']:>14.1f} {entry['unit']:<9}"
+        if baseline is not None:
+            line += "   (new)" if change is None else f"{change:>+9.1%}{'  REGRESSION' if regressed else ''}"
+        regressions += regressed
+        print(line)
+    if regressions:
+        print(f"{regressions} metrics regressed by more than {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
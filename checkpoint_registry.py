@@ -0,0 +1,105 @@
+# Loads modules for the checkpoint registry
+import pygame  # type: ignore
+
+# Constants: Checkpoint Record Fields, in save column order
+CHECKPOINT_FIELDS = ("id", "x", "y", "width", "height", "reached", "player_x", "player_y")
+
+# Checkpoint: Compact slotted checkpoint record
+class Checkpoint:
+    __slots__ = CHECKPOINT_FIELDS
+
+    def __init__(self, id, x, y, width, height, reached, player_x, player_y):
+        self.id = id
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.reached = reached
+        self.player_x = player_x
+        self.player_y = player_y
+
+    # Conversion: Plain dict form for JSON save logs and replay headers
+    def to_dict(self):
+        return {field: getattr(self, field) for field in CHECKPOINT_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*(data[field] for field in CHECKPOINT_FIELDS))
+
+    def copy(self):
+        return Checkpoint(self.id, self.x, self.y, self.width, self.height, self.reached, self.player_x, self.player_y)
+
+    # Update: Applies {field: value} column changes
+    def update(self, columns):
+        for field, value in columns.items():
+            setattr(self, field, value)
+
+# Checkpoint Level: Parses the level number from an ID such as "2.1"
+def checkpoint_level(id):
+    try:
+        return int(id.split('.')[0])
+    except (ValueError, IndexError):
+        return None
+
+# Checkpoint Registry: Indexes checkpoint records by ID and by level with precomputed rects
+# Iterating the registry yields records in insertion order, like the list it replaces
+class CheckpointRegistry:
+    def __init__(self, checkpoints=()):
+        self.by_id = {}
+        self.rects = {}
+        self.levels = {}
+        self.by_level = {}
+        self.unreached_cache = {}
+        for checkpoint in checkpoints:
+            self.add(checkpoint)
+
+    def __iter__(self):
+        return iter(list(self.by_id.values()))
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, id):
+        return id in self.by_id
+
+    # Registry: Adds a record, returning False when its ID is already registered
+    def add(self, checkpoint):
+        id = checkpoint.id
+        if id in self.by_id:
+            return False
+        level = checkpoint_level(id)
+        self.by_id[id] = checkpoint
+        self.rects[id] = pygame.Rect(checkpoint.x, checkpoint.y, checkpoint.width, checkpoint.height)
+        self.levels[id] = level
+        self.by_level.setdefault(level, []).append(checkpoint)
+        self.unreached_cache.pop(level, None)
+        return True
+
+    def get(self, id):
+        return self.by_id.get(id)
+
+    # Registry: Removes and returns a record, or None when it is not registered
+    def remove(self, id):
+        checkpoint = self.by_id.pop(id, None)
+        if checkpoint is None:
+            return None
+        level = self.levels.pop(id)
+        del self.rects[id]
+        self.by_level[level] = [cp for cp in self.by_level[level] if cp is not checkpoint]
+        self.unreached_cache.pop(level, None)
+        return checkpoint
+
+    # Registry: Sets a record's reached flag and refreshes its level's unreached list
+    def set_reached(self, id, reached):
+        checkpoint = self.by_id.get(id)
+        if checkpoint is not None:
+            checkpoint.reached = reached
+            self.unreached_cache.pop(self.levels[id], None)
+
+    # Registry: Returns (record, rect) pairs for a level's unreached checkpoints in insertion order
+    def unreached(self, level):
+        pending = self.unreached_cache.get(level)
+        if pending is None:
+            pending = [(cp, self.rects[cp.id]) for cp in self.by_level.get(level, ()) if not cp.reached]
+            self.unreached_cache[level] = pending
+        return pending
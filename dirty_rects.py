@@ -0,0 +1,40 @@
+# Loads modules for dirty-rectangle rendering
+from collections import Counter
+
+import pygame  # type: ignore
+
+# Constants: Dirty Rect Settings
+MAX_DIRTY_RECTS = 64
+REPAINT_EVENTS = (
+    pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWSHOWN,
+    pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED
+)
+
+# Dirty Rect Tracker: Records each frame's draw calls and finds the screen regions that changed
+# A draw call is identified by what it drew and where, so draws repeated unchanged between frames are skipped
+class DirtyRectTracker:
+    def __init__(self):
+        self.frame = Counter()
+        self.previous = Counter()
+        self.needs_full_repaint = True
+
+    # Records one draw call; the key must end with the affected rect as a tuple
+    def record(self, key):
+        self.frame[key] += 1
+
+    # Returns rects covering draws added or removed since the last frame, then starts a new frame
+    def flush(self):
+        changed = (self.frame - self.previous) + (self.previous - self.frame)
+        self.previous = self.frame
+        self.frame = Counter()
+        self.needs_full_repaint = False
+        rects = [pygame.Rect(key[-1]) for key in changed]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        if len(rects) > MAX_DIRTY_RECTS:
+            return [rects[0].unionall(rects[1:])]
+        return rects
+
+    # Forgets the previous frame and asks for the next frame to be presented in full, as after a window expose
+    def invalidate(self):
+        self.previous = Counter()
+        self.needs_full_repaint = True
@@ -0,0 +1,110 @@
+# Loads modules for array-based enemies
+import pygame  # type: ignore
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Constants: Enemy Rules
+SPEED_RAMP_MS = 2000
+
+# Enemy Snapshot: Read-only copy of one enemy's fields, shaped like an Enemy for rendering and reporting
+class EnemySnapshot:
+    def __init__(self, rect, base_speed, current_speed, origin_x, is_chasing):
+        self.rect = rect
+        self.base_speed = base_speed
+        self.current_speed = current_speed
+        self.origin_x = origin_x
+        self.is_chasing = is_chasing
+
+# Enemy Arrays: Struct-of-arrays enemy system applying Enemy.update's rules to every enemy at once
+# Index i holds the i-th enemy of the list it was built from; reading an index returns an EnemySnapshot
+class EnemyArrays:
+    def __init__(self, enemies, view_width, world_width):
+        if np is None:
+            raise RuntimeError("The array enemy system needs numpy")
+        self.view_width = view_width
+        self.world_width = world_width
+        self.x = np.array([enemy.rect.x for enemy in enemies], dtype=np.int64)
+        self.y = np.array([enemy.rect.y for enemy in enemies], dtype=np.int64)
+        self.width = np.array([enemy.rect.width for enemy in enemies], dtype=np.int64)
+        self.height = np.array([enemy.rect.height for enemy in enemies], dtype=np.int64)
+        self.base_speed = np.array([enemy.base_speed for enemy in enemies], dtype=np.int64)
+        self.current_speed = np.array([enemy.current_speed for enemy in enemies], dtype=np.int64)
+        self.origin_x = np.array([enemy.origin_x for enemy in enemies], dtype=np.int64)
+        self.is_chasing = np.array([enemy.is_chasing for enemy in enemies], dtype=bool)
+        self.chase_start_time = np.array([enemy.chase_start_time for enemy in enemies], dtype=np.int64)
+        self.speed_increase_timer = np.array([enemy.speed_increase_timer for enemy in enemies], dtype=np.int64)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, i):
+        return EnemySnapshot(
+            pygame.Rect(int(self.x[i]), int(self.y[i]), int(self.width[i]), int(self.height[i])),
+            int(self.base_speed[i]), int(self.current_speed[i]), int(self.origin_x[i]), bool(self.is_chasing[i])
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self.x)))
+
+    # Reset: Puts every enemy back at its origin on the ground at its base speed
+    def reset(self, ground_y):
+        self.x[:] = self.origin_x
+        self.y[:] = ground_y
+        self.current_speed[:] = self.base_speed
+        self.is_chasing[:] = False
+
+    # Ground Check: GroundSpans.has_ground for an array of x positions
+    @staticmethod
+    def has_ground(ground_spans, xs):
+        if not ground_spans.lefts:
+            return np.zeros(len(xs), dtype=bool)
+        rights = np.asarray(ground_spans.rights)
+        i = np.searchsorted(np.asarray(ground_spans.lefts), xs, side="right") - 1
+        return (i >= 0) & (xs <= rights[np.maximum(i, 0)])
+
+    # Enemy Movement: Enemies on screen step toward the player where there is ground, ramp up while chasing
+    # and drop back to base speed when they stop; every enemy is then kept inside the world
+    def update(self, player_x, player_width, ground_spans, camera_x, current_time):
+        x = self.x
+        speed = self.current_speed
+        visible = (camera_x <= x) & (x <= camera_x + self.view_width)
+        player_center = player_x + player_width / 2
+        enemy_center = x + self.width / 2
+
+        next_left = x - speed
+        moves_left = visible & (player_center < enemy_center) & (next_left >= 0)
+        moves_left &= self.has_ground(ground_spans, next_left)
+        next_right = x + speed + self.width
+        moves_right = visible & (player_center > enemy_center) & (next_right <= self.world_width)
+        moves_right &= self.has_ground(ground_spans, next_right)
+        moving = moves_left | moves_right
+        x = np.where(moves_left, next_left, np.where(moves_right, x + speed, x))
+
+        # Chase: Starts the chase timers, then ramps the speed of long chases
+        starts = moving & ~self.is_chasing
+        self.is_chasing |= starts
+        self.chase_start_time[starts] = current_time
+        self.speed_increase_timer[starts] = current_time
+        ramps = moving & (current_time - self.speed_increase_timer >= SPEED_RAMP_MS)
+        speed[ramps] += 1
+        self.speed_increase_timer[ramps] = current_time
+        stops = visible & ~moving & self.is_chasing
+        self.is_chasing[stops] = False
+        speed[stops] = self.base_speed[stops]
+
+        self.x = np.maximum(0, np.minimum(x, self.world_width - self.width))
+
+    # Collision: True when any enemy overlaps the rect, with pygame's colliderect rules
+    def collides(self, rect):
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        x = self.x
+        y = self.y
+        return bool(np.any(
+            (self.width > 0) & (self.height > 0)
+            & (x < rect.right) & (rect.x < x + self.width)
+            & (y < rect.bottom) & (rect.y < y + self.height)
+        ))
@@ -0,0 +1,108 @@
+# Loads modules for frame profiling
+import csv
+import json
+import math
+import time
+from collections import deque
+
+# Constants: Profiler Settings
+PROFILE_WINDOW = 300
+OVERLAY_REFRESH_FRAMES = 30
+PERCENTILES = (50, 95, 99)
+
+# Percentile: Nearest-rank percentile of an already sorted list
+def percentile(sorted_samples, p):
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+# Frame Profiler: Rolling per-phase frame timings in milliseconds
+# Each lap() charges the time since the previous lap to a phase; end_frame() stores the frame's totals
+class FrameProfiler:
+    def __init__(self, window=PROFILE_WINDOW, enabled=False):
+        self.window = window
+        self.enabled = enabled
+        self.show_overlay = False
+        self.samples = {}
+        self.phase_order = []
+        self.current = {}
+        self.frame_start = None
+        self.last_lap = None
+        self.frame_count = 0
+        self.overlay_lines = []
+
+    # Overlay: Shows or hides the on-screen table, collecting timings while it is visible
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self.enabled = True
+            self.overlay_lines = []
+
+    # Frame: Starts timing a new frame
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_start = self.last_lap = time.perf_counter()
+        self.current = {}
+
+    # Phase: Charges the time since the previous lap to a phase
+    def lap(self, phase):
+        if self.last_lap is None:
+            return
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + (now - self.last_lap) * 1000
+        self.last_lap = now
+
+    # Frame: Stores this frame's phase totals and the whole frame time in the rolling windows
+    def end_frame(self):
+        if self.last_lap is None:
+            return
+        self.current["frame"] = (time.perf_counter() - self.frame_start) * 1000
+        for phase, elapsed in self.current.items():
+            samples = self.samples.get(phase)
+            if samples is None:
+                samples = self.samples[phase] = deque(maxlen=self.window)
+                self.phase_order.append(phase)
+            samples.append(elapsed)
+        self.frame_count += 1
+        self.last_lap = None
+        if self.show_overlay and (not self.overlay_lines or self.frame_count % OVERLAY_REFRESH_FRAMES == 0):
+            self.overlay_lines = self._format_overlay()
+
+    # Stats: Returns {phase: {"count", "mean", "max", "p50", "p95", "p99"}} over the rolling window
+    def stats(self):
+        result = {}
+        for phase in self.phase_order:
+            ordered = sorted(self.samples[phase])
+            entry = {"count": len(ordered), "mean": sum(ordered) / len(ordered), "max": ordered[-1]}
+            for p in PERCENTILES:
+                entry[f"p{p}"] = percentile(ordered, p)
+            result[phase] = entry
+        return result
+
+    # Overlay: One line per phase with its p50/p95/p99 in milliseconds
+    def _format_overlay(self):
+        lines = [f"{'phase':<12}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for phase, entry in self.stats().items():
+            lines.append(f"{phase:<12}{entry['p50']:>7.2f}{entry['p95']:>7.2f}{entry['p99']:>7.2f}")
+        return lines
+
+    # Export: Writes the stats as CSV, or as JSON with the raw samples, chosen by file extension
+    def export(self, path):
+        stats = self.stats()
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({
+                    "frames": self.frame_count,
+                    "window": self.window,
+                    "stats": stats,
+                    "samples": {phase: list(self.samples[phase]) for phase in self.phase_order}
+                }, f, indent=2)
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase", "count", "mean", "max"] + [f"p{p}" for p in PERCENTILES])
+            for phase, entry in stats.items():
+                writer.writerow([phase, entry["count"], f"{entry['mean']:.4f}", f"{entry['max']:.4f}"]
+                                + [f"{entry[f'p{p}']:.4f}" for p in PERCENTILES])
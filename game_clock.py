@@ -0,0 +1,52 @@
+# Loads modules for game time
+import pygame  # type: ignore
+
+# Constants: Clock Settings
+CLOCK_MODES = ("real", "manual")
+FRAME_MS = 1000 / 60
+
+# Game Clock: Millisecond game time sampled once per tick and shared by every timer
+# "real" follows pygame's ticks, "manual" only moves when advance() is called; both run at time_scale
+class GameClock:
+    def __init__(self, mode="real", time_scale=1.0, frame_ms=FRAME_MS, source=pygame.time.get_ticks):
+        if mode not in CLOCK_MODES:
+            raise ValueError(f"Unknown clock mode: {mode}")
+        self.mode = mode
+        self.time_scale = time_scale
+        self.frame_ms = frame_ms
+        self.source = source
+        self.base_ms = 0.0
+        self.source_base = source() if mode == "real" else 0
+        self.frames = 0
+        self.now = 0
+        self.sample()
+
+    # Exact Time: Game time in fractional milliseconds since the last rebase
+    def _elapsed(self):
+        if self.mode == "real":
+            return (self.source() - self.source_base) * self.time_scale
+        return self.frames * self.frame_ms * self.time_scale
+
+    # Tick: Reads the time source once and stores it in now for the rest of the tick
+    def sample(self):
+        self.now = int(self.base_ms + self._elapsed())
+        return self.now
+
+    # Manual Mode: Moves game time forward by whole frames
+    def advance(self, frames=1):
+        self.frames += frames
+        return self.sample()
+
+    # Manual Mode: Jumps to an exact game time, as when replaying recorded ticks
+    def set_time(self, ms):
+        self.base_ms = ms
+        self.source_base = self.source() if self.mode == "real" else 0
+        self.frames = 0
+        self.now = int(ms)
+
+    # Time Scale: Changes the speed of game time from now on without jumping the current time
+    def set_time_scale(self, time_scale):
+        self.base_ms += self._elapsed()
+        self.source_base = self.source() if self.mode == "real" else 0
+        self.frames = 0
+        self.time_scale = time_scale
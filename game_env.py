@@ -0,0 +1,165 @@
+# Loads modules for the agent environment
+import argparse
+import random
+import sys
+import time
+
+from game_log import logger
+from headless import HeadlessEngine
+from platformer import PLAYER_HEIGHT
+
+# Constants: Actions, a bit mask of the inputs the main loop handles
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+ACTION_JUMP = 4
+ACTION_INTERACT = 8
+ACTION_COUNT = 16
+
+# Constants: Observation Layout
+NEARBY_PLATFORMS = 6
+NEARBY_ENEMIES = 4
+OBSERVE_RANGE = 800
+PLAYER_FEATURES = 9
+OBSERVATION_SIZE = PLAYER_FEATURES + 4 * NEARBY_PLATFORMS + 4 * NEARBY_ENEMIES
+
+# Constants: Rewards and Episode Length
+WIN_REWARD = 1.0
+DEATH_REWARD = -1.0
+STEP_REWARD = 0.0
+MAX_EPISODE_STEPS = 20000
+
+# Nearest Rects: Up to count rects closest to x, as (dx, dy, width, height) relative to the player, zero padded
+def nearest_rects(rects, x, y, count):
+    nearest = sorted(rects, key=lambda rect: abs(rect.centerx - x))[:count]
+    features = []
+    for rect in nearest:
+        features += (rect.x - x, rect.y - y, rect.width, rect.height)
+    features += [0] * (4 * (count - len(nearest)))
+    return features
+
+# Game Environment: reset()/step(action) over one headless game, in the style of a gym environment
+# Observations are flat lists of OBSERVATION_SIZE numbers:
+# player x, y, x velocity, y velocity, is_jumping, is_blaster_acquired, blaster visible, blaster dx, dy,
+# then the nearest platforms and enemies as (dx, dy, width, height)
+class GameEnv:
+    def __init__(self, level=1, max_steps=MAX_EPISODE_STEPS):
+        self.level = level
+        self.max_steps = max_steps
+        self.engine = HeadlessEngine(level)
+        self.last_x = self.engine.state.player_x
+
+    # Observation: The player's state and what is around it
+    def observe(self):
+        state = self.engine.state
+        x = state.player_x
+        y = state.player_y
+        blaster = state.blaster
+        observation = [
+            x, y, x - self.last_x, state.player_velocity_y, int(state.is_jumping), int(state.is_blaster_acquired),
+            int(blaster is not None), blaster.rect.x - x if blaster else 0, blaster.rect.y - y if blaster else 0
+        ]
+        platforms = state.platforms
+        nearby = [platforms[i].rect for i in state.platform_grid.query(x - OBSERVE_RANGE, x + OBSERVE_RANGE)]
+        observation += nearest_rects(nearby, x, y, NEARBY_PLATFORMS)
+        observation += nearest_rects([enemy.rect for enemy in state.enemies], x, y, NEARBY_ENEMIES)
+        return observation
+
+    def info(self):
+        return {"status": self.engine.status(), "ticks": self.engine.tick_count, "level": self.engine.state.current_level}
+
+    # Reset: Restarts the level at game time zero; the game is deterministic so seed is accepted and unused
+    def reset(self, seed=None, options=None):
+        if options and "level" in options:
+            self.level = options["level"]
+        self.engine.clock.set_time(0)
+        self.engine.reset(self.level)
+        self.last_x = self.engine.state.player_x
+        return self.observe(), self.info()
+
+    # Step: Applies one action for one tick and returns (observation, reward, terminated, truncated, info)
+    def step(self, action):
+        self.last_x = self.engine.state.player_x
+        status = self.engine.step(bool(action & ACTION_LEFT), bool(action & ACTION_RIGHT), bool(action & ACTION_JUMP), bool(action & ACTION_INTERACT))
+        reward = WIN_REWARD if status == "won" else DEATH_REWARD if status == "died" else STEP_REWARD
+        terminated = status != "running"
+        truncated = not terminated and self.engine.tick_count >= self.max_steps
+        return self.observe(), reward, terminated, truncated, self.info()
+
+    def close(self):
+        self.engine.close()
+
+# Vector Environment: Steps K game environments in lockstep, resetting each one as soon as its episode ends
+# A finished environment's last observation and info are kept in its info as final_observation and final_info
+class VectorGameEnv:
+    def __init__(self, num_envs, level=1, max_steps=MAX_EPISODE_STEPS):
+        self.num_envs = num_envs
+        self.envs = [GameEnv(level, max_steps) for _ in range(num_envs)]
+
+    # Reset: Restarts every environment and returns (observations, infos)
+    def reset(self, seed=None, options=None):
+        results = [env.reset(seed, options) for env in self.envs]
+        return [observation for observation, _ in results], [info for _, info in results]
+
+    # Step: One action per environment, returns lists of observations, rewards, terminated, truncated and infos
+    def step(self, actions):
+        observations = []
+        rewards = []
+        terminated = []
+        truncated = []
+        infos = []
+        for env, action in zip(self.envs, actions):
+            observation, reward, done, cut, info = env.step(action)
+            if done or cut:
+                info = {"final_observation": observation, "final_info": info}
+                observation, reset_info = env.reset()
+                info.update(reset_info)
+            observations.append(observation)
+            rewards.append(reward)
+            terminated.append(done)
+            truncated.append(cut)
+            infos.append(info)
+        return observations, rewards, terminated, truncated, infos
+
+    def close(self):
+        for env in self.envs:
+            env.close()
+
+# Reset Check: Picks up the blaster, resets, and returns True when the new episode has the blaster back
+def check_reset_after_pickup(env):
+    env.reset()
+    state = env.engine.state
+    state.player_x = state.blaster.rect.x
+    state.player_y = state.blaster.rect.bottom - PLAYER_HEIGHT
+    env.step(ACTION_INTERACT)
+    observation, _, _, _, _ = env.step(ACTION_INTERACT)
+    picked_up = observation[5] == 1 and observation[6] == 0
+    observation, _ = env.reset()
+    return picked_up and observation[5] == 0 and observation[6] == 1
+
+# Command Line: Checks resets restore the level, then reports vector environment steps per second with random actions
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the game environments")
+    parser.add_argument("--envs", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--log-level", default="ERROR")
+    args = parser.parse_args()
+    logger.set_level(args.log_level)
+
+    env = GameEnv()
+    reset_ok = check_reset_after_pickup(env)
+    env.close()
+    print(f"Reset after blaster pickup: {'ok' if reset_ok else 'BLASTER MISSING'}")
+
+    rnd = random.Random(0)
+    vector_env = VectorGameEnv(args.envs)
+    vector_env.reset()
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        vector_env.step([rnd.randrange(ACTION_COUNT) for _ in range(args.envs)])
+    elapsed = time.perf_counter() - start
+    vector_env.close()
+    print(f"{args.envs * args.steps} steps in {elapsed:.3f}s ({args.envs * args.steps / elapsed:.0f} steps/s)")
+    return 0 if reset_ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
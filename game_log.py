@@ -0,0 +1,144 @@
+# Loads modules for game logging
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+
+# Constants: Log Levels
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LOG_RING_SIZE = 1024
+
+# Log Level: Accepts a level number or a name such as "info"
+def parse_level(level):
+    if isinstance(level, int):
+        return level
+    for number, name in LEVEL_NAMES.items():
+        if name == str(level).upper():
+            return number
+    raise ValueError(f"Unknown log level: {level}")
+
+# Log Record: Formats a (time, level, message, args) record; args are applied with % only here
+def format_record(record):
+    created, level, message, args = record
+    text = message % args if args else message
+    return f"{time.strftime('%H:%M:%S', time.localtime(created))}.{int(created % 1 * 1000):03d} {LEVEL_NAMES.get(level, level)}: {text}"
+
+# Disabled Level: Stands in for debug/info/... below the logger's level so those calls do no work
+def _discard(message, *args):
+    pass
+
+# File Sink: Appends formatted records to a file on a background thread so slow disks never stall a frame
+class FileSink:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "a", encoding="utf-8")
+        self.pending = deque()
+        self.condition = threading.Condition()
+        self.is_closed = False
+        self.thread = threading.Thread(target=self._run, name="LogSink", daemon=True)
+        self.thread.start()
+
+    def write(self, record):
+        with self.condition:
+            self.pending.append(record)
+            self.condition.notify()
+
+    # Close: Writes every pending record and closes the file
+    def close(self):
+        with self.condition:
+            self.is_closed = True
+            self.condition.notify()
+        self.thread.join()
+        self.file.close()
+
+    # Sink Thread: Drains pending records in batches
+    def _run(self):
+        while True:
+            with self.condition:
+                while not (self.pending or self.is_closed):
+                    self.condition.wait()
+                records, self.pending = self.pending, deque()
+                is_closed = self.is_closed
+            if records:
+                self.file.write("".join(format_record(record) + "\n" for record in records))
+                self.file.flush()
+            if is_closed and not records:
+                break
+
+# Game Logger: Leveled logging with lazy %-formatting, a ring buffer of recent records and optional sinks
+# Records below the level are dropped before formatting; disabled level methods are swapped for a no-op
+class GameLogger:
+    def __init__(self, level=INFO, console=True, ring_size=LOG_RING_SIZE):
+        self.console = console
+        self.ring = deque(maxlen=ring_size)
+        self.sink = None
+        self.previous_excepthook = None
+        self.set_level(level)
+
+    # Level: Rebinds debug/info/warning/error so disabled levels cost a single no-op call
+    def set_level(self, level):
+        self.level = parse_level(level)
+        self.debug = self._emitter(DEBUG)
+        self.info = self._emitter(INFO)
+        self.warning = self._emitter(WARNING)
+        self.error = self._emitter(ERROR)
+
+    def _emitter(self, level):
+        if level < self.level:
+            return _discard
+        return lambda message, *args: self._emit(level, message, args)
+
+    def is_enabled(self, level):
+        return level >= self.level
+
+    def log(self, level, message, *args):
+        if level >= self.level:
+            self._emit(level, message, args)
+
+    # Emit: Keeps the record in the ring buffer and hands it to the console and file sink
+    def _emit(self, level, message, args):
+        record = (time.time(), level, message, args)
+        self.ring.append(record)
+        if self.console:
+            print(message % args if args else message)
+        if self.sink is not None:
+            self.sink.write(record)
+
+    # File Sink: Starts writing records to a file in the background, replacing any previous sink
+    def open_file_sink(self, path):
+        self.close_file_sink()
+        self.sink = FileSink(path)
+        atexit.register(self.close_file_sink)
+
+    def close_file_sink(self):
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+
+    # Ring Buffer: Writes the most recent records to a stream, oldest first
+    def dump(self, stream=None):
+        stream = stream or sys.stderr
+        stream.write(f"--- last {len(self.ring)} log records ---\n")
+        for record in list(self.ring):
+            stream.write(format_record(record) + "\n")
+        stream.flush()
+
+    # Crash Dump: Dumps the ring buffer before any uncaught exception is reported
+    def install_crash_dump(self):
+        if self.previous_excepthook is not None:
+            return
+        self.previous_excepthook = sys.excepthook
+
+        def excepthook(exc_type, exc_value, traceback):
+            self.dump()
+            self.close_file_sink()
+            self.previous_excepthook(exc_type, exc_value, traceback)
+        sys.excepthook = excepthook
+
+# Shared Logger: Used by the game, save stores and save writer
+logger = GameLogger()
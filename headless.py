@@ -0,0 +1,111 @@
+# Loads modules for headless simulation
+import argparse
+import random
+import sys
+import time
+
+import pygame  # type: ignore
+
+import platformer
+from game_clock import GameClock
+from game_log import logger
+from input_replay import load_recording
+
+# Constants: Simulation Settings
+SIM_FPS = 60
+SIM_TICK_MS = 1000 / SIM_FPS
+
+# Headless Engine: Steps the game's own gameplay code without a window or frame cap
+# Each engine owns a GameState with its own clock and in-memory save, so several can run per process
+class HeadlessEngine:
+    def __init__(self, level=1, db_file=":memory:", enemy_arrays=platformer.ENEMY_ARRAYS):
+        self.tick_count = 0
+        self.clock = GameClock(mode="manual", frame_ms=SIM_TICK_MS)
+        self.state = platformer.GameState(platformer.CheckpointManager(db_file, backend="memory"), self.clock, level, enemy_arrays)
+        self.reset(level)
+
+    # Restarts the level from its first checkpoint and counts ticks from zero
+    def reset(self, level=1):
+        self.tick_count = 0
+        self.state.reset(full_reset=True, level=level)
+
+    # Advances one tick using the same input order as the main loop: key presses, then held keys
+    def step(self, move_left=False, move_right=False, jump=False, interact=False):
+        keys = []
+        if interact:
+            keys.append(pygame.K_e)
+        if jump:
+            keys.append(pygame.K_SPACE)
+        self.state.step(move_left, move_right, keys)
+        self.tick_count += 1
+        self.clock.advance()
+        return self.status()
+
+    # Reports whether the run is still going, lost or won
+    def status(self):
+        return self.state.status()
+
+    # Runs a policy(engine) -> (move_left, move_right, jump, interact) until the run ends
+    def run(self, policy, max_ticks):
+        result = self.status()
+        while self.tick_count < max_ticks and result == "running":
+            result = self.step(*policy(self))
+        return result
+
+    # Replays recorded segments at full speed, returning (segment, end state) pairs
+    def replay(self, segments):
+        return [(segment, self.state.replay_segment(segment)) for segment in segments]
+
+    # Closes the checkpoint store
+    def close(self):
+        self.state.checkpoint_manager.close()
+
+# Default Policy: Runs right and jumps whenever grounded
+def run_right_policy(engine):
+    return False, True, not engine.state.is_jumping, False
+
+# Random Policy: Seeded random inputs biased to the right
+def random_policy(seed):
+    rnd = random.Random(seed)
+    return lambda engine: (rnd.random() < 0.15, rnd.random() < 0.8, rnd.random() < 0.1, rnd.random() < 0.05)
+
+# Command Line: Replays each recording and reports whether every segment ends where it did when recorded
+def replay_files(paths):
+    engine = HeadlessEngine()
+    mismatches = 0
+    for path in paths:
+        start = time.perf_counter()
+        results = engine.replay(load_recording(path))
+        elapsed = time.perf_counter() - start
+        ticks = sum(len(segment.frames) for segment, _ in results)
+        failed = [i for i, (segment, end_state) in enumerate(results) if end_state != segment.end]
+        mismatches += len(failed)
+        status = f"MISMATCH in segments {failed}" if failed else "ok"
+        print(f"{path}: {status} ({len(results)} segments, {ticks} ticks in {elapsed:.3f}s)")
+    engine.close()
+    return 1 if mismatches else 0
+
+# Command Line: Runs headless ticks and reports throughput
+def main():
+    parser = argparse.ArgumentParser(description="Run Among The Asteroids without a window")
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--enemy-arrays", action="store_true", help="simulate enemies with the NumPy array system")
+    parser.add_argument("--replay", nargs="+", metavar="FILE", help="replay recordings and check their end states")
+    args = parser.parse_args()
+    logger.set_level(args.log_level)
+    if args.replay:
+        sys.exit(replay_files(args.replay))
+
+    engine = HeadlessEngine(level=args.level, enemy_arrays=args.enemy_arrays)
+    start = time.perf_counter()
+    result = engine.run(run_right_policy, args.ticks)
+    elapsed = time.perf_counter() - start
+    engine.close()
+    rate = engine.tick_count / elapsed if elapsed > 0 else float("inf")
+    print(f"Result: {result} after {engine.tick_count} ticks at x={engine.state.player_x}")
+    print(f"Simulated {engine.tick_count} ticks in {elapsed:.3f}s ({rate:.0f} ticks/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Loads modules for input recording and replay
+import json
+import struct
+import zlib
+
+import pygame  # type: ignore
+
+# Constants: Replay Format
+REPLAY_MAGIC = b"ATAREPLAY"
+REPLAY_VERSION = 1
+REPLAY_KEYS = (pygame.K_SPACE, pygame.K_e, pygame.K_p)
+HELD_LEFT = 1
+HELD_RIGHT = 2
+FRAME_UPDATED = 4
+FRAME_STRUCT = struct.Struct("<IBB")
+COUNT_STRUCT = struct.Struct("<I")
+
+# Replay Segment: The game state captured before one GameState.reset call and the frames played after it
+# Each frame is (game time, flags, key codes) where key codes index REPLAY_KEYS in press order
+class ReplaySegment:
+    def __init__(self, header, frames=None, end=None):
+        self.header = header
+        self.frames = frames if frames is not None else []
+        self.end = end
+
+# Input Recorder: Collects key presses and held A/D state per tick into replay segments
+class InputRecorder:
+    def __init__(self):
+        self.segments = []
+        self.pending_keys = []
+
+    # Segment: Closes the open segment with its end state and starts a new one from the header's time
+    def start_segment(self, header, end_state):
+        self.close_segment(end_state, header["now"])
+        self.segments.append(ReplaySegment(header))
+
+    # Segment: Keeps keys pressed earlier in this tick as a frame without a gameplay update
+    def close_segment(self, end_state, now):
+        if not self.segments or self.segments[-1].end is not None:
+            return
+        segment = self.segments[-1]
+        if self.pending_keys:
+            segment.frames.append((now, 0, tuple(self.pending_keys)))
+            self.pending_keys = []
+        segment.end = end_state
+
+    # Frame: Remembers a gameplay key press until the tick ends
+    def record_key(self, key):
+        if self.segments and key in REPLAY_KEYS:
+            self.pending_keys.append(REPLAY_KEYS.index(key))
+
+    # Frame: Stores the tick when a key was pressed or gameplay was updated
+    def end_frame(self, now, move_left, move_right, updated):
+        if not self.segments or self.segments[-1].end is not None:
+            self.pending_keys = []
+            return
+        flags = (HELD_LEFT if move_left else 0) | (HELD_RIGHT if move_right else 0) | (FRAME_UPDATED if updated else 0)
+        if updated or self.pending_keys:
+            self.segments[-1].frames.append((now, flags, tuple(self.pending_keys)))
+        self.pending_keys = []
+
+    # File: Writes every segment that has frames
+    def save(self, path):
+        save_recording(path, [segment for segment in self.segments if segment.frames])
+
+# File: zlib-compressed magic, version and segments; each segment is a JSON header/end followed by packed frames
+def save_recording(path, segments):
+    chunks = [REPLAY_MAGIC, COUNT_STRUCT.pack(REPLAY_VERSION), COUNT_STRUCT.pack(len(segments))]
+    for segment in segments:
+        meta = json.dumps({"header": segment.header, "end": segment.end}).encode()
+        chunks.append(COUNT_STRUCT.pack(len(meta)))
+        chunks.append(meta)
+        chunks.append(COUNT_STRUCT.pack(len(segment.frames)))
+        for now, flags, keys in segment.frames:
+            chunks.append(FRAME_STRUCT.pack(now, flags, len(keys)))
+            chunks.append(bytes(keys))
+    with open(path, "wb") as f:
+        f.write(zlib.compress(b"".join(chunks)))
+
+# File: Reads the segments written by save_recording
+def load_recording(path):
+    with open(path, "rb") as f:
+        data = zlib.decompress(f.read())
+    if not data.startswith(REPLAY_MAGIC):
+        raise ValueError(f"Not a replay file: {path}")
+    offset = len(REPLAY_MAGIC)
+    version, = COUNT_STRUCT.unpack_from(data, offset)
+    if version != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version {version} in {path}")
+    count, = COUNT_STRUCT.unpack_from(data, offset + 4)
+    offset += 8
+    segments = []
+    for _ in range(count):
+        meta_length, = COUNT_STRUCT.unpack_from(data, offset)
+        meta = json.loads(data[offset + 4:offset + 4 + meta_length])
+        offset += 4 + meta_length
+        frame_count, = COUNT_STRUCT.unpack_from(data, offset)
+        offset += 4
+        frames = []
+        for _ in range(frame_count):
+            now, flags, key_count = FRAME_STRUCT.unpack_from(data, offset)
+            offset += FRAME_STRUCT.size
+            frames.append((now, flags, tuple(data[offset:offset + key_count])))
+            offset += key_count
+        segments.append(ReplaySegment(meta["header"], frames, meta["end"]))
+    return segments
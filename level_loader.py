@@ -0,0 +1,135 @@
+# Loads modules for level files
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+
+from game_log import logger
+
+# Constants: Level File Settings
+LEVEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+LEVEL_CACHE_DIR = os.path.join(LEVEL_DIR, "cache")
+LEVEL_CACHE_MAGIC = b"ATALEVEL"
+LEVEL_CACHE_VERSION = 2
+LENGTH_STRUCT = struct.Struct("<I")
+PLATFORM_FIELDS = 4
+ENEMY_FIELDS = 5
+
+def level_path(directory, number):
+    return os.path.join(directory, f"level{number}.json")
+
+# Compile Level: Validates level JSON and packs platforms and enemies into flat int arrays
+# Platforms are (x, y, width, height) and enemies (x, y, width, height, speed), in file order
+def compile_level(source, name="level"):
+    data = json.loads(source)
+    for key in ("platforms", "breakable_index", "enemies", "blaster", "hints", "checkpoints"):
+        if key not in data:
+            raise ValueError(f"{name} is missing '{key}'")
+    platforms = array("i")
+    for platform in data["platforms"]:
+        if len(platform) != PLATFORM_FIELDS:
+            raise ValueError(f"{name} has a platform without x, y, width and height: {platform}")
+        platforms.extend(platform)
+    enemies = array("i")
+    for enemy in data["enemies"]:
+        if len(enemy) != ENEMY_FIELDS:
+            raise ValueError(f"{name} has an enemy without x, y, width, height and speed: {enemy}")
+        enemies.extend(enemy)
+    return {
+        "platforms": platforms,
+        "breakable_index": data["breakable_index"],
+        "enemies": enemies,
+        "blaster": data["blaster"],
+        "hints": data["hints"],
+        "checkpoints": data["checkpoints"]
+    }
+
+# Level Cache: Header, then the length-prefixed JSON metadata, then the raw platform and enemy int arrays
+# Nothing in the file is executed when read; anything that fails to decode is treated as a stale cache
+def read_level_cache(path, digest):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        header = LEVEL_CACHE_MAGIC + bytes([LEVEL_CACHE_VERSION]) + digest
+        if not data.startswith(header):
+            return None
+        offset = len(header)
+        meta_length, = LENGTH_STRUCT.unpack_from(data, offset)
+        offset += LENGTH_STRUCT.size
+        meta = json.loads(data[offset:offset + meta_length])
+        offset += meta_length
+        if meta["itemsize"] != array("i").itemsize or meta["byteorder"] != sys.byteorder:
+            return None
+        compiled = {}
+        for key in ("platforms", "enemies"):
+            values = array("i")
+            size = meta[key] * values.itemsize
+            values.frombytes(data[offset:offset + size])
+            if len(values) != meta[key]:
+                return None
+            compiled[key] = values
+            offset += size
+        for key in ("breakable_index", "blaster", "hints", "checkpoints"):
+            compiled[key] = meta[key]
+        return compiled
+    except (OSError, ValueError, KeyError, TypeError, struct.error):
+        return None
+
+def write_level_cache(path, digest, compiled):
+    meta = {key: compiled[key] for key in ("breakable_index", "blaster", "hints", "checkpoints")}
+    meta.update(platforms=len(compiled["platforms"]), enemies=len(compiled["enemies"]),
+                itemsize=compiled["platforms"].itemsize, byteorder=sys.byteorder)
+    meta = json.dumps(meta, separators=(",", ":")).encode()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(LEVEL_CACHE_MAGIC + bytes([LEVEL_CACHE_VERSION]) + digest)
+            f.write(LENGTH_STRUCT.pack(len(meta)))
+            f.write(meta)
+            f.write(compiled["platforms"].tobytes())
+            f.write(compiled["enemies"].tobytes())
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning("Could not write level cache %s: %s", path, e)
+
+# Load Level: Reads a level file, using the compiled cache when its source hash still matches
+def load_compiled_level(number, directory=LEVEL_DIR, cache_dir=LEVEL_CACHE_DIR):
+    path = level_path(directory, number)
+    with open(path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source).digest()
+    cache_path = os.path.join(cache_dir, f"level{number}.bin")
+    compiled = read_level_cache(cache_path, digest)
+    if compiled is not None:
+        logger.debug("Loaded level %s from cache %s", number, cache_path)
+        return compiled
+    compiled = compile_level(source, path)
+    write_level_cache(cache_path, digest, compiled)
+    logger.info("Compiled level %s from %s", number, path)
+    return compiled
+
+# Level Library: Dict-like view of the level files, building each level's objects on first use
+# Levels added with [] assignment, such as generated test levels, take precedence over files
+class LevelLibrary:
+    def __init__(self, build, directory=LEVEL_DIR, cache_dir=LEVEL_CACHE_DIR):
+        self.build = build
+        self.directory = directory
+        self.cache_dir = cache_dir
+        self.levels = {}
+
+    def __contains__(self, number):
+        return number in self.levels or (isinstance(number, int) and os.path.exists(level_path(self.directory, number)))
+
+    def __getitem__(self, number):
+        level = self.levels.get(number)
+        if level is None:
+            if number not in self:
+                raise KeyError(number)
+            level = self.levels[number] = self.build(load_compiled_level(number, self.directory, self.cache_dir))
+        return level
+
+    def __setitem__(self, number, level):
+        self.levels[number] = level
@@ -1,14 +1,29 @@
 # Loads modules for game functionality
 import pygame  # type: ignore
 import sys
-import sqlite3
 import os
+from contextlib import contextmanager
+
+from checkpoint_registry import Checkpoint, CheckpointRegistry
+from dirty_rects import REPAINT_EVENTS, DirtyRectTracker
+from enemy_arrays import EnemyArrays
+from frame_profiler import FrameProfiler
+from game_clock import GameClock
+from game_log import DEBUG, logger
+from input_replay import FRAME_UPDATED, HELD_LEFT, HELD_RIGHT, REPLAY_KEYS, InputRecorder
+from level_loader import LevelLibrary
+from render_cache import OverlayCache, StaticLayerCache, TextCache
+from save_stores import SAVE_STORE_ERRORS, MemorySaveStore, create_save_store
+from save_writer import SaveWriter
+from spatial import GroundSpans, PlatformGrid
 
 # Constants: Game Settings
 WIDTH = 800
 HEIGHT = 600
 WORLD_WIDTH = 5600
 HOLE_LEFT = 800
+DIRTY_RECT_RENDERING = False
+ENEMY_ARRAYS = False
 
 # Constants: Player Build
 PLAYER_WIDTH = 40
@@ -48,6 +63,30 @@ MENU_BUTTON_SPACING = 20
 CONFIRM_BUTTON_SIZE = (150, 50)
 NEW_GAME_BUTTON_SIZE = (300, 50)
 SAVE_FILE = "game_save.db"
+SAVE_WRITE_BEHIND = True
+SAVE_BACKEND = "sqlite"
+SAVE_BACKEND_OPTIONS = {
+    "sqlite": {"journal_mode": "WAL", "synchronous": "NORMAL"},
+    "log": {"fsync": False}
+}
+LOG_LEVEL = "INFO"
+LOG_CONSOLE = True
+LOG_FILE = None
+FRAME_PROFILING = False
+FRAME_PROFILE_FILE = None
+GAME_TIME_SCALE = 1.0
+RECORD_INPUT_FILE = None
+REPLAY_FIELDS = (
+    "current_level", "is_blaster_acquired", "jump_hint_shown", "alien_hint_shown", "interact_hint_shown",
+    "start_timer", "end_timer", "paused_time", "last_pause_start"
+)
+
+# Constants: Default Checkpoints as (id, x, y, width, height, reached, player_x, player_y)
+DEFAULT_CHECKPOINTS = (
+    ("1.0", 100, HEIGHT - 40 - PLAYER_HEIGHT, 20, 30, True, 100, HEIGHT - 40 - PLAYER_HEIGHT),
+    ("1.1", 2990, 370, 20, 30, False, 2990, 370),
+    ("2.0", 150, HEIGHT - 40 - PLAYER_HEIGHT, 20, 30, False, 150, HEIGHT - 40 - PLAYER_HEIGHT)
+)
 
 # Constants: Level 1 Story Text
 FIRST_MESSAGE = (
@@ -65,21 +104,69 @@ FOURTH_MESSAGE = (
     "I need to move, find my crewmates and then we can all, hopefully, get back home."
 )
 
-# Pygame Setup: Initializes game window and clock
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("AMONG THE ASTEROIDS")
-clock = pygame.time.Clock()
-
-# Font Setup: Defines fonts for text rendering
-font = pygame.font.Font(None, 74)
-speech_font = pygame.font.Font(None, 30)
-button_font = pygame.font.Font(None, 40)
-message_font = pygame.font.Font(None, 36)
-timer_font = pygame.font.Font(None, 30)
+# Pygame Setup: Initializes game window, clock and fonts
+def init_display():
+    global screen, clock, font, speech_font, button_font, message_font, timer_font, profiler_font
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("AMONG THE ASTEROIDS")
+    clock = pygame.time.Clock()
+
+    # Font Setup: Defines fonts for text rendering
+    font = pygame.font.Font(None, 74)
+    speech_font = pygame.font.Font(None, 30)
+    button_font = pygame.font.Font(None, 40)
+    message_font = pygame.font.Font(None, 36)
+    timer_font = pygame.font.Font(None, 30)
+    profiler_font = pygame.font.Font(None, 22)
+
+# Text Cache: Shared by every text render path
+text_cache = TextCache()
+
+# Frame Profiler: Per-phase frame timings, F3 toggles the overlay beside the timer
+frame_profiler = FrameProfiler(enabled=FRAME_PROFILING)
+
+# Overlay Cache: Shared by the pause and confirm dialogs
+overlay_cache = OverlayCache()
+
+# Dirty Rects: Tracks screen regions changed since the last frame when DIRTY_RECT_RENDERING is on
+dirty_tracker = DirtyRectTracker()
+
+# Draw Helpers: Draw to the screen and record the draw for dirty-rect rendering
+def fill_screen(color):
+    screen.fill(color)
+    if DIRTY_RECT_RENDERING:
+        dirty_tracker.record(("fill", color, tuple(screen.get_rect())))
+
+def draw_rect(color, rect, width=0):
+    drawn_rect = pygame.draw.rect(screen, color, rect, width)
+    if DIRTY_RECT_RENDERING:
+        dirty_tracker.record(("rect", color, width, tuple(drawn_rect)))
+    return drawn_rect
+
+def blit_surface(surface, dest):
+    drawn_rect = screen.blit(surface, dest)
+    if DIRTY_RECT_RENDERING:
+        dirty_tracker.record(("blit", surface, surface.get_alpha(), tuple(drawn_rect)))
+    return drawn_rect
+
+# Present Frame: Pushes only changed regions in dirty-rect mode, otherwise flips the whole screen
+# The first frame and frames after the window was exposed or restored are flipped in full
+def present_frame():
+    if not DIRTY_RECT_RENDERING:
+        pygame.display.flip()
+        return
+    full_repaint = dirty_tracker.needs_full_repaint
+    rects = dirty_tracker.flush()
+    if full_repaint:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
 
 # Enemy Class: Defines enemy properties and behavior
 class Enemy:
+    __slots__ = ("rect", "base_speed", "current_speed", "origin_x", "is_chasing", "chase_start_time", "speed_increase_timer")
+
     def __init__(self, x, y, width, height, speed):
         self.rect = pygame.Rect(x, y, width, height)
         self.base_speed = speed
@@ -90,26 +177,26 @@ class Enemy:
         self.speed_increase_timer = 0
 
     # Enemy Movement: Makes enemies chase player
-    def update(self, player_x, player_width, platforms, camera_x):
-        if camera_x <= self.rect.x <= camera_x + WIDTH:
+    def update(self, player_x, player_width, ground_spans, camera_x, current_time):
+        rect = self.rect
+        x = rect.x
+        if camera_x <= x <= camera_x + WIDTH:
             player_center = player_x + player_width / 2
-            enemy_center = self.rect.x + self.rect.width / 2
-            current_time = pygame.time.get_ticks()
+            enemy_center = x + rect.width / 2
             is_trying_to_move = False
-            next_x = self.rect.x
 
             if player_center < enemy_center:
-                next_x = self.rect.x - self.current_speed
-                can_move = any(p.rect.y == HEIGHT - 40 and p.rect.left <= next_x <= p.rect.right for p in platforms)
+                next_x = x - self.current_speed
+                can_move = ground_spans.has_ground(next_x)
                 if can_move and next_x >= 0:
-                    self.rect.x = next_x
+                    x = next_x
                     is_trying_to_move = True
             elif player_center > enemy_center:
-                next_x = self.rect.x + self.current_speed
-                next_right = next_x + self.rect.width
-                can_move = any(p.rect.y == HEIGHT - 40 and p.rect.left <= next_right <= p.rect.right for p in platforms)
+                next_x = x + self.current_speed
+                next_right = next_x + rect.width
+                can_move = ground_spans.has_ground(next_right)
                 if can_move and next_right <= WORLD_WIDTH:
-                    self.rect.x = next_x
+                    x = next_x
                     is_trying_to_move = True
 
             if is_trying_to_move:
@@ -125,131 +212,92 @@ class Enemy:
                     self.is_chasing = False
                     self.current_speed = self.base_speed
 
-        self.rect.x = max(0, min(self.rect.x, WORLD_WIDTH - self.rect.width))
+        rect.x = max(0, min(x, WORLD_WIDTH - rect.width))
 
 # Platform Class: Defines platform properties
 class Platform:
+    __slots__ = ("rect",)
+
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
 
 # Interactable Class: Defines interactable objects
 class Interactable:
+    __slots__ = ("rect", "name")
+
     def __init__(self, x, y, width, height, name):
         self.rect = pygame.Rect(x, y, width, height)
         self.name = name
 
 # Checkpoint Manager Class
 class CheckpointManager:
-    def __init__(self, db_file=SAVE_FILE):
+    def __init__(self, db_file=SAVE_FILE, write_behind=False, backend=SAVE_BACKEND, store=None):
         self.db_file = db_file
-        self.conn = None
-        self.checkpoints = [
-            {"x": 100, "y": HEIGHT - 40 - PLAYER_HEIGHT, "width": 20, "height": 30, "reached": True, "id": "1.0", "player_x": 100, "player_y": HEIGHT - 40 - PLAYER_HEIGHT},
-            {"x": 2990, "y": 370, "width": 20, "height": 30, "reached": False, "id": "1.1", "player_x": 2990, "player_y": 370},
-            {"x": 150, "y": HEIGHT - 40 - PLAYER_HEIGHT, "width": 20, "height": 30, "reached": False, "id": "2.0", "player_x": 150, "player_y": HEIGHT - 40 - PLAYER_HEIGHT}
-        ]
+        self.store = None
+        self.writer = None
+        self.batch_depth = 0
+        self.batch_checkpoints = {}
+        self.batch_state = {}
+        self.checkpoints = [Checkpoint(*fields) for fields in DEFAULT_CHECKPOINTS]
         self.current_checkpoint_id = "1.0"
-        print(f"Initialized CheckpointManager with default checkpoint_id: {self.current_checkpoint_id}")
-        self._init_db()
+        self.is_blaster_acquired = False
+        logger.info("Initialized CheckpointManager with default checkpoint_id: %s", self.current_checkpoint_id)
+        self._init_db(backend, store)
         self._validate_checkpoints()
 
-    # Database Setup: Creates SQLite tables
-    def _init_db(self):
+        # Write-Behind: Only backends that can open a second connection get a writer thread
+        if write_behind and self.store is not None and self.store.supports_write_behind and db_file != ":memory:":
+            self.writer = SaveWriter(self.store)
+            logger.info("Started background save writer for %s", self.db_file)
+
+    # Database Setup: Opens the save store and adds the default checkpoints
+    def _init_db(self, backend, store):
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS checkpoints (
-                    id TEXT PRIMARY KEY,
-                    x INTEGER,
-                    y INTEGER,
-                    width INTEGER,
-                    height INTEGER,
-                    reached BOOLEAN,
-                    player_x INTEGER,
-                    player_y INTEGER
-                )
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS game_state (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """)
-            conn.commit()
-            for checkpoint in self.checkpoints:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO checkpoints (id, x, y, width, height, reached, player_x, player_y)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (checkpoint["id"], checkpoint["x"], checkpoint["y"], checkpoint["width"],
-                      checkpoint["height"], checkpoint["reached"], checkpoint["player_x"], checkpoint["player_y"]))
-            conn.commit()
-            print(f"Database initialized: {self.db_file}")
-        except sqlite3.Error as e:
-            print(f"Database initialization failed: {e}")
-
-    # Database Connection: Connects to SQLite database
-    def _get_connection(self):
-        if self.conn is None:
-            try:
-                self.conn = sqlite3.connect(self.db_file)
-                print(f"Opened SQLite connection to {self.db_file}")
-            except sqlite3.Error as e:
-                print(f"Failed to open SQLite connection: {e}")
-                raise
-        return self.conn
-
-    # Checkpoint: Removes duplicate IDs
+            self.store = store if store is not None else create_save_store(backend, self.db_file, **SAVE_BACKEND_OPTIONS.get(backend, {}))
+            self.store.insert_checkpoints(self.checkpoints, ignore_existing=True)
+            logger.info("Database initialized: %s", self.db_file)
+        except SAVE_STORE_ERRORS as e:
+            logger.error("Database initialization failed: %s", e)
+            if self.store is None:
+                self.store = MemorySaveStore(self.db_file)
+                logger.warning("Falling back to in-memory save store for %s", self.db_file)
+
+    # Checkpoint: Indexes checkpoints into a registry, removing duplicate IDs
     def _validate_checkpoints(self):
-        seen_ids = set()
-        unique_checkpoints = []
+        registry = CheckpointRegistry()
         for checkpoint in self.checkpoints:
-            if checkpoint["id"] not in seen_ids:
-                seen_ids.add(checkpoint["id"])
-                unique_checkpoints.append(checkpoint)
-            else:
-                print(f"Warning: Duplicate checkpoint ID {checkpoint['id']} found and removed")
-        self.checkpoints = unique_checkpoints
+            if not registry.add(checkpoint):
+                logger.warning("Duplicate checkpoint ID %s found and removed", checkpoint.id)
+        self.checkpoints = registry
 
     # Checkpoint: Retrieves checkpoint by ID
     def read_checkpoint(self, id):
         id = str(id)
-        for checkpoint in self.checkpoints:
-            if checkpoint["id"] == id:
-                return checkpoint
+        checkpoint = self.checkpoints.get(id)
+        if checkpoint is not None:
+            return checkpoint
+        self.flush()
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM checkpoints WHERE id = ?", (id,))
-            row = cursor.fetchone()
-            if row:
-                checkpoint = {
-                    "id": row[0], "x": row[1], "y": row[2], "width": row[3],
-                    "height": row[4], "reached": bool(row[5]), "player_x": row[6], "player_y": row[7]
-                }
-                self.checkpoints.append(checkpoint)
+            checkpoint = self.store.read_checkpoint(id)
+            if checkpoint:
+                self.checkpoints.add(checkpoint)
                 return checkpoint
-        except sqlite3.Error as e:
-            print(f"Failed to read checkpoint {id}: {e}")
+        except SAVE_STORE_ERRORS as e:
+            logger.error("Failed to read checkpoint %s: %s", id, e)
         return None
 
     # Checkpoint: Adds new checkpoint
     def create_checkpoint(self, x, y, width, height, id, player_x, player_y):
         id = str(id)
-        checkpoint = {"x": x, "y": y, "width": width, "height": height, "reached": False, "id": id, "player_x": player_x, "player_y": player_y}
+        checkpoint = Checkpoint(id, x, y, width, height, False, player_x, player_y)
+        self.flush()
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO checkpoints (id, x, y, width, height, reached, player_x, player_y)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (id, x, y, width, height, False, player_x, player_y))
-            conn.commit()
-            self.checkpoints.append(checkpoint)
-            print(f"Created checkpoint {id} at ({x}, {y})")
+            self.store.insert_checkpoints([checkpoint])
+            self.checkpoints.add(checkpoint)
+            logger.info("Created checkpoint %s at (%s, %s)", id, x, y)
             return True
-        except sqlite3.Error as e:
-            print(f"Failed to create checkpoint {id}: {e}")
+        except SAVE_STORE_ERRORS as e:
+            logger.error("Failed to create checkpoint %s: %s", id, e)
             return False
 
     # Checkpoint: Updates checkpoint status
@@ -258,243 +306,626 @@ class CheckpointManager:
         checkpoint = self.read_checkpoint(id)
         if checkpoint:
             try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                if reached:
-                    if player_x is not None and player_y is not None:
-                        cursor.execute("""
-                            UPDATE checkpoints
-                            SET reached = ?, player_x = ?, player_y = ?
-                            WHERE id = ?
-                        """, (reached, player_x, player_y, id))
-                        print(f"Updated checkpoint {id} with player position ({player_x}, {player_y})")
-                    else:
-                        cursor.execute("UPDATE checkpoints SET reached = ? WHERE id = ?", (reached, id))
-                        print(f"Updated checkpoint {id} reached status to {reached}")
-                conn.commit()
-                for cp in self.checkpoints:
-                    if cp["id"] == id:
-                        cp["reached"] = reached
-                        if reached and player_x is not None and player_y is not None:
-                            cp["player_x"] = player_x
-                            cp["player_y"] = player_y
-                        break
+                if reached and player_x is not None and player_y is not None:
+                    self._write_checkpoint(id, {"reached": reached, "player_x": player_x, "player_y": player_y})
+                    logger.debug("Updated checkpoint %s with player position (%s, %s)", id, player_x, player_y)
+                else:
+                    self._write_checkpoint(id, {"reached": reached})
+                    logger.debug("Updated checkpoint %s reached status to %s", id, reached)
+                self.checkpoints.set_reached(id, reached)
+                if reached and player_x is not None and player_y is not None:
+                    checkpoint.player_x = player_x
+                    checkpoint.player_y = player_y
                 if reached:
                     self.current_checkpoint_id = id
                     self.save_game()
-                    print(f"Set current_checkpoint_id to {id}")
+                    logger.debug("Set current_checkpoint_id to %s", id)
                 return True
-            except sqlite3.Error as e:
-                print(f"Failed to update checkpoint {id}: {e}")
+            except SAVE_STORE_ERRORS as e:
+                logger.error("Failed to update checkpoint %s: %s", id, e)
                 return False
-        print(f"Checkpoint {id} not found")
+        logger.warning("Checkpoint %s not found", id)
         return False
 
+    # Checkpoint: Writes checkpoint columns now, or holds them for the open transaction or background writer
+    def _write_checkpoint(self, id, columns):
+        if self.batch_depth > 0:
+            self.batch_checkpoints.setdefault(id, {}).update(columns)
+            return
+        if self.writer is not None:
+            self.writer.queue_checkpoint(id, columns)
+            return
+        self.store.write_batch({id: columns}, {})
+
+    # Transaction: Groups checkpoint updates and saves into one commit
+    @contextmanager
+    def transaction(self):
+        self.batch_depth += 1
+        try:
+            yield self
+        except Exception:
+            self.batch_depth -= 1
+            if self.batch_depth == 0:
+                self.batch_checkpoints = {}
+                self.batch_state = {}
+            raise
+        self.batch_depth -= 1
+        if self.batch_depth == 0:
+            self._commit_batch()
+
+    # Transaction: Writes every held update and save as a single commit
+    def _commit_batch(self):
+        checkpoints, self.batch_checkpoints = self.batch_checkpoints, {}
+        state, self.batch_state = self.batch_state, {}
+        if not (checkpoints or state):
+            return True
+        if self.writer is not None:
+            self.writer.queue_batch(checkpoints, state)
+            logger.debug("Queued batch of %s checkpoint updates", len(checkpoints))
+            return True
+        try:
+            self.store.write_batch(checkpoints, state)
+            logger.debug("Committed batch of %s checkpoint updates", len(checkpoints))
+            return True
+        except SAVE_STORE_ERRORS as e:
+            logger.error("Failed to commit checkpoint batch: %s", e)
+            return False
+
     # Checkpoint: Removes checkpoint
     def delete_checkpoint(self, id):
         id = str(id)
+        self.flush()
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM checkpoints WHERE id = ?", (id,))
-            conn.commit()
-            for i, checkpoint in enumerate(self.checkpoints):
-                if checkpoint["id"] == id:
-                    self.checkpoints.pop(i)
-                    if self.current_checkpoint_id == id:
-                        self.current_checkpoint_id = self.get_latest_checkpoint()
-                    print(f"Deleted checkpoint {id}, current_checkpoint_id set to {self.current_checkpoint_id}")
-                    return True
-            print(f"Checkpoint {id} not found for deletion")
+            self.store.delete_checkpoint(id)
+            if self.checkpoints.remove(id) is not None:
+                if self.current_checkpoint_id == id:
+                    self.current_checkpoint_id = self.get_latest_checkpoint()
+                logger.info("Deleted checkpoint %s, current_checkpoint_id set to %s", id, self.current_checkpoint_id)
+                return True
+            logger.warning("Checkpoint %s not found for deletion", id)
             return False
-        except sqlite3.Error as e:
-            print(f"Failed to delete checkpoint {id}: {e}")
+        except SAVE_STORE_ERRORS as e:
+            logger.error("Failed to delete checkpoint %s: %s", id, e)
             return False
 
     # Checkpoint: Finds most recent checkpoint
     def get_latest_checkpoint(self):
+        self.flush()
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM checkpoints WHERE reached = 1 ORDER BY id DESC LIMIT 1")
-            result = cursor.fetchone()
-            latest_id = result[0] if result else "1.0"
-            print(f"Latest checkpoint: {latest_id}")
+            latest_id = self.store.latest_reached_id() or "1.0"
+            logger.debug("Latest checkpoint: %s", latest_id)
             return latest_id
-        except sqlite3.Error as e:
-            print(f"Failed to get latest checkpoint: {e}")
+        except SAVE_STORE_ERRORS as e:
+            logger.error("Failed to get latest checkpoint: %s", e)
             return "1.0"
 
     # Saves game state
     def save_game(self):
-        global is_blaster_acquired
+        state = {"current_checkpoint_id": self.current_checkpoint_id, "is_blaster_acquired": str(self.is_blaster_acquired)}
+        if self.batch_depth > 0:
+            self.batch_state.update(state)
+            return True
+        if self.writer is not None:
+            self.writer.queue_batch({}, state)
+            logger.debug("Game save queued: current_checkpoint_id=%s, is_blaster_acquired=%s", self.current_checkpoint_id, self.is_blaster_acquired)
+            return True
         for attempt in range(3):
             try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("INSERT OR REPLACE INTO game_state (key, value) VALUES (?, ?)",
-                              ("current_checkpoint_id", self.current_checkpoint_id))
-                cursor.execute("INSERT OR REPLACE INTO game_state (key, value) VALUES (?, ?)",
-                              ("is_blaster_acquired", str(is_blaster_acquired)))
-                conn.commit()
-                print(f"Game saved: current_checkpoint_id={self.current_checkpoint_id}, is_blaster_acquired={is_blaster_acquired}")
+                self.store.write_batch({}, state)
+                logger.debug("Game saved: current_checkpoint_id=%s, is_blaster_acquired=%s", self.current_checkpoint_id, self.is_blaster_acquired)
                 return True
-            except sqlite3.Error as e:
-                print(f"Failed to save game (attempt {attempt + 1}/3): {e}")
+            except SAVE_STORE_ERRORS as e:
+                logger.error("Failed to save game (attempt %s/3): %s", attempt + 1, e)
                 if attempt < 2:
-                    print("Retrying save...")
+                    logger.warning("Retrying save...")
                     continue
                 return False
 
     # Loads saved game state
     def load_game(self):
-        global is_blaster_acquired
+        self.flush()
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM checkpoints")
-            self.checkpoints = [
-                {
-                    "id": row[0], "x": row[1], "y": row[2], "width": row[3],
-                    "height": row[4], "reached": bool(row[5]), "player_x": row[6], "player_y": row[7]
-                } for row in cursor.fetchall()
-            ]
-            print(f"Loaded checkpoints: {[cp['id'] for cp in self.checkpoints]}")
-            cursor.execute("SELECT value FROM game_state WHERE key = 'current_checkpoint_id'")
-            result = cursor.fetchone()
-            if result and self.read_checkpoint(result[0]):
-                self.current_checkpoint_id = result[0]
+            self.checkpoints = CheckpointRegistry(self.store.read_checkpoints())
+            if logger.is_enabled(DEBUG):
+                logger.debug("Loaded checkpoints: %s", [cp.id for cp in self.checkpoints])
+            saved_checkpoint_id = self.store.read_state("current_checkpoint_id")
+            if saved_checkpoint_id and self.read_checkpoint(saved_checkpoint_id):
+                self.current_checkpoint_id = saved_checkpoint_id
             else:
                 self.current_checkpoint_id = self.get_latest_checkpoint()
-                print(f"No valid current_checkpoint_id found, using latest: {self.current_checkpoint_id}")
-            cursor.execute("SELECT value FROM game_state WHERE key = 'is_blaster_acquired'")
-            result = cursor.fetchone()
-            is_blaster_acquired = result[0].lower() == 'true' if result else False
-            print(f"Loaded game: current_checkpoint_id={self.current_checkpoint_id}, is_blaster_acquired={is_blaster_acquired}")
+                logger.info("No valid current_checkpoint_id found, using latest: %s", self.current_checkpoint_id)
+            saved_blaster = self.store.read_state("is_blaster_acquired")
+            self.is_blaster_acquired = saved_blaster.lower() == 'true' if saved_blaster else False
+            logger.info("Loaded game: current_checkpoint_id=%s, is_blaster_acquired=%s", self.current_checkpoint_id, self.is_blaster_acquired)
             self._ensure_default_checkpoints()
             return True
-        except sqlite3.Error as e:
-            print(f"Failed to load save file: {e}")
+        except SAVE_STORE_ERRORS as e:
+            logger.error("Failed to load save file: %s", e)
             self.current_checkpoint_id = self.get_latest_checkpoint()
-            is_blaster_acquired = False
+            self.is_blaster_acquired = False
             self._ensure_default_checkpoints()
-            print(f"Load failed, using latest checkpoint: {self.current_checkpoint_id}")
+            logger.warning("Load failed, using latest checkpoint: %s", self.current_checkpoint_id)
             return False
 
-    #Checkpoints: Adds default checkpoints
-    def _ensure_default_checkpoints(self):
-        default_checkpoints = [
-            {"x": 100, "y": HEIGHT - 40 - PLAYER_HEIGHT, "width": 20, "height": 30, "reached": True, "id": "1.0", "player_x": 100, "player_y": HEIGHT - 40 - PLAYER_HEIGHT},
-            {"x": 2990, "y": 370, "width": 20, "height": 30, "reached": False, "id": "1.1", "player_x": 2990, "player_y": 370},
-            {"x": 150, "y": HEIGHT - 40 - PLAYER_HEIGHT, "width": 20, "height": 30, "reached": False, "id": "2.0", "player_x": 150, "player_y": HEIGHT - 40 - PLAYER_HEIGHT}
-        ]
-        for default in default_checkpoints:
-            if not self.read_checkpoint(default["id"]):
+    # Checkpoints: Creates any of a level file's checkpoints that the save does not have yet
+    def ensure_checkpoints(self, checkpoints):
+        for checkpoint in checkpoints:
+            if checkpoint.id not in self.checkpoints and not self.read_checkpoint(checkpoint.id):
                 self.create_checkpoint(
-                    default["x"], default["y"], default["width"], default["height"],
-                    default["id"], default["player_x"], default["player_y"]
+                    checkpoint.x, checkpoint.y, checkpoint.width, checkpoint.height,
+                    checkpoint.id, checkpoint.player_x, checkpoint.player_y
                 )
-                if default["reached"]:
-                    self.update_checkpoint(default["id"], reached=True)
-        print(f"Ensured default checkpoints: {', '.join(cp['id'] for cp in self.checkpoints)}")
 
-    # Close Database: Closes SQLite connection
+    #Checkpoints: Adds default checkpoints
+    def _ensure_default_checkpoints(self):
+        for id, x, y, width, height, reached, player_x, player_y in DEFAULT_CHECKPOINTS:
+            if not self.read_checkpoint(id):
+                self.create_checkpoint(x, y, width, height, id, player_x, player_y)
+                if reached:
+                    self.update_checkpoint(id, reached=True)
+        if logger.is_enabled(DEBUG):
+            logger.debug("Ensured default checkpoints: %s", ', '.join(cp.id for cp in self.checkpoints))
+
+    # Flush Saves: Waits for queued background writes to reach the store
+    def flush(self):
+        if self.writer is not None:
+            self.writer.flush()
+
+    # Close Database: Stops the background writer and closes the save store
     def close(self):
-        if self.conn is not None:
-            self.conn.close()
-            self.conn = None
-            print(f"Closed SQLite connection to {self.db_file}")
-
-# Platforms: Level 1
-initial_platforms_level1 = [
-    Platform(0, HEIGHT - 40, 800, 40),        # Index 0: Ground 
-    Platform(1200, HEIGHT - 40, 1200, 40),    # Index 1: Ground  
-    Platform(3500, HEIGHT - 40, 1800, 40),    # Index 2: Ground  
-    Platform(296, 400, 200, 20),              # Index 3: Floating  
-    Platform(850, 400, 200, 20),              # Index 4: Floating  
-    Platform(1400, 400, 200, 20),             # Index 5: Floating 
-    Platform(2000, 450, 200, 20),             # Index 6: Floating 
-    Platform(2300, 350, 200, 20),             # Index 7: Floating 
-    Platform(2600, 250, 200, 20),             # Index 8: Floating   
-    Platform(2900, 400, 200, 20),             # Index 9: Floating  
-    Platform(3200, 300, 200, 20),             # Index 10: Floating   
-    Platform(3600, 400, 200, 20),             # Index 11: Floating   
-    Platform(3900, 350, 200, 20),             # Index 12: Floating  
-    Platform(5400, 400, 200, 20),             # Index 13: Floating 
-    Platform(4650, 400, 200, 20)              # Index 14: Floating   
-]
-
-# Platforms: Level 2
-initial_platforms_level2 = [
-    Platform(100, HEIGHT - PLAYER_HEIGHT - 10, 50, 40),
-    Platform(300, 380, 50, 40),
-    Platform(500, 530, 50, 40),
-    Platform(700, 380, 50, 40),
-    Platform(900, 530, 50, 40),
-    Platform(1000, 380, 50, 40),
-    Platform(1100, 230, 50, 40),
-    Platform(1300, 380, 50, 40),
-    Platform(1500, 230, 50, 40),
-    Platform(1700, 180, 50, 40),
-    Platform(1900, 330, 50, 40),
-    Platform(2100, 400, 50, 40),
-    Platform(2300, 350, 50, 40),
-    Platform(2500, 450, 50, 40),
-    Platform(2700, 300, 50, 40),
-    Platform(2900, 400, 50, 40),
-]
-
-# Configiring level 1
-level_data = {
-    1: {
-        "platforms": initial_platforms_level1,
-        "breakable_index": 13,
-        "enemies": [
-            Enemy(1600, HEIGHT - 40 - 30, ENEMY_WIDTH, ENEMY_HEIGHT, ENEMY_SPEED),
-            Enemy(4000, HEIGHT - 40 - 30, ENEMY_WIDTH, ENEMY_HEIGHT, ENEMY_SPEED),
-            Enemy(4700, HEIGHT - 40 - 30, ENEMY_WIDTH, ENEMY_HEIGHT, ENEMY_SPEED)
-        ],
-        "blaster": Interactable(5450, 400 - 20, 20, 20, "Blaster"),
-        "hints": {
-            "jump": {"platform_index": 4, "message": "Press SPACE to jump", "y_offset": -30},
-            "gap": None,
-            "alien": {"platform_index": 6, "message": "Beware of the alien", "y_offset": 480},
-            "interact": {"position_x": 5500, "position_y": 370, "message": "Press E to interact"}
-        }
-    },
-
-    # Configiring level 2
-    2: {
-        "platforms": initial_platforms_level2,
-        "breakable_index": 0,
-        "enemies": [],
-        "blaster": None,
-        "hints": {
-            "jump": None,
-            "gap": None,
-            "alien": None,
-            "interact": None
-        }
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            logger.info("Stopped background save writer for %s", self.db_file)
+        if self.store is not None:
+            self.store.close()
+
+# Level Data: Builds a level's game objects from its compiled level file
+def build_level(compiled):
+    platform_data = compiled["platforms"]
+    enemy_data = compiled["enemies"]
+    blaster_data = compiled["blaster"]
+    return {
+        "platforms": [Platform(*platform_data[i:i + 4]) for i in range(0, len(platform_data), 4)],
+        "breakable_index": compiled["breakable_index"],
+        "enemies": [Enemy(*enemy_data[i:i + 5]) for i in range(0, len(enemy_data), 5)],
+        "blaster": Interactable(blaster_data["x"], blaster_data["y"], blaster_data["width"], blaster_data["height"], blaster_data["name"]) if blaster_data else None,
+        "hints": compiled["hints"],
+        "checkpoints": [Checkpoint(cp["id"], cp["x"], cp["y"], cp["width"], cp["height"], False, cp["player_x"], cp["player_y"]) for cp in compiled["checkpoints"]]
     }
-}
 
-# Initialize checkpoints and level objects
-checkpoint_manager = CheckpointManager(SAVE_FILE)
-platforms = level_data[1]["platforms"].copy()
-enemies = level_data[1]["enemies"].copy()
-blaster = level_data[1]["blaster"]
+# Levels: Loaded from levels/level<N>.json the first time each level is played
+level_data = LevelLibrary(build_level)
+
+# Game State: One game session's level objects, player, enemies, timers and checkpoint store
+# The window plays the module's game; headless runs create as many independent sessions as they need
+class GameState:
+    def __init__(self, checkpoint_manager=None, clock=None, level=1, enemy_arrays=ENEMY_ARRAYS):
+        self.checkpoint_manager = checkpoint_manager
+        self.clock = clock if clock is not None else GameClock(time_scale=GAME_TIME_SCALE)
+        self.recorder = None
+        self.enemy_arrays = enemy_arrays
+
+        # Initialize starting position and movement
+        self.player_x = 100
+        self.player_y = HEIGHT - PLAYER_HEIGHT - 10
+        self.player_velocity_y = 0
+        self.is_jumping = False
+        self.camera_x = 0
+        self.current_level = level
+        self.load_level_objects(level)
+
+        # Initialize flags for game flow
+        self.is_game_over = False
+        self.is_game_won = False
+        self.is_paused = False
+        self.show_speech_bubble = False
+        self.pickup_message = None
+        self.pickup_message_timer = 0
+        self.checkpoint_message = None
+        self.checkpoint_message_timer = 0
+        self.is_platform_breaking = False
+        self.platform_break_timer = 0
+        self.show_movement_hint = True
+        self.show_jump_hint = False
+        self.show_alien_hint = False
+        self.show_interact_hint = False
+        self.jump_hint_shown = False
+        self.alien_hint_shown = False
+        self.interact_hint_shown = False
+        self.alien_hint_timer = 0
+        self.start_timer = None
+        self.end_timer = None
+        self.paused_time = 0
+        self.last_pause_start = None
+
+    # Blaster: Saved with the checkpoints, so the checkpoint manager owns the flag
+    @property
+    def is_blaster_acquired(self):
+        return self.checkpoint_manager is not None and self.checkpoint_manager.is_blaster_acquired
+
+    @is_blaster_acquired.setter
+    def is_blaster_acquired(self, value):
+        self.checkpoint_manager.is_blaster_acquired = value
+
+    # Level Objects: Fresh copies of a level's platforms, enemies and blaster with their caches
+    # With enemy_arrays the enemies are one EnemyArrays instead of a list of Enemy objects
+    def load_level_objects(self, level):
+        self.platforms = [Platform(p.rect.x, p.rect.y, p.rect.width, p.rect.height) for p in level_data[level]["platforms"]]
+        self.enemies = [Enemy(e.rect.x, e.rect.y, e.rect.width, e.rect.height, e.base_speed) for e in level_data[level]["enemies"]]
+        if self.enemy_arrays:
+            self.enemies = EnemyArrays(self.enemies, WIDTH, WORLD_WIDTH)
+        blaster_data = level_data[level]["blaster"]
+        self.blaster = Interactable(blaster_data.rect.x, blaster_data.rect.y, blaster_data.rect.width, blaster_data.rect.height, blaster_data.name) if blaster_data and not self.is_blaster_acquired else None
+        self.platform_grid = PlatformGrid(self.platforms)
+        self.ground_spans = GroundSpans(self.platforms, HEIGHT - 40)
+        self.static_layer = StaticLayerCache(self.platform_grid, WORLD_WIDTH, HEIGHT, GRAY, BLACK)
+
+    # Restarts the level from its first checkpoint, or from the saved checkpoint when full_reset is False
+    def reset(self, full_reset=True, level=1):
+        logger.debug("reset called with full_reset=%s, level=%s", full_reset, level)
+        if self.recorder is not None:
+            self.recorder.start_segment(self.capture_replay_state(full_reset, level), self.replay_end_state())
+
+        # Checkpoint: Loads or creates checkpoint
+        checkpoint = None
+        if full_reset:
+            self.current_level = level
+            checkpoint_id = f"{level}.0"
+            if level in level_data:
+                self.checkpoint_manager.ensure_checkpoints(level_data[level]["checkpoints"])
+            checkpoint = self.checkpoint_manager.read_checkpoint(checkpoint_id)
+            if not checkpoint:
+                logger.info("Creating default checkpoint %s", checkpoint_id)
+                self.checkpoint_manager.create_checkpoint(
+                    x=100, y=HEIGHT - 40 - PLAYER_HEIGHT, width=20, height=30,
+                    id=checkpoint_id, player_x=100, player_y=HEIGHT - 40 - PLAYER_HEIGHT
+                )
+                checkpoint = self.checkpoint_manager.read_checkpoint(checkpoint_id)
+            with self.checkpoint_manager.transaction():
+                self.checkpoint_manager.update_checkpoint(checkpoint_id, True, player_x=100, player_y=HEIGHT - 40 - PLAYER_HEIGHT)
+                for cp in self.checkpoint_manager.checkpoints:
+                    if cp.id != checkpoint_id:
+                        self.checkpoint_manager.update_checkpoint(cp.id, reached=False)
+                self.checkpoint_manager.current_checkpoint_id = checkpoint_id
+                self.checkpoint_manager.save_game()
+            logger.info("Full reset to checkpoint %s at (%s, %s)", checkpoint_id, checkpoint.player_x, checkpoint.player_y)
+        else:
+            if not self.checkpoint_manager.load_game():
+                logger.warning("Load game failed, using latest checkpoint")
+                checkpoint_id = self.checkpoint_manager.get_latest_checkpoint()
+                checkpoint = self.checkpoint_manager.read_checkpoint(checkpoint_id)
+                if not checkpoint:
+                    logger.warning("Latest checkpoint %s not found, creating default %s.0", checkpoint_id, level)
+                    checkpoint_id = f"{level}.0"
+                    self.checkpoint_manager.create_checkpoint(
+                        x=100, y=HEIGHT - 40 - PLAYER_HEIGHT, width=20, height=30,
+                        id=checkpoint_id, player_x=100, player_y=HEIGHT - 40 - PLAYER_HEIGHT
+                    )
+                    checkpoint = self.checkpoint_manager.read_checkpoint(checkpoint_id)
+                self.checkpoint_manager.update_checkpoint(checkpoint_id, True, player_x=checkpoint.player_x, player_y=checkpoint.player_y)
+                self.checkpoint_manager.current_checkpoint_id = checkpoint_id
+                self.checkpoint_manager.save_game()
+            else:
+                latest_checkpoint_id = self.checkpoint_manager.current_checkpoint_id
+                checkpoint = self.checkpoint_manager.read_checkpoint(latest_checkpoint_id)
+                if checkpoint is None:
+                    logger.warning("Checkpoint %s not found, using latest checkpoint", latest_checkpoint_id)
+                    checkpoint_id = self.checkpoint_manager.get_latest_checkpoint()
+                    checkpoint = self.checkpoint_manager.read_checkpoint(checkpoint_id)
+                    if not checkpoint:
+                        logger.warning("Latest checkpoint %s not found, creating default %s.0", id, level)
+                        checkpoint_id = f"{level}.0"
+                        self.checkpoint_manager.create_checkpoint(
+                            x=100, y=HEIGHT - 40 - PLAYER_HEIGHT, width=20, height=30,
+                            id=checkpoint_id, player_x=100, player_y=HEIGHT - 40 - PLAYER_HEIGHT
+                        )
+                        checkpoint = self.checkpoint_manager.read_checkpoint(checkpoint_id)
+                    self.checkpoint_manager.update_checkpoint(checkpoint_id, True, player_x=checkpoint.player_x, player_y=checkpoint.player_y)
+                    self.checkpoint_manager.current_checkpoint_id = checkpoint_id
+                    self.checkpoint_manager.save_game()
+                else:
+                    try:
+                        self.current_level = int(latest_checkpoint_id.split('.')[0])
+                    except (ValueError, IndexError):
+                        logger.warning("Invalid checkpoint ID %s, defaulting to level %s", latest_checkpoint_id, level)
+                        self.current_level = level
+                    logger.info("Loaded checkpoint %s at (%s, %s), level=%s", latest_checkpoint_id, checkpoint.player_x, checkpoint.player_y, self.current_level)
+            self.checkpoint_manager.save_game()
+
+        # Reset player position and state
+        self.player_x = checkpoint.player_x
+        self.player_y = checkpoint.player_y
+        self.player_velocity_y = 0
+        self.is_jumping = False
+        self.camera_x = 0
+        self.is_game_over = False
+        self.is_game_won = False
+        self.show_speech_bubble = False
+        self.pickup_message = None
+        self.checkpoint_message = None
+        self.checkpoint_message_timer = 0
+
+        # Reset Game Flags for new game, before the level objects so a new game gets its blaster back
+        if full_reset:
+            self.is_blaster_acquired = False
+            self.jump_hint_shown = False
+            self.alien_hint_shown = False
+            self.interact_hint_shown = False
+            self.start_timer = None
+            self.end_timer = None
+            self.paused_time = 0
+            self.last_pause_start = None
+        else:
+            if self.last_pause_start is not None:
+                self.paused_time += self.clock.now - self.last_pause_start
+                self.last_pause_start = None
+
+        # Reset and reinitializes objects
+        if self.current_level not in level_data:
+            logger.warning("Level %s not found, defaulting to level 1", self.current_level)
+            self.current_level = 1
+        self.load_level_objects(self.current_level)
+
+        # Reset enemy positions
+        if self.enemy_arrays:
+            self.enemies.reset(HEIGHT - 40 - 30)
+        else:
+            for enemy in self.enemies:
+                enemy.rect.x = enemy.origin_x
+                enemy.rect.y = HEIGHT - 40 - 30
+                enemy.current_speed = enemy.base_speed
+                enemy.is_chasing = False
+
+        self.is_platform_breaking = False
+        self.platform_break_timer = 0
+        self.show_movement_hint = True
+        self.show_jump_hint = False
+        self.show_alien_hint = False
+        self.show_interact_hint = False
+        self.alien_hint_timer = 0
+        self.is_paused = False
+
+    # Player Interaction: Toggles blaster prompt and picks it up
+    def interact(self):
+        player_rect = pygame.Rect(self.player_x, self.player_y, PLAYER_WIDTH, PLAYER_HEIGHT)
+        if self.blaster and player_rect.colliderect(self.blaster.rect):
+            self.show_speech_bubble = not self.show_speech_bubble
+            if not self.show_speech_bubble:
+                self.pickup_message = "Blaster Acquired!"
+                self.pickup_message_timer = self.clock.now
+                self.is_blaster_acquired = True
+                if self.current_level in level_data and level_data[self.current_level]["breakable_index"] < len(self.platforms):
+                    self.is_platform_breaking = True
+                    self.platform_break_timer = self.clock.now
+                self.blaster = None
+                if self.show_interact_hint and level_data[self.current_level]["hints"]["interact"]:
+                    self.show_interact_hint = False
+                    self.interact_hint_shown = True
+
+    # Player Jump: Starts a jump when grounded
+    def jump(self):
+        if self.is_jumping:
+            return
+        self.player_velocity_y = PLAYER_JUMP
+        self.is_jumping = True
+        self.show_jump_hint = False
+        self.jump_hint_shown = True
+        if self.current_level == 1 and not self.alien_hint_shown and level_data[self.current_level]["hints"]["alien"]:
+            self.show_alien_hint = True
+
+    # Pause Game: Pauses or resumes, keeping paused time out of the level timer
+    def toggle_pause(self):
+        if not self.is_paused:
+            self.is_paused = True
+            if self.start_timer is not None and self.last_pause_start is None:
+                self.last_pause_start = self.clock.now
+        else:
+            if self.last_pause_start is not None:
+                self.paused_time += self.clock.now - self.last_pause_start
+            self.last_pause_start = None
+            self.is_paused = False
+
+    # Gameplay Keys: Applies an E, SPACE or P press during play, shared by the main loop and input replay
+    def handle_key(self, key):
+        if self.is_game_over or self.is_game_won:
+            return
+
+        # Pause Game: Toggles pause
+        if key == pygame.K_p:
+            self.toggle_pause()
+        elif not self.is_paused:
 
-# Initialize starting position and movement
-player_x = 100
-player_y = HEIGHT - PLAYER_HEIGHT - 10
-player_velocity_y = 0
-is_jumping = False
-camera_x = 0
-current_level = 1
+            # Interactable Objects: Blaster
+            if key == pygame.K_e:
+                self.interact()
+
+            # Player Jump
+            elif key == pygame.K_SPACE and not self.is_jumping:
+                self.jump()
+
+    # Gameplay Step: Advances player physics, checkpoints, enemies and win/lose by one tick
+    def update(self, move_left, move_right):
+
+        # Player Moving left and right
+        if move_left and self.player_x > 0:
+            self.player_x -= PLAYER_SPEED
+            self.show_movement_hint = False
+            if self.current_level == 1 and not self.show_movement_hint and not self.jump_hint_shown and level_data[self.current_level]["hints"]["jump"]:
+                self.show_jump_hint = True
+            if self.start_timer is None:
+                self.start_timer = self.clock.now
+        if move_right and self.player_x < WORLD_WIDTH - PLAYER_WIDTH:
+            self.player_x += PLAYER_SPEED
+            self.show_movement_hint = False
+            if self.current_level == 1 and not self.show_movement_hint and not self.jump_hint_shown and level_data[self.current_level]["hints"]["jump"]:
+                self.show_jump_hint = True
+            if self.start_timer is None:
+                self.start_timer = self.clock.now
+
+        # Player Physics: gravity and collisions
+        self.player_velocity_y += GRAVITY
+        next_player_y = self.player_y + self.player_velocity_y
+        next_player_rect = pygame.Rect(self.player_x, next_player_y, PLAYER_WIDTH, PLAYER_HEIGHT)
+
+        on_platform = False
+        for i in self.platform_grid.query(next_player_rect.left, next_player_rect.right):
+            platform = self.platforms[i]
+            if next_player_rect.colliderect(platform.rect):
+                if self.player_velocity_y > 0:
+                    next_player_y = platform.rect.top - PLAYER_HEIGHT
+                    self.player_velocity_y = 0
+                    self.is_jumping = False
+                    on_platform = True
+                    hints = level_data[self.current_level]["hints"]
+                    if self.current_level == 1:
+                        if hints["jump"] and i == hints["jump"].get("platform_index") and not self.alien_hint_shown and hints["alien"]:
+                            self.show_alien_hint = True
+                            self.alien_hint_timer = self.clock.now
+                        elif hints["alien"] and i == hints["alien"].get("platform_index") and self.show_alien_hint and not self.alien_hint_shown:
+                            self.alien_hint_timer = self.clock.now
+                            self.alien_hint_shown = True
+                elif self.player_velocity_y < 0:
+                    next_player_y = platform.rect.bottom
+                    self.player_velocity_y = 0
+
+        self.player_y = next_player_y
+        frame_profiler.lap("physics")
+
+        # Collision: Places player on ground
+        if self.current_level == 1 and not on_platform and self.player_y > HEIGHT - PLAYER_HEIGHT - 40 and self.player_x < HOLE_LEFT:
+            self.player_y = HEIGHT - PLAYER_HEIGHT - 40
+            self.player_velocity_y = 0
+            self.is_jumping = False
+
+        # Collision: Updates checkpoint status
+        player_rect = pygame.Rect(self.player_x, self.player_y, PLAYER_WIDTH, PLAYER_HEIGHT)
+        for checkpoint, checkpoint_rect in self.checkpoint_manager.checkpoints.unreached(self.current_level):
+            if player_rect.colliderect(checkpoint_rect):
+                logger.debug("Player collided with checkpoint %s at (%s, %s) with player at (%s, %s)", checkpoint.id, checkpoint.x, checkpoint.y, self.player_x, self.player_y)
+                self.checkpoint_manager.update_checkpoint(checkpoint.id, True, player_x=self.player_x, player_y=self.player_y)
+                self.checkpoint_message = f"Checkpoint {checkpoint.id} Reached!"
+                self.checkpoint_message_timer = self.clock.now
+                break
+        frame_profiler.lap("checkpoints")
+
+        # Camera Movement: Tracks player position
+        self.camera_x = max(0, min(self.player_x - WIDTH // 2 + PLAYER_WIDTH // 2, WORLD_WIDTH - WIDTH))
+
+        # Update Enemies: Moves enemies and checks collisions
+        if self.enemy_arrays:
+            self.enemies.update(self.player_x, PLAYER_WIDTH, self.ground_spans, self.camera_x, self.clock.now)
+            if self.enemies.collides(player_rect):
+                self.is_game_over = True
+        else:
+            for enemy in self.enemies:
+                enemy.update(self.player_x, PLAYER_WIDTH, self.ground_spans, self.camera_x, self.clock.now)
+                if player_rect.colliderect(enemy.rect):
+                    self.is_game_over = True
+        frame_profiler.lap("enemies")
+
+        # Check Win/Lose conditions
+        if self.player_y > HEIGHT:
+            if self.player_x >= HOLE_LEFT and self.is_blaster_acquired:
+                self.is_game_won = True
+                if self.end_timer is None:
+                    self.end_timer = self.clock.now
+            else:
+                self.is_game_over = True
+
+        # Controls hints visibility
+        if self.show_alien_hint and self.alien_hint_timer > 0:
+            current_time = self.clock.now
+            if current_time - self.alien_hint_timer >= ALIEN_HINT_DURATION:
+                self.show_alien_hint = False
+                if self.current_level == 1 and not self.interact_hint_shown and level_data[self.current_level]["hints"]["interact"]:
+                    self.show_interact_hint = True
+
+        # Removes breakable platform
+        if self.is_platform_breaking and self.clock.now - self.platform_break_timer > PLATFORM_BREAK_DELAY:
+            if self.current_level in level_data and level_data[self.current_level]["breakable_index"] < len(self.platforms):
+                removed_platform = self.platform_grid.pop(level_data[self.current_level]["breakable_index"])
+                self.ground_spans.remove(removed_platform)
+                self.static_layer.invalidate(removed_platform.rect)
+            self.is_platform_breaking = False
+        frame_profiler.lap("rules")
+
+    # Input Replay: Everything reset reads, captured just before it runs
+    def capture_replay_state(self, full_reset, level):
+        self.checkpoint_manager.flush()
+        return {
+            "full_reset": full_reset,
+            "level": level,
+            "now": self.clock.now,
+            "checkpoints": [cp.to_dict() for cp in self.checkpoint_manager.checkpoints],
+            "stored_checkpoints": [cp.to_dict() for cp in self.checkpoint_manager.store.read_checkpoints()],
+            "stored_state": {key: self.checkpoint_manager.store.read_state(key) for key in ("current_checkpoint_id", "is_blaster_acquired")},
+            "current_checkpoint_id": self.checkpoint_manager.current_checkpoint_id,
+            "globals": {name: getattr(self, name) for name in REPLAY_FIELDS}
+        }
+
+    # Input Replay: Rebuilds a captured state on a fresh in-memory checkpoint store
+    def restore_replay_state(self, state):
+        store = MemorySaveStore(":memory:")
+        store.insert_checkpoints([Checkpoint.from_dict(cp) for cp in state["stored_checkpoints"]])
+        store.write_batch({}, {key: value for key, value in state["stored_state"].items() if value is not None})
+        if self.checkpoint_manager is not None:
+            self.checkpoint_manager.close()
+        self.checkpoint_manager = CheckpointManager(":memory:", store=store)
+        self.checkpoint_manager.checkpoints = CheckpointRegistry(Checkpoint.from_dict(cp) for cp in state["checkpoints"])
+        self.checkpoint_manager.current_checkpoint_id = state["current_checkpoint_id"]
+        for name, value in state["globals"].items():
+            setattr(self, name, value)
+        self.clock.set_time(state["now"])
+
+    # Input Replay: Gameplay state compared between a recording and its replay
+    def replay_end_state(self):
+        return {
+            "level": self.current_level,
+            "player": [self.player_x, self.player_y, self.player_velocity_y],
+            "enemies": [[enemy.rect.x, enemy.rect.y, enemy.current_speed] for enemy in self.enemies],
+            "platforms": len(self.platforms),
+            "is_blaster_acquired": self.is_blaster_acquired,
+            "is_game_over": self.is_game_over,
+            "is_game_won": self.is_game_won
+        }
+
+    # Input Replay: Plays one recorded segment through reset, handle_key and update
+    def replay_segment(self, segment):
+        self.restore_replay_state(segment.header)
+        self.reset(full_reset=segment.header["full_reset"], level=segment.header["level"])
+        for now, flags, keys in segment.frames:
+            self.clock.set_time(now)
+            for code in keys:
+                self.handle_key(REPLAY_KEYS[code])
+            if flags & FRAME_UPDATED:
+                self.update(bool(flags & HELD_LEFT), bool(flags & HELD_RIGHT))
+        return self.replay_end_state()
+
+    # Gameplay Check: True while the level is being played, ignoring menus and story screens
+    def is_active(self):
+        return not (self.is_game_over or self.is_game_won or self.is_paused)
+
+    # Status: "won", "died" or "running"
+    def status(self):
+        if self.is_game_won:
+            return "won"
+        if self.is_game_over:
+            return "died"
+        return "running"
+
+    # Step: One tick of input; keys are gameplay key presses (E, SPACE, P) applied before the update
+    def step(self, move_left=False, move_right=False, keys=()):
+        for key in keys:
+            self.handle_key(key)
+        if self.is_active():
+            self.update(move_left, move_right)
+        return self.status()
+
+# Game Session: The game shown in the window, created by the entry point so importing loads no level
+game = None
 
 # Initialize flags for game flow
-is_game_over = False
-is_game_won = False
 is_title_screen = True
 is_game_select_screen = False
 is_new_game_options = False
@@ -509,138 +940,39 @@ is_fourth_message_fade_out = False
 is_resume_confirm = False
 is_new_game_confirm = False
 message_timer = 0
-show_speech_bubble = False
-pickup_message = None
-pickup_message_timer = 0
-checkpoint_message = None
-checkpoint_message_timer = 0
-is_blaster_acquired = False
-is_platform_breaking = False
-platform_break_timer = 0
-show_movement_hint = True
-show_jump_hint = False
-show_alien_hint = False
-show_interact_hint = False
-jump_hint_shown = False
-alien_hint_shown = False
-interact_hint_shown = False
-alien_hint_timer = 0
-is_paused = False
 is_confirm_save = False
 is_confirm_save_game_over = False
 running = True
-start_timer = None
-end_timer = None
-paused_time = 0
-last_pause_start = None
 
 # Delete Save File
 def delete_save_file():
-    global checkpoint_manager
     try:
-        checkpoint_manager.close()
+        game.checkpoint_manager.close()
         if os.path.exists(SAVE_FILE):
             os.remove(SAVE_FILE)
-            print(f"Deleted {SAVE_FILE}")
+            logger.info("Deleted %s", SAVE_FILE)
         else:
-            print(f"No save file found at {SAVE_FILE}")
-        checkpoint_manager = CheckpointManager(SAVE_FILE)
-        checkpoint_manager.current_checkpoint_id = "1.0"
-        checkpoint_manager.save_game()
-        print(f"Reset CheckpointManager to default checkpoint 1.0")
+            logger.info("No save file found at %s", SAVE_FILE)
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(SAVE_FILE + suffix):
+                os.remove(SAVE_FILE + suffix)
+        game.checkpoint_manager = CheckpointManager(SAVE_FILE, write_behind=SAVE_WRITE_BEHIND)
+        game.checkpoint_manager.current_checkpoint_id = "1.0"
+        game.checkpoint_manager.save_game()
+        logger.info("Reset CheckpointManager to default checkpoint 1.0")
         return True
     except OSError as e:
-        print(f"Failed to delete {SAVE_FILE}: {e}")
-        checkpoint_manager._get_connection()
+        logger.error("Failed to delete %s: %s", SAVE_FILE, e)
+        game.checkpoint_manager = CheckpointManager(SAVE_FILE, write_behind=SAVE_WRITE_BEHIND)
         return False
 
-# Restarts game state
+# Restarts the game and leaves the menus and story screens
 def reset_game(full_reset=True, level=1):
-    global player_x, player_y, player_velocity_y, is_jumping, camera_x, is_game_over, is_game_won
     global is_title_screen, is_message_screen, is_message_fade_out, is_second_message, is_second_message_fade_out
     global is_third_message, is_third_message_fade_out, is_fourth_message, is_fourth_message_fade_out
-    global show_speech_bubble, pickup_message, is_blaster_acquired
-    global is_platform_breaking, platform_break_timer, blaster, platforms, enemies
-    global show_movement_hint, show_jump_hint, show_alien_hint, show_interact_hint
-    global jump_hint_shown, alien_hint_shown, interact_hint_shown, alien_hint_timer
-    global is_paused, is_confirm_save, is_confirm_save_game_over, is_game_select_screen
-    global checkpoint_message, checkpoint_message_timer, start_timer, end_timer, paused_time, last_pause_start
-    global is_resume_confirm, is_new_game_confirm, current_level
-
-    print(f"reset_game called with full_reset={full_reset}, level={level}")
-    
-    # Checkpoint: Loads or creates checkpoint
-    checkpoint = None
-    if full_reset:
-        current_level = level
-        checkpoint_id = f"{level}.0"
-        checkpoint = checkpoint_manager.read_checkpoint(checkpoint_id)
-        if not checkpoint:
-            print(f"Creating default checkpoint {checkpoint_id}")
-            checkpoint_manager.create_checkpoint(
-                x=100, y=HEIGHT - 40 - PLAYER_HEIGHT, width=20, height=30,
-                id=checkpoint_id, player_x=100, player_y=HEIGHT - 40 - PLAYER_HEIGHT
-            )
-            checkpoint = checkpoint_manager.read_checkpoint(checkpoint_id)
-        checkpoint_manager.update_checkpoint(checkpoint_id, True, player_x=100, player_y=HEIGHT - 40 - PLAYER_HEIGHT)
-        for cp in checkpoint_manager.checkpoints:
-            if cp["id"] != checkpoint_id:
-                cp["reached"] = False
-                checkpoint_manager.update_checkpoint(cp["id"], reached=False)
-        checkpoint_manager.current_checkpoint_id = checkpoint_id
-        checkpoint_manager.save_game()
-        print(f"Full reset to checkpoint {checkpoint_id} at ({checkpoint['player_x']}, {checkpoint['player_y']})")
-    else:
-        if not checkpoint_manager.load_game():
-            print("Load game failed, using latest checkpoint")
-            checkpoint_id = checkpoint_manager.get_latest_checkpoint()
-            checkpoint = checkpoint_manager.read_checkpoint(checkpoint_id)
-            if not checkpoint:
-                print(f"Latest checkpoint {checkpoint_id} not found, creating default {level}.0")
-                checkpoint_id = f"{level}.0"
-                checkpoint_manager.create_checkpoint(
-                    x=100, y=HEIGHT - 40 - PLAYER_HEIGHT, width=20, height=30,
-                    id=checkpoint_id, player_x=100, player_y=HEIGHT - 40 - PLAYER_HEIGHT
-                )
-                checkpoint = checkpoint_manager.read_checkpoint(checkpoint_id)
-            checkpoint_manager.update_checkpoint(checkpoint_id, True, player_x=checkpoint["player_x"], player_y=checkpoint["player_y"])
-            checkpoint_manager.current_checkpoint_id = checkpoint_id
-            checkpoint_manager.save_game()
-        else:
-            latest_checkpoint_id = checkpoint_manager.current_checkpoint_id
-            checkpoint = checkpoint_manager.read_checkpoint(latest_checkpoint_id)
-            if checkpoint is None:
-                print(f"Checkpoint {latest_checkpoint_id} not found, using latest checkpoint")
-                checkpoint_id = checkpoint_manager.get_latest_checkpoint()
-                checkpoint = checkpoint_manager.read_checkpoint(checkpoint_id)
-                if not checkpoint:
-                    print(f"Latest checkpoint {id} not found, creating default {level}.0")
-                    checkpoint_id = f"{level}.0"
-                    checkpoint_manager.create_checkpoint(
-                        x=100, y=HEIGHT - 40 - PLAYER_HEIGHT, width=20, height=30,
-                        id=checkpoint_id, player_x=100, player_y=HEIGHT - 40 - PLAYER_HEIGHT
-                    )
-                    checkpoint = checkpoint_manager.read_checkpoint(checkpoint_id)
-                checkpoint_manager.update_checkpoint(checkpoint_id, True, player_x=checkpoint["player_x"], player_y=checkpoint["player_y"])
-                checkpoint_manager.current_checkpoint_id = checkpoint_id
-                checkpoint_manager.save_game()
-            else:
-                try:
-                    current_level = int(latest_checkpoint_id.split('.')[0])
-                except (ValueError, IndexError):
-                    print(f"Invalid checkpoint ID {latest_checkpoint_id}, defaulting to level {level}")
-                    current_level = level
-                print(f"Loaded checkpoint {latest_checkpoint_id} at ({checkpoint['player_x']}, {checkpoint['player_y']}), level={current_level}")
-        checkpoint_manager.save_game()
-
-    # Reset player position and state
-    player_x = checkpoint["player_x"]
-    player_y = checkpoint["player_y"]
-    player_velocity_y = 0
-    is_jumping = False
-    camera_x = 0
-    is_game_over = False
-    is_game_won = False
+    global is_confirm_save, is_confirm_save_game_over, is_game_select_screen
+    global is_resume_confirm, is_new_game_confirm
+    game.reset(full_reset, level)
     is_title_screen = False
     is_message_screen = False
     is_message_fade_out = False
@@ -652,93 +984,51 @@ def reset_game(full_reset=True, level=1):
     is_fourth_message_fade_out = False
     is_resume_confirm = False
     is_new_game_confirm = False
-    show_speech_bubble = False
-    pickup_message = None
-    checkpoint_message = None
-    checkpoint_message_timer = 0
-
-    # Reset and reinitializes objects
-    if current_level in level_data:
-        platforms = [Platform(p.rect.x, p.rect.y, p.rect.width, p.rect.height) for p in level_data[current_level]["platforms"]]
-        enemies = [Enemy(e.rect.x, e.rect.y, e.rect.width, e.rect.height, e.base_speed) for e in level_data[current_level]["enemies"]]
-        blaster_data = level_data[current_level]["blaster"]
-        blaster = Interactable(blaster_data.rect.x, blaster_data.rect.y, blaster_data.rect.width, blaster_data.rect.height, blaster_data.name) if blaster_data and not is_blaster_acquired else None
-    else:
-        print(f"Level {current_level} not found, defaulting to level 1")
-        current_level = 1
-        platforms = [Platform(p.rect.x, p.rect.y, p.rect.width, p.rect.height) for p in level_data[1]["platforms"]]
-        enemies = [Enemy(e.rect.x, e.rect.y, e.rect.width, e.rect.height, e.base_speed) for e in level_data[1]["enemies"]]
-        blaster_data = level_data[1]["blaster"]
-        blaster = Interactable(blaster_data.rect.x, blaster_data.rect.y, blaster_data.rect.width, blaster_data.rect.height, blaster_data.name) if blaster_data and not is_blaster_acquired else None
-
-    # Reset enemy positions
-    for enemy in enemies:
-        enemy.rect.x = enemy.origin_x
-        enemy.rect.y = HEIGHT - 40 - 30
-        enemy.current_speed = enemy.base_speed
-        enemy.is_chasing = False
-
-    # Reset Game Flags for new game
-    if full_reset:
-        is_blaster_acquired = False
-        jump_hint_shown = False
-        alien_hint_shown = False
-        interact_hint_shown = False
-        start_timer = None
-        end_timer = None
-        paused_time = 0
-        last_pause_start = None
-    else:
-        if last_pause_start is not None:
-            paused_time += pygame.time.get_ticks() - last_pause_start
-            last_pause_start = None
-
-    is_platform_breaking = False
-    platform_break_timer = 0
-    show_movement_hint = True
-    show_jump_hint = False
-    show_alien_hint = False
-    show_interact_hint = False
-    alien_hint_timer = 0
-    is_paused = False
     is_confirm_save = False
     is_confirm_save_game_over = False
     is_game_select_screen = False
 
+# Gameplay Keys: Records a gameplay key press for input replay, then applies it
+# Mouse pause and resume go through here as a P press so recordings see every pause
+def press_gameplay_key(key):
+    if game.recorder is not None:
+        game.recorder.record_key(key)
+    game.handle_key(key)
+
 # Render Button
 def render_button(text, rect, text_color=BLACK, bg_color=WHITE):
     mouse_pos = pygame.mouse.get_pos()
     bg_color = (200, 200, 200) if rect.collidepoint(mouse_pos) else bg_color
-    pygame.draw.rect(screen, bg_color, rect)
-    text_surface = button_font.render(text, True, text_color)
+    draw_rect(bg_color, rect)
+    text_surface = text_cache.render(button_font, text, True, text_color)
     text_rect = text_surface.get_rect(center=rect.center)
-    screen.blit(text_surface, text_rect)
+    blit_surface(text_surface, text_rect)
     return rect
 
 # Render Title Screen
 def render_title():
-    screen.fill(BLACK)
-    title_text = font.render("AMONG THE ASTEROIDS", True, WHITE)
-    screen.blit(title_text, title_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 50)))
+    fill_screen(BLACK)
+    title_text = text_cache.render(font, "AMONG THE ASTEROIDS", True, WHITE)
+    blit_surface(title_text, title_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 50)))
     start_rect = render_button("Start", pygame.Rect(WIDTH / 2 - BUTTON_LARGE[0] / 2, HEIGHT / 2 + 50, *BUTTON_LARGE))
     quit_rect = render_button("Quit", pygame.Rect(WIDTH / 2 - BUTTON_LARGE[0] / 2, HEIGHT / 2 + 120, *BUTTON_LARGE))
     return start_rect, quit_rect
 
 # Render Game Select
 def render_game_select():
-    screen.fill(BLACK)
+    fill_screen(BLACK)
     new_game_rect = render_button("New Game", pygame.Rect(WIDTH / 2 - BUTTON_LARGE[0] / 2, HEIGHT / 2 - 70, *BUTTON_LARGE))
     resume_game_rect = render_button("Resume Game", pygame.Rect(WIDTH / 2 - BUTTON_LARGE[0] / 2, HEIGHT / 2 + 10, *BUTTON_LARGE))
     back_rect = render_button("Back", pygame.Rect(WIDTH / 2 - BACK_BUTTON_SIZE[0] / 2, HEIGHT / 2 + 90, *BACK_BUTTON_SIZE))
     if os.path.exists(SAVE_FILE):
-        screen.blit(speech_font.render("There is a saved progress", True, WHITE), (WIDTH / 2 - 120, HEIGHT / 2 - 150))
+        blit_surface(text_cache.render(speech_font, "There is a saved progress", True, WHITE), (WIDTH / 2 - 120, HEIGHT / 2 - 150))
     return new_game_rect, resume_game_rect, back_rect
 
 # Render New Game Options
 def render_new_game_options():
-    screen.fill(BLACK)
-    title_text = button_font.render("Select Level", True, WHITE)
-    screen.blit(title_text, title_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 200)))
+    fill_screen(BLACK)
+    title_text = text_cache.render(button_font, "Select Level", True, WHITE)
+    blit_surface(title_text, title_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 200)))
     button_height = HEIGHT / 2 - 150
     buttons = []
     for i in range(5):
@@ -751,37 +1041,33 @@ def render_new_game_options():
 
 # Render Pause Button
 def render_pause_button():
-    pygame.draw.rect(screen, BLACK, (*PAUSE_BUTTON_POS, *PAUSE_BUTTON_SIZE))
-    pygame.draw.rect(screen, WHITE, (*PAUSE_BUTTON_POS, *PAUSE_BUTTON_SIZE), 2)
-    text = button_font.render("||", True, WHITE)
-    screen.blit(text, text.get_rect(center=(PAUSE_BUTTON_POS[0] + PAUSE_BUTTON_SIZE[0] / 2, PAUSE_BUTTON_POS[1] + PAUSE_BUTTON_SIZE[1] / 2)))
+    draw_rect(BLACK, (*PAUSE_BUTTON_POS, *PAUSE_BUTTON_SIZE))
+    draw_rect(WHITE, (*PAUSE_BUTTON_POS, *PAUSE_BUTTON_SIZE), 2)
+    text = text_cache.render(button_font, "||", True, WHITE)
+    blit_surface(text, text.get_rect(center=(PAUSE_BUTTON_POS[0] + PAUSE_BUTTON_SIZE[0] / 2, PAUSE_BUTTON_POS[1] + PAUSE_BUTTON_SIZE[1] / 2)))
 
 # Render Skip Button
 def render_skip_button():
     skip_rect = pygame.Rect(WIDTH - 110, 10, 100, 40)
-    pygame.draw.rect(screen, BLACK, skip_rect)
-    pygame.draw.rect(screen, WHITE, skip_rect, 2)
-    text = button_font.render("Skip", True, WHITE)
-    screen.blit(text, text.get_rect(center=skip_rect.center))
+    draw_rect(BLACK, skip_rect)
+    draw_rect(WHITE, skip_rect, 2)
+    text = text_cache.render(button_font, "Skip", True, WHITE)
+    blit_surface(text, text.get_rect(center=skip_rect.center))
     return skip_rect
 
 # Render Pause Menu
 def render_pause_menu():
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill(PAUSE_OVERLAY_COLOR)
-    screen.blit(overlay, (0, 0))
+    blit_surface(overlay_cache.get(screen.get_size(), PAUSE_OVERLAY_COLOR), (0, 0))
     resume_rect = render_button("Resume", pygame.Rect(WIDTH / 2 - MENU_BUTTON_SIZE[0] / 2, HEIGHT / 2 - MENU_BUTTON_SIZE[1] - 10, *MENU_BUTTON_SIZE))
     quit_rect = render_button("Quit", pygame.Rect(WIDTH / 2 - MENU_BUTTON_SIZE[0] / 2, HEIGHT / 2 + 10, *MENU_BUTTON_SIZE))
     return resume_rect, quit_rect
 
 # Render Confirm Save
 def render_confirm_save(message="Do you wanna save?", show_cancel=False):
-    screen.fill(BLACK)
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill(PAUSE_OVERLAY_COLOR)
-    screen.blit(overlay, (0, 0))
-    confirm_text = button_font.render(message, True, WHITE)
-    screen.blit(confirm_text, confirm_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 100)))
+    fill_screen(BLACK)
+    blit_surface(overlay_cache.get(screen.get_size(), PAUSE_OVERLAY_COLOR), (0, 0))
+    confirm_text = text_cache.render(button_font, message, True, WHITE)
+    blit_surface(confirm_text, confirm_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 100)))
     spacing = 20
     yes_no_width = CONFIRM_BUTTON_SIZE[0] * 2 + spacing
     start_x = WIDTH / 2 - yes_no_width / 2
@@ -794,59 +1080,54 @@ def render_confirm_save(message="Do you wanna save?", show_cancel=False):
 
 # Render Game Over
 def render_game_over():
-    global last_pause_start
-    screen.fill(BLACK)
-    lose_text = font.render("YOU DIED!", True, WHITE)
-    screen.blit(lose_text, lose_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 50)))
-    if start_timer is not None and not is_confirm_save_game_over:
-        if last_pause_start is None:
-            last_pause_start = pygame.time.get_ticks()
-        elapsed_time = (last_pause_start - start_timer) - paused_time
+    fill_screen(BLACK)
+    lose_text = text_cache.render(font, "YOU DIED!", True, WHITE)
+    blit_surface(lose_text, lose_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 50)))
+    if game.start_timer is not None and not is_confirm_save_game_over:
+        if game.last_pause_start is None:
+            game.last_pause_start = game.clock.now
+        elapsed_time = (game.last_pause_start - game.start_timer) - game.paused_time
         minutes = int(elapsed_time // 60000)
         seconds = int((elapsed_time % 60000) // 1000)
         milliseconds = int(elapsed_time % 1000)
-        time_text = timer_font.render(f"Time: {minutes:02d}:{seconds:02d}.{milliseconds:03d}", True, WHITE)
-        screen.blit(time_text, time_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 10)))
+        time_text = text_cache.render(timer_font, f"Time: {minutes:02d}:{seconds:02d}.{milliseconds:03d}", True, WHITE)
+        blit_surface(time_text, time_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 10)))
     restart_rect = render_button("Restart", pygame.Rect(WIDTH / 2 - 200, HEIGHT / 2 + 50, 200, 50))
     quit_rect = render_button("Quit", pygame.Rect(WIDTH / 2 + 50, HEIGHT / 2 + 50, 200, 50))
     return restart_rect, quit_rect
 
 # Render Win Screen
 def render_win():
-    screen.fill(BLACK)
-    win_text = font.render("YOU WIN!", True, WHITE)
-    screen.blit(win_text, win_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 50)))
-    if end_timer and start_timer is not None:
-        elapsed_time = (end_timer - start_timer) - paused_time
+    fill_screen(BLACK)
+    win_text = text_cache.render(font, "YOU WIN!", True, WHITE)
+    blit_surface(win_text, win_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 50)))
+    if game.end_timer and game.start_timer is not None:
+        elapsed_time = (game.end_timer - game.start_timer) - game.paused_time
         minutes = int(elapsed_time // 60000)
         seconds = int((elapsed_time % 60000) // 1000)
         milliseconds = int(elapsed_time % 1000)
-        time_text = timer_font.render(f"Time: {minutes:02d}:{seconds:02d}.{milliseconds:03d}", True, WHITE)
-        screen.blit(time_text, time_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 10)))
+        time_text = text_cache.render(timer_font, f"Time: {minutes:02d}:{seconds:02d}.{milliseconds:03d}", True, WHITE)
+        blit_surface(time_text, time_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 10)))
     restart_rect = render_button("Restart", pygame.Rect(WIDTH / 2 - 200, HEIGHT / 2 + 50, 200, 50))
     quit_rect = render_button("Quit", pygame.Rect(WIDTH / 2 + 50, HEIGHT / 2 + 50, 200, 50))
     return restart_rect, quit_rect
 
-# Render Messages
-def render_message():
-    screen.fill(BLACK)
+# Story Message Cache: Lays out and rasterizes each story message once
+message_surfaces = {}
+
+# Story Message Layout: Word-wraps a message onto a reusable full-screen surface
+def get_message_surface(message):
+    text_surface = message_surfaces.get(message)
+    if text_surface is not None:
+        return text_surface
     text_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    if is_fourth_message or is_fourth_message_fade_out:
-        message = FOURTH_MESSAGE
-    elif is_third_message or is_third_message_fade_out:
-        message = THIRD_MESSAGE
-    elif is_second_message or is_second_message_fade_out:
-        message = SECOND_MESSAGE
-    else:
-        message = FIRST_MESSAGE
     words = message.split(' ')
     lines = []
     current_line = ""
     max_width = WIDTH - 40
     for word in words:
         test_line = current_line + word + " "
-        test_surface = message_font.render(test_line, True, WHITE)
-        if test_surface.get_size()[0] < max_width:
+        if message_font.size(test_line)[0] < max_width:
             current_line = test_line
         else:
             lines.append(current_line.strip())
@@ -858,7 +1139,22 @@ def render_message():
         line_rect = line_surface.get_rect(center=(WIDTH / 2, y_offset))
         text_surface.blit(line_surface, line_rect)
         y_offset += 40
-    current_time = pygame.time.get_ticks()
+    message_surfaces[message] = text_surface
+    return text_surface
+
+# Render Messages
+def render_message():
+    fill_screen(BLACK)
+    if is_fourth_message or is_fourth_message_fade_out:
+        message = FOURTH_MESSAGE
+    elif is_third_message or is_third_message_fade_out:
+        message = THIRD_MESSAGE
+    elif is_second_message or is_second_message_fade_out:
+        message = SECOND_MESSAGE
+    else:
+        message = FIRST_MESSAGE
+    text_surface = get_message_surface(message)
+    current_time = game.clock.now
     elapsed_time = current_time - message_timer
     if is_message_fade_out or is_second_message_fade_out or is_third_message_fade_out or is_fourth_message_fade_out:
         alpha = int(255 * (1 - elapsed_time / FADE_OUT_DURATION))
@@ -866,580 +1162,515 @@ def render_message():
         alpha = int(255 * min(elapsed_time / FADE_IN_DURATION, 1.0))
     alpha = max(0, min(255, alpha))
     text_surface.set_alpha(alpha)
-    screen.blit(text_surface, (0, 0))
+    blit_surface(text_surface, (0, 0))
+
+# Render Stats: Chunk and entity draws submitted and culled by the last render_game call
+render_stats = {"drawn": 0, "culled": 0}
 
 # Render Game
 def render_game():
-    global pickup_message, pickup_message_timer, show_speech_bubble, show_movement_hint, show_jump_hint, show_alien_hint, show_interact_hint
-    global checkpoint_message, checkpoint_message_timer
-    screen.fill(BLACK)
+    fill_screen(BLACK)
+
+    view_left = game.camera_x
+    view_right = game.camera_x + WIDTH
+    drawn = 0
+    culled = 0
+
+    # Renders the pre-baked platform chunks inside the viewport
+    for chunk, chunk_x in game.static_layer.visible(view_left, view_right):
+        blit_surface(chunk, (chunk_x - game.camera_x, 0))
+        drawn += 1
+    culled += len(game.static_layer.chunks) - drawn
 
     # Renders player rectangle
-    pygame.draw.rect(screen, WHITE, (player_x - camera_x, player_y, PLAYER_WIDTH, PLAYER_HEIGHT))
+    draw_rect(WHITE, (game.player_x - game.camera_x, game.player_y, PLAYER_WIDTH, PLAYER_HEIGHT))
 
-    # Renders enemy rectangles
-    for enemy in enemies:
-        pygame.draw.rect(screen, RED, (enemy.rect.x - camera_x, enemy.rect.y, enemy.rect.width, enemy.rect.height))
+    # Renders enemy rectangles inside the viewport
+    for enemy in game.enemies:
+        if enemy.rect.right > view_left and enemy.rect.left < view_right:
+            draw_rect(RED, (enemy.rect.x - game.camera_x, enemy.rect.y, enemy.rect.width, enemy.rect.height))
+            drawn += 1
+        else:
+            culled += 1
 
     # Renders blaster rectangle
-    if blaster and not is_blaster_acquired:
-        pygame.draw.rect(screen, BLUE, (blaster.rect.x - camera_x, blaster.rect.y, blaster.rect.width, blaster.rect.height))
-
-    # Renders checkpoint rectangles
-    for checkpoint in checkpoint_manager.checkpoints:
-        checkpoint_level = int(checkpoint["id"].split('.')[0])
-        if checkpoint_level == current_level:
-            if not ((checkpoint["id"] == "1.0" and checkpoint["x"] == 100 and checkpoint["y"] == HEIGHT - 40 - PLAYER_HEIGHT) or \
-                   (checkpoint["id"] == "2.0" and checkpoint["x"] == 150 and checkpoint["y"] == HEIGHT - 40 - PLAYER_HEIGHT)):
-                if not checkpoint["reached"]:
-                    pygame.draw.rect(screen, (0, 255, 0), (checkpoint["x"] - camera_x, checkpoint["y"], checkpoint["width"], checkpoint["height"]))
-
-    # Renders platform rectangles
-    for platform in platforms:
-        pygame.draw.rect(screen, GRAY, (platform.rect.x - camera_x, platform.rect.y, platform.rect.width, platform.rect.height))
+    if game.blaster and not game.is_blaster_acquired:
+        if game.blaster.rect.right > view_left and game.blaster.rect.left < view_right:
+            draw_rect(BLUE, (game.blaster.rect.x - game.camera_x, game.blaster.rect.y, game.blaster.rect.width, game.blaster.rect.height))
+            drawn += 1
+        else:
+            culled += 1
+
+    # Renders the current level's unreached checkpoint rectangles inside the viewport
+    for checkpoint, checkpoint_rect in game.checkpoint_manager.checkpoints.unreached(game.current_level):
+        if not ((checkpoint.id == "1.0" and checkpoint.x == 100 and checkpoint.y == HEIGHT - 40 - PLAYER_HEIGHT) or \
+               (checkpoint.id == "2.0" and checkpoint.x == 150 and checkpoint.y == HEIGHT - 40 - PLAYER_HEIGHT)):
+            if checkpoint_rect.right > view_left and checkpoint_rect.left < view_right:
+                draw_rect((0, 255, 0), checkpoint_rect.move(-game.camera_x, 0))
+                drawn += 1
+            else:
+                culled += 1
+
+    render_stats["drawn"] = drawn
+    render_stats["culled"] = culled
 
     # Shows blaster pickup prompt
-    if show_speech_bubble and blaster:
-        text = speech_font.render("Pick up the blaster?", True, WHITE)
-        screen.blit(text, text.get_rect(topleft=(blaster.rect.x - camera_x - 50, 20)))
+    if game.show_speech_bubble and game.blaster:
+        text = text_cache.render(speech_font, "Pick up the blaster?", True, WHITE)
+        blit_surface(text, text.get_rect(topleft=(game.blaster.rect.x - game.camera_x - 50, 20)))
 
     # Shows blaster acquisition message
-    if pickup_message:
-        current_time = pygame.time.get_ticks()
-        if current_time - pickup_message_timer > PICKUP_MESSAGE_DURATION:
-            pickup_message = None
+    if game.pickup_message:
+        current_time = game.clock.now
+        if current_time - game.pickup_message_timer > PICKUP_MESSAGE_DURATION:
+            game.pickup_message = None
         else:
-            message_text = speech_font.render(pickup_message, True, WHITE)
-            screen.blit(message_text, message_text.get_rect(center=(WIDTH / 2, HEIGHT / 2)))
+            message_text = text_cache.render(speech_font, game.pickup_message, True, WHITE)
+            blit_surface(message_text, message_text.get_rect(center=(WIDTH / 2, HEIGHT / 2)))
 
     # Shows checkpoint reached message
-    if checkpoint_message:
-        current_time = pygame.time.get_ticks()
-        if current_time - checkpoint_message_timer > CHECKPOINT_MESSAGE_DURATION:
-            checkpoint_message = None
+    if game.checkpoint_message:
+        current_time = game.clock.now
+        if current_time - game.checkpoint_message_timer > CHECKPOINT_MESSAGE_DURATION:
+            game.checkpoint_message = None
         else:
-            message_text = speech_font.render(checkpoint_message, True, WHITE)
-            screen.blit(message_text, message_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 60)))
+            message_text = text_cache.render(speech_font, game.checkpoint_message, True, WHITE)
+            blit_surface(message_text, message_text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 60)))
 
     # Shows movement instructions
-    if show_movement_hint:
-        hint_text = speech_font.render("Press A and D to move", True, WHITE)
-        hint_rect = hint_text.get_rect(center=(player_x - camera_x + PLAYER_WIDTH / 2, player_y - 20))
-        screen.blit(hint_text, hint_rect)
+    if game.show_movement_hint:
+        hint_text = text_cache.render(speech_font, "Press A and D to move", True, WHITE)
+        hint_rect = hint_text.get_rect(center=(game.player_x - game.camera_x + PLAYER_WIDTH / 2, game.player_y - 20))
+        blit_surface(hint_text, hint_rect)
     
     # Shows level-specific hints
-    hints = level_data[current_level]["hints"]
-    if current_level == 1:
-        if show_jump_hint and hints["jump"] and isinstance(hints["jump"], dict):
+    hints = level_data[game.current_level]["hints"]
+    if game.current_level == 1:
+        if game.show_jump_hint and hints["jump"] and isinstance(hints["jump"], dict):
             jump_hint = hints["jump"]
             platform_index = jump_hint["platform_index"]
-            if platform_index < len(platforms):
-                jump_text = speech_font.render(jump_hint["message"], True, WHITE)
-                jump_rect = jump_text.get_rect(center=(platforms[platform_index].rect.x + platforms[platform_index].rect.width / 2 - camera_x, platforms[platform_index].rect.y + jump_hint["y_offset"]))
-                screen.blit(jump_text, jump_rect)
-        if show_alien_hint and hints["alien"] and isinstance(hints["alien"], dict):
+            if platform_index < len(game.platforms):
+                jump_text = text_cache.render(speech_font, jump_hint["message"], True, WHITE)
+                jump_rect = jump_text.get_rect(center=(game.platforms[platform_index].rect.x + game.platforms[platform_index].rect.width / 2 - game.camera_x, game.platforms[platform_index].rect.y + jump_hint["y_offset"]))
+                blit_surface(jump_text, jump_rect)
+        if game.show_alien_hint and hints["alien"] and isinstance(hints["alien"], dict):
             alien_hint = hints["alien"]
             platform_index = alien_hint["platform_index"]
-            if platform_index < len(platforms):
-                alien_text = speech_font.render(alien_hint["message"], True, WHITE)
-                alien_rect = alien_text.get_rect(center=(platforms[platform_index].rect.x + platforms[platform_index].rect.width / 2 - camera_x, alien_hint["y_offset"]))
-                screen.blit(alien_text, alien_rect)
-        if show_interact_hint and hints["interact"] and isinstance(hints["interact"], dict):
+            if platform_index < len(game.platforms):
+                alien_text = text_cache.render(speech_font, alien_hint["message"], True, WHITE)
+                alien_rect = alien_text.get_rect(center=(game.platforms[platform_index].rect.x + game.platforms[platform_index].rect.width / 2 - game.camera_x, alien_hint["y_offset"]))
+                blit_surface(alien_text, alien_rect)
+        if game.show_interact_hint and hints["interact"] and isinstance(hints["interact"], dict):
             interact_hint = hints["interact"]
-            if blaster:
-                interact_text = speech_font.render(interact_hint["message"], True, WHITE)
-                interact_rect = interact_text.get_rect(center=(blaster.rect.x - camera_x, 370))
-                screen.blit(interact_text, interact_rect)
+            if game.blaster:
+                interact_text = text_cache.render(speech_font, interact_hint["message"], True, WHITE)
+                interact_rect = interact_text.get_rect(center=(game.blaster.rect.x - game.camera_x, 370))
+                blit_surface(interact_text, interact_rect)
     
     # Shows timer
-    if start_timer is not None:
-        if end_timer is not None and start_timer is not None:
-            elapsed_time = (end_timer - start_timer) - paused_time
-        elif is_paused and last_pause_start is not None:
-            elapsed_time = (last_pause_start - start_timer) - paused_time
+    if game.start_timer is not None:
+        if game.end_timer is not None and game.start_timer is not None:
+            elapsed_time = (game.end_timer - game.start_timer) - game.paused_time
+        elif game.is_paused and game.last_pause_start is not None:
+            elapsed_time = (game.last_pause_start - game.start_timer) - game.paused_time
         else:
-            elapsed_time = (pygame.time.get_ticks() - start_timer) - paused_time
+            elapsed_time = (game.clock.now - game.start_timer) - game.paused_time
         minutes = int(elapsed_time // 60000)
         seconds = int((elapsed_time % 60000) // 1000)
         milliseconds = elapsed_time % 1000
-        time_text = timer_font.render(f"Time: {minutes:02d}:{seconds:02d}.{milliseconds:03d}", True, WHITE)
-        screen.blit(time_text, (10, 10))
+        time_text = text_cache.render(timer_font, f"Time: {minutes:02d}:{seconds:02d}.{milliseconds:03d}", True, WHITE)
+        blit_surface(time_text, (10, 10))
+
+    # Shows frame profiler overlay with this frame's drawn and culled counts below it
+    if frame_profiler.show_overlay:
+        lines = frame_profiler.overlay_lines + [f"draws {render_stats['drawn']}, culled {render_stats['culled']}"]
+        for i, line in enumerate(lines):
+            blit_surface(text_cache.render(profiler_font, line, True, WHITE), (200, 10 + i * 16))
+
+# Gameplay Check: True while the player is in control of the level
+def is_gameplay_active():
+    return game.is_active() and not (is_title_screen or is_game_select_screen or is_message_screen or is_message_fade_out or is_second_message or is_second_message_fade_out or is_third_message or is_third_message_fade_out or is_fourth_message or is_fourth_message_fade_out or is_new_game_options or is_resume_confirm or is_new_game_confirm)
 
 # Main Game Loop
-while running:
-
-    # Handle Events: Processes user inputs
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-
-            # Title Screen Input: Selects game start
-            if is_title_screen:
-                start_rect, quit_rect = render_title()
-                if start_rect.collidepoint(mouse_pos):
-                    is_title_screen = False
-                    is_game_select_screen = True
-                elif quit_rect.collidepoint(mouse_pos):
-                    running = False
-
-            # Game Select Input: Chooses New game or resume game
-            elif is_game_select_screen:
-                new_game_rect, resume_game_rect, back_rect = render_game_select()
-                if new_game_rect.collidepoint(mouse_pos):
-                    if os.path.exists(SAVE_FILE):
-                        is_game_select_screen = False
-                        is_new_game_confirm = True
-                    else:
-                        is_game_select_screen = False
-                        is_new_game_options = True
-                elif resume_game_rect.collidepoint(mouse_pos):
-                    if os.path.exists(SAVE_FILE):
-                        is_game_select_screen = False
-                        is_resume_confirm = True
-                    else:
-                        reset_game(full_reset=True)
+if __name__ == "__main__":
+    logger.set_level(LOG_LEVEL)
+    logger.console = LOG_CONSOLE
+    if LOG_FILE:
+        logger.open_file_sink(LOG_FILE)
+    logger.install_crash_dump()
+    init_display()
+    game = GameState(CheckpointManager(SAVE_FILE, write_behind=SAVE_WRITE_BEHIND))
+    if RECORD_INPUT_FILE:
+        game.recorder = InputRecorder()
+
+    while running:
+        frame_profiler.begin_frame()
+        game.clock.sample()
+
+        # Handle Events: Processes user inputs
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+            # Window Events: Repaints the whole window once it is uncovered, restored or resized
+            elif event.type in REPAINT_EVENTS:
+                dirty_tracker.invalidate()
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos = pygame.mouse.get_pos()
+
+                # Title Screen Input: Selects game start
+                if is_title_screen:
+                    start_rect, quit_rect = render_title()
+                    if start_rect.collidepoint(mouse_pos):
+                        is_title_screen = False
+                        is_game_select_screen = True
+                    elif quit_rect.collidepoint(mouse_pos):
+                        running = False
+
+                # Game Select Input: Chooses New game or resume game
+                elif is_game_select_screen:
+                    new_game_rect, resume_game_rect, back_rect = render_game_select()
+                    if new_game_rect.collidepoint(mouse_pos):
+                        if os.path.exists(SAVE_FILE):
+                            is_game_select_screen = False
+                            is_new_game_confirm = True
+                        else:
+                            is_game_select_screen = False
+                            is_new_game_options = True
+                    elif resume_game_rect.collidepoint(mouse_pos):
+                        if os.path.exists(SAVE_FILE):
+                            is_game_select_screen = False
+                            is_resume_confirm = True
+                        else:
+                            reset_game(full_reset=True)
+                            is_game_select_screen = False
+                            is_message_screen = True
+                            message_timer = game.clock.now
+                    elif back_rect.collidepoint(mouse_pos):
                         is_game_select_screen = False
+                        is_title_screen = True
+                elif is_resume_confirm:
+                    yes_rect, no_rect, _ = render_confirm_save("Continue game?")
+                    if yes_rect.collidepoint(mouse_pos):
+                        reset_game(full_reset=False)
+                        is_resume_confirm = False
                         is_message_screen = True
-                        message_timer = pygame.time.get_ticks()
-                elif back_rect.collidepoint(mouse_pos):
-                    is_game_select_screen = False
-                    is_title_screen = True
-            elif is_resume_confirm:
-                yes_rect, no_rect, _ = render_confirm_save("Continue game?")
-                if yes_rect.collidepoint(mouse_pos):
-                    reset_game(full_reset=False)
-                    is_resume_confirm = False
-                    is_message_screen = True
-                    message_timer = pygame.time.get_ticks()
-                elif no_rect.collidepoint(mouse_pos):
-                    is_resume_confirm = False
-                    is_game_select_screen = True
-
-            # New Game: Confirms save deletion
-            elif is_new_game_confirm:
-                yes_rect, no_rect, _ = render_confirm_save("Erase existing save?")
-                if yes_rect.collidepoint(mouse_pos):
-                    if delete_save_file():
+                        message_timer = game.clock.now
+                    elif no_rect.collidepoint(mouse_pos):
+                        is_resume_confirm = False
+                        is_game_select_screen = True
+
+                # New Game: Confirms save deletion
+                elif is_new_game_confirm:
+                    yes_rect, no_rect, _ = render_confirm_save("Erase existing save?")
+                    if yes_rect.collidepoint(mouse_pos):
+                        if delete_save_file():
+                            is_new_game_confirm = False
+                            is_new_game_options = True
+                        else:
+                            logger.error("Failed to erase save file")
+                    elif no_rect.collidepoint(mouse_pos):
                         is_new_game_confirm = False
-                        is_new_game_options = True
-                    else:
-                        print("Failed to erase save file")
-                elif no_rect.collidepoint(mouse_pos):
-                    is_new_game_confirm = False
-                    is_game_select_screen = True
-
-            # New Game: Selects level
-            elif is_new_game_options:
-                buttons, back_rect = render_new_game_options()
-                if back_rect.collidepoint(mouse_pos):
-                    is_new_game_options = False
-                    is_game_select_screen = True
-                for i, button in enumerate(buttons):
-                    if button.collidepoint(mouse_pos):
-                        reset_game(full_reset=True, level=i + 1)
+                        is_game_select_screen = True
+
+                # New Game: Selects level
+                elif is_new_game_options:
+                    buttons, back_rect = render_new_game_options()
+                    if back_rect.collidepoint(mouse_pos):
                         is_new_game_options = False
-                        is_message_screen = True
-                        message_timer = pygame.time.get_ticks()
-                        break
-
-            # Game Over: Handles restart or quit
-            elif is_game_over:
-                if is_confirm_save_game_over:
-                    yes_rect, no_rect, cancel_rect = render_confirm_save("Do you wish to save?", show_cancel=True)
-                    if yes_rect and yes_rect.collidepoint(mouse_pos):
-                        checkpoint_manager.save_game()
-                        reset_game(full_reset=False)
-                        is_title_screen = True
-                        is_game_over = False
-                        is_confirm_save_game_over = False
-                    elif no_rect and no_rect.collidepoint(mouse_pos):
-                        reset_game(full_reset=True)
-                        is_title_screen = True
-                        is_game_over = False
-                        is_confirm_save_game_over = False
-                    elif cancel_rect and cancel_rect.collidepoint(mouse_pos):
-                        is_confirm_save_game_over = False
-                else:
-                    restart_rect, quit_rect = render_game_over()
-                    if restart_rect.collidepoint(mouse_pos):
-                        reset_game(full_reset=False)
-                        is_game_over = False
-                    elif quit_rect.collidepoint(mouse_pos):
-                        is_confirm_save_game_over = True
+                        is_game_select_screen = True
+                    for i, button in enumerate(buttons):
+                        if button.collidepoint(mouse_pos):
+                            reset_game(full_reset=True, level=i + 1)
+                            is_new_game_options = False
+                            is_message_screen = True
+                            message_timer = game.clock.now
+                            break
 
-            # Win Game: Handles restart or quit
-            elif is_game_won:
-                restart_rect, quit_rect = render_win()
-                if restart_rect.collidepoint(mouse_pos):
-                    reset_game(full_reset=True)
-                elif quit_rect.collidepoint(mouse_pos):
-                    checkpoint_manager.save_game()
-                    reset_game(full_reset=False)
-                    is_title_screen = True
-
-            # Skip Story
-            elif is_message_screen or is_message_fade_out or is_second_message or is_second_message_fade_out or is_third_message or is_third_message_fade_out or is_fourth_message or is_fourth_message_fade_out:
-                skip_rect = render_skip_button()
-                if skip_rect.collidepoint(mouse_pos):
-                    is_message_screen = False
-                    is_message_fade_out = False
-                    is_second_message = False
-                    is_second_message_fade_out = False
-                    is_third_message = False
-                    is_third_message_fade_out = False
-                    is_fourth_message = False
-                    is_fourth_message_fade_out = False
-
-            # Gameplay: Toggles pause
-            elif not (is_message_screen or is_message_fade_out or is_second_message or is_second_message_fade_out or is_third_message or is_third_message_fade_out or is_fourth_message or is_fourth_message_fade_out):
-                pause_rect = pygame.Rect(*PAUSE_BUTTON_POS, *PAUSE_BUTTON_SIZE)
-                if pause_rect.collidepoint(mouse_pos) and not is_paused:
-                    is_paused = True
-                    if start_timer is not None and last_pause_start is None:
-                        last_pause_start = pygame.time.get_ticks()
-
-                # Pause Menu: Handles pause options
-                elif is_paused:
-                    if is_confirm_save:
-                        yes_rect, no_rect, cancel_rect = render_confirm_save("Do you want to save?", show_cancel=True)
+                # Game Over: Handles restart or quit
+                elif game.is_game_over:
+                    if is_confirm_save_game_over:
+                        yes_rect, no_rect, cancel_rect = render_confirm_save("Do you wish to save?", show_cancel=True)
                         if yes_rect and yes_rect.collidepoint(mouse_pos):
-                            checkpoint_manager.save_game()
+                            game.checkpoint_manager.save_game()
                             reset_game(full_reset=False)
                             is_title_screen = True
-                            is_paused = False
-                            is_confirm_save = False
+                            game.is_game_over = False
+                            is_confirm_save_game_over = False
                         elif no_rect and no_rect.collidepoint(mouse_pos):
                             reset_game(full_reset=True)
                             is_title_screen = True
-                            is_paused = False
-                            is_confirm_save = False
+                            game.is_game_over = False
+                            is_confirm_save_game_over = False
                         elif cancel_rect and cancel_rect.collidepoint(mouse_pos):
-                            is_confirm_save = False
+                            is_confirm_save_game_over = False
                     else:
-                        resume_rect, quit_rect = render_pause_menu()
-                        if resume_rect.collidepoint(mouse_pos):
-                            if last_pause_start is not None:
-                                paused_time += pygame.time.get_ticks() - last_pause_start
-                            last_pause_start = None
-                            is_paused = False
+                        restart_rect, quit_rect = render_game_over()
+                        if restart_rect.collidepoint(mouse_pos):
+                            reset_game(full_reset=False)
+                            game.is_game_over = False
                         elif quit_rect.collidepoint(mouse_pos):
-                            is_confirm_save = True
-
-        # Keyboard Input: Processes key presses
-        elif event.type == pygame.KEYDOWN:
-
-            # Title Screen Keys: Navigates title
-            if is_title_screen:
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    is_title_screen = False
-                    is_game_select_screen = True
-                elif event.key == pygame.K_q:
-                    running = False
-
-            # Select Keys: Chooses mode
-            elif is_game_select_screen:
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    if os.path.exists(SAVE_FILE):
-                        is_game_select_screen = False
-                        is_new_game_confirm = True
-                    else:
-                        is_game_select_screen = False
-                        is_new_game_options = True
-                elif event.key == pygame.K_r:
-                    if os.path.exists(SAVE_FILE):
-                        is_game_select_screen = False
-                        is_resume_confirm = True
-                    else:
+                            is_confirm_save_game_over = True
+
+                # Win Game: Handles restart or quit
+                elif game.is_game_won:
+                    restart_rect, quit_rect = render_win()
+                    if restart_rect.collidepoint(mouse_pos):
                         reset_game(full_reset=True)
+                    elif quit_rect.collidepoint(mouse_pos):
+                        game.checkpoint_manager.save_game()
+                        reset_game(full_reset=False)
+                        is_title_screen = True
+
+                # Skip Story
+                elif is_message_screen or is_message_fade_out or is_second_message or is_second_message_fade_out or is_third_message or is_third_message_fade_out or is_fourth_message or is_fourth_message_fade_out:
+                    skip_rect = render_skip_button()
+                    if skip_rect.collidepoint(mouse_pos):
+                        is_message_screen = False
+                        is_message_fade_out = False
+                        is_second_message = False
+                        is_second_message_fade_out = False
+                        is_third_message = False
+                        is_third_message_fade_out = False
+                        is_fourth_message = False
+                        is_fourth_message_fade_out = False
+
+                # Gameplay: Toggles pause
+                elif not (is_message_screen or is_message_fade_out or is_second_message or is_second_message_fade_out or is_third_message or is_third_message_fade_out or is_fourth_message or is_fourth_message_fade_out):
+                    pause_rect = pygame.Rect(*PAUSE_BUTTON_POS, *PAUSE_BUTTON_SIZE)
+                    if pause_rect.collidepoint(mouse_pos) and not game.is_paused:
+                        press_gameplay_key(pygame.K_p)
+
+                    # Pause Menu: Handles pause options
+                    elif game.is_paused:
+                        if is_confirm_save:
+                            yes_rect, no_rect, cancel_rect = render_confirm_save("Do you want to save?", show_cancel=True)
+                            if yes_rect and yes_rect.collidepoint(mouse_pos):
+                                game.checkpoint_manager.save_game()
+                                reset_game(full_reset=False)
+                                is_title_screen = True
+                                is_confirm_save = False
+                            elif no_rect and no_rect.collidepoint(mouse_pos):
+                                reset_game(full_reset=True)
+                                is_title_screen = True
+                                is_confirm_save = False
+                            elif cancel_rect and cancel_rect.collidepoint(mouse_pos):
+                                is_confirm_save = False
+                        else:
+                            resume_rect, quit_rect = render_pause_menu()
+                            if resume_rect.collidepoint(mouse_pos):
+                                press_gameplay_key(pygame.K_p)
+                            elif quit_rect.collidepoint(mouse_pos):
+                                is_confirm_save = True
+
+            # Keyboard Input: Processes key presses
+            elif event.type == pygame.KEYDOWN:
+
+                # Profiler Keys: Toggles the frame timing overlay
+                if event.key == pygame.K_F3:
+                    frame_profiler.toggle_overlay()
+
+                # Title Screen Keys: Navigates title
+                elif is_title_screen:
+                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                        is_title_screen = False
+                        is_game_select_screen = True
+                    elif event.key == pygame.K_q:
+                        running = False
+
+                # Select Keys: Chooses mode
+                elif is_game_select_screen:
+                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                        if os.path.exists(SAVE_FILE):
+                            is_game_select_screen = False
+                            is_new_game_confirm = True
+                        else:
+                            is_game_select_screen = False
+                            is_new_game_options = True
+                    elif event.key == pygame.K_r:
+                        if os.path.exists(SAVE_FILE):
+                            is_game_select_screen = False
+                            is_resume_confirm = True
+                        else:
+                            reset_game(full_reset=True)
+                            is_game_select_screen = False
+                            is_message_screen = True
+                            message_timer = game.clock.now
+                    elif event.key == pygame.K_BACKSPACE:
                         is_game_select_screen = False
+                        is_title_screen = True
+
+                # Confirm Keys: Confirms resume
+                elif is_resume_confirm:
+                    yes_rect, no_rect, _ = render_confirm_save("Continue game?")
+                    if event.key in (pygame.K_y, pygame.K_RETURN):
+                        reset_game(full_reset=False)
+                        is_resume_confirm = False
                         is_message_screen = True
-                        message_timer = pygame.time.get_ticks()
-                elif event.key == pygame.K_BACKSPACE:
-                    is_game_select_screen = False
-                    is_title_screen = True
-
-            # Confirm Keys: Confirms resume
-            elif is_resume_confirm:
-                yes_rect, no_rect, _ = render_confirm_save("Continue game?")
-                if event.key in (pygame.K_y, pygame.K_RETURN):
-                    reset_game(full_reset=False)
-                    is_resume_confirm = False
-                    is_message_screen = True
-                    message_timer = pygame.time.get_ticks()
-                elif event.key in (pygame.K_n, pygame.K_ESCAPE):
-                    is_resume_confirm = False
-                    is_game_select_screen = True
-
-            # Confirm Keys: Confirms save deletion
-            elif is_new_game_confirm:
-                yes_rect, no_rect, _ = render_confirm_save("Erase existing save?")
-                if event.key in (pygame.K_y, pygame.K_RETURN):
-                    if delete_save_file():
+                        message_timer = game.clock.now
+                    elif event.key in (pygame.K_n, pygame.K_ESCAPE):
+                        is_resume_confirm = False
+                        is_game_select_screen = True
+
+                # Confirm Keys: Confirms save deletion
+                elif is_new_game_confirm:
+                    yes_rect, no_rect, _ = render_confirm_save("Erase existing save?")
+                    if event.key in (pygame.K_y, pygame.K_RETURN):
+                        if delete_save_file():
+                            is_new_game_confirm = False
+                            is_new_game_options = True
+                        else:
+                            logger.error("Failed to erase save file")
+                    elif event.key in (pygame.K_n, pygame.K_ESCAPE):
                         is_new_game_confirm = False
-                        is_new_game_options = True
-                    else:
-                        print("Failed to erase save file")
-                elif event.key in (pygame.K_n, pygame.K_ESCAPE):
-                    is_new_game_confirm = False
-                    is_game_select_screen = True
-
-            # Options Keys: Selects level
-            elif is_new_game_options:
-                buttons, back_rect = render_new_game_options()
-                if event.key == pygame.K_BACKSPACE:
-                    is_new_game_options = False
-                    is_game_select_screen = True
-                elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    for i, button in enumerate(buttons):
-                        if button.collidepoint(pygame.mouse.get_pos()):
-                            reset_game(full_reset=True, level=i + 1)
-                            is_new_game_options = False
-                            is_message_screen = True
-                            message_timer = pygame.time.get_ticks()
-                            break
-
-            # Message Keys: Advance Story
-            elif is_message_screen and not is_message_fade_out:
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    is_message_fade_out = True
-                    message_timer = pygame.time.get_ticks()
-            elif is_second_message and not is_second_message_fade_out:
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    is_second_message_fade_out = True
-                    message_timer = pygame.time.get_ticks()
-            elif is_third_message and not is_third_message_fade_out:
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    is_third_message_fade_out = True
-                    message_timer = pygame.time.get_ticks()
-            elif is_fourth_message and not is_fourth_message_fade_out:
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    is_fourth_message_fade_out = True
-                    message_timer = pygame.time.get_ticks()
-
-            # Game Over Keys: Restarts or quits
-            elif is_game_over:
-                if event.key == pygame.K_r:
-                    reset_game(full_reset=False)
-                    is_game_over = False
-                elif event.key == pygame.K_q:
-                    is_confirm_save_game_over = True
-
-            # Win Game Keys: Restarts or quits
-            elif is_game_won:
-                if event.key == pygame.K_r:
-                    reset_game(full_reset=True)
-                elif event.key == pygame.K_q:
-                    checkpoint_manager.save_game()
-                    reset_game(full_reset=False)
-                    is_title_screen = True
-
-            # Gameplay Keys: Controls player
-            elif not is_paused:
-
-                # Interactable Objects: Blaster
-                if event.key == pygame.K_e:
-                    player_rect = pygame.Rect(player_x, player_y, PLAYER_WIDTH, PLAYER_HEIGHT)
-                    if blaster and player_rect.colliderect(blaster.rect):
-                        show_speech_bubble = not show_speech_bubble
-                        if not show_speech_bubble:
-                            pickup_message = "Blaster Acquired!"
-                            pickup_message_timer = pygame.time.get_ticks()
-                            is_blaster_acquired = True
-                            if current_level in level_data and level_data[current_level]["breakable_index"] < len(platforms):
-                                is_platform_breaking = True
-                                platform_break_timer = pygame.time.get_ticks()
-                            blaster = None
-                            if show_interact_hint and level_data[current_level]["hints"]["interact"]:
-                                show_interact_hint = False
-                                interact_hint_shown = True
-
-                # Player Jump
-                elif event.key == pygame.K_SPACE and not is_jumping:
-                    player_velocity_y = PLAYER_JUMP
-                    is_jumping = True
-                    show_jump_hint = False
-                    jump_hint_shown = True
-                    if current_level == 1 and not alien_hint_shown and level_data[current_level]["hints"]["alien"]:
-                        show_alien_hint = True
-
-                # Pause Game: Toggles pause
-                elif event.key == pygame.K_p and not (is_game_over or is_game_won):
-                    is_paused = True
-                    if start_timer is not None and last_pause_start is None:
-                        last_pause_start = pygame.time.get_ticks()
-
-            # Pause Menu Keys: Resumes or quits
-            elif is_paused:
-                if event.key == pygame.K_p:
-                    if last_pause_start is not None:
-                        paused_time += pygame.time.get_ticks() - last_pause_start
-                    last_pause_start = None
-                    is_paused = False
-                elif event.key == pygame.K_q:
-                    is_confirm_save = True
+                        is_game_select_screen = True
 
-    # Processes game mechanics
-    if not (is_game_over or is_game_won or is_title_screen or is_game_select_screen or is_message_screen or is_message_fade_out or is_second_message or is_second_message_fade_out or is_third_message or is_third_message_fade_out or is_fourth_message or is_fourth_message_fade_out or is_paused or is_new_game_options or is_resume_confirm or is_new_game_confirm):
-        
-        # Player Moving left and right
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_a] and player_x > 0:
-            player_x -= PLAYER_SPEED
-            show_movement_hint = False
-            if current_level == 1 and not show_movement_hint and not jump_hint_shown and level_data[current_level]["hints"]["jump"]:
-                show_jump_hint = True
-            if start_timer is None:
-                start_timer = pygame.time.get_ticks()
-        if keys[pygame.K_d] and player_x < WORLD_WIDTH - PLAYER_WIDTH:
-            player_x += PLAYER_SPEED
-            show_movement_hint = False
-            if current_level == 1 and not show_movement_hint and not jump_hint_shown and level_data[current_level]["hints"]["jump"]:
-                show_jump_hint = True
-            if start_timer is None:
-                start_timer = pygame.time.get_ticks()
-
-        # Player Physics: gravity and collisions
-        player_velocity_y += GRAVITY
-        next_player_y = player_y + player_velocity_y
-        next_player_rect = pygame.Rect(player_x, next_player_y, PLAYER_WIDTH, PLAYER_HEIGHT)
-
-        on_platform = False
-        for i, platform in enumerate(platforms):
-            if next_player_rect.colliderect(platform.rect):
-                if player_velocity_y > 0:
-                    next_player_y = platform.rect.top - PLAYER_HEIGHT
-                    player_velocity_y = 0
-                    is_jumping = False
-                    on_platform = True
-                    hints = level_data[current_level]["hints"]
-                    if current_level == 1:
-                        if hints["jump"] and i == hints["jump"].get("platform_index") and not alien_hint_shown and hints["alien"]:
-                            show_alien_hint = True
-                            alien_hint_timer = pygame.time.get_ticks()
-                        elif hints["alien"] and i == hints["alien"].get("platform_index") and show_alien_hint and not alien_hint_shown:
-                            alien_hint_timer = pygame.time.get_ticks()
-                            alien_hint_shown = True
-                elif player_velocity_y < 0:
-                    next_player_y = platform.rect.bottom
-                    player_velocity_y = 0
-
-        player_y = next_player_y
-
-        # Collision: Places player on ground
-        if current_level == 1 and not on_platform and player_y > HEIGHT - PLAYER_HEIGHT - 40 and player_x < HOLE_LEFT:
-            player_y = HEIGHT - PLAYER_HEIGHT - 40
-            player_velocity_y = 0
-            is_jumping = False
-
-        # Collision: Updates checkpoint status
-        player_rect = pygame.Rect(player_x, player_y, PLAYER_WIDTH, PLAYER_HEIGHT)
-        for checkpoint in checkpoint_manager.checkpoints:
-            if checkpoint["id"].startswith(str(current_level)):
-                checkpoint_rect = pygame.Rect(checkpoint["x"], checkpoint["y"], checkpoint["width"], checkpoint["height"])
-                if not checkpoint["reached"] and player_rect.colliderect(checkpoint_rect):
-                    print(f"Player collided with checkpoint {checkpoint['id']} at ({checkpoint['x']}, {checkpoint['y']}) with player at ({player_x}, {player_y})")
-                    checkpoint_manager.update_checkpoint(checkpoint["id"], True, player_x=player_x, player_y=player_y)
-                    checkpoint_message = f"Checkpoint {checkpoint['id']} Reached!"
-                    checkpoint_message_timer = pygame.time.get_ticks()
-                    break
-
-        # Camera Movement: Tracks player position
-        camera_x = max(0, min(player_x - WIDTH // 2 + PLAYER_WIDTH // 2, WORLD_WIDTH - WIDTH))
+                # Options Keys: Selects level
+                elif is_new_game_options:
+                    buttons, back_rect = render_new_game_options()
+                    if event.key == pygame.K_BACKSPACE:
+                        is_new_game_options = False
+                        is_game_select_screen = True
+                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                        for i, button in enumerate(buttons):
+                            if button.collidepoint(pygame.mouse.get_pos()):
+                                reset_game(full_reset=True, level=i + 1)
+                                is_new_game_options = False
+                                is_message_screen = True
+                                message_timer = game.clock.now
+                                break
+
+                # Message Keys: Advance Story
+                elif is_message_screen and not is_message_fade_out:
+                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                        is_message_fade_out = True
+                        message_timer = game.clock.now
+                elif is_second_message and not is_second_message_fade_out:
+                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                        is_second_message_fade_out = True
+                        message_timer = game.clock.now
+                elif is_third_message and not is_third_message_fade_out:
+                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                        is_third_message_fade_out = True
+                        message_timer = game.clock.now
+                elif is_fourth_message and not is_fourth_message_fade_out:
+                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                        is_fourth_message_fade_out = True
+                        message_timer = game.clock.now
+
+                # Game Over Keys: Restarts or quits
+                elif game.is_game_over:
+                    if event.key == pygame.K_r:
+                        reset_game(full_reset=False)
+                        game.is_game_over = False
+                    elif event.key == pygame.K_q:
+                        is_confirm_save_game_over = True
 
-        # Update Enemies: Moves enemies and checks collisions
-        for enemy in enemies:
-            enemy.update(player_x, PLAYER_WIDTH, platforms, camera_x)
-            if player_rect.colliderect(enemy.rect):
-                is_game_over = True
+                # Win Game Keys: Restarts or quits
+                elif game.is_game_won:
+                    if event.key == pygame.K_r:
+                        reset_game(full_reset=True)
+                    elif event.key == pygame.K_q:
+                        game.checkpoint_manager.save_game()
+                        reset_game(full_reset=False)
+                        is_title_screen = True
 
-        # Check Win/Lose conditions
-        if player_y > HEIGHT:
-            if player_x >= HOLE_LEFT and is_blaster_acquired:
-                is_game_won = True
-                if end_timer is None:
-                    end_timer = pygame.time.get_ticks()
-            else:
-                is_game_over = True
+                # Gameplay Keys: Controls player and pauses or resumes
+                elif event.key in REPLAY_KEYS:
+                    press_gameplay_key(event.key)
 
-        # Controls hints visibility
-        if show_alien_hint and alien_hint_timer > 0:
-            current_time = pygame.time.get_ticks()
-            if current_time - alien_hint_timer >= ALIEN_HINT_DURATION:
-                show_alien_hint = False
-                if current_level == 1 and not interact_hint_shown and level_data[current_level]["hints"]["interact"]:
-                    show_interact_hint = True
+                # Pause Menu Keys: Quits
+                elif game.is_paused and event.key == pygame.K_q:
+                    is_confirm_save = True
 
-        # Removes breakable platform
-        if is_platform_breaking and pygame.time.get_ticks() - platform_break_timer > PLATFORM_BREAK_DELAY:
-            if current_level in level_data and level_data[current_level]["breakable_index"] < len(platforms):
-                platforms.pop(level_data[current_level]["breakable_index"])
-            is_platform_breaking = False
-
-    # Manages story sequence
-    if is_message_fade_out:
-        current_time = pygame.time.get_ticks()
-        if current_time - message_timer >= FADE_OUT_DURATION:
-            is_message_fade_out = False
-            is_message_screen = False
-            is_second_message = True
-            message_timer = pygame.time.get_ticks()
-    elif is_second_message_fade_out:
-        current_time = pygame.time.get_ticks()
-        if current_time - message_timer >= FADE_OUT_DURATION:
-            is_second_message = False
-            is_second_message_fade_out = False
-            is_third_message = True
-            message_timer = pygame.time.get_ticks()
-    elif is_third_message_fade_out:
-        current_time = pygame.time.get_ticks()
-        if current_time - message_timer >= FADE_OUT_DURATION:
-            is_third_message = False
-            is_third_message_fade_out = False
-            is_fourth_message = True
-            message_timer = pygame.time.get_ticks()
-    elif is_fourth_message_fade_out:
-        current_time = pygame.time.get_ticks()
-        if current_time - message_timer >= FADE_OUT_DURATION:
-            is_fourth_message = False
-            is_fourth_message_fade_out = False
-
-    # Render Scene: Draws current screen
-    if is_title_screen:
-        render_title()
-    elif is_game_select_screen:
-        render_game_select()
-    elif is_resume_confirm:
-        render_confirm_save("Continue game?")
-    elif is_new_game_confirm:
-        render_confirm_save("Erase existing save?")
-    elif is_new_game_options:
-        render_new_game_options()
-    elif is_message_screen or is_message_fade_out or is_second_message or is_second_message_fade_out or is_third_message or is_third_message_fade_out or is_fourth_message or is_fourth_message_fade_out:
-        render_message()
-        render_skip_button()
-    elif is_game_over:
-        if is_confirm_save_game_over:
-            render_confirm_save("Do you want to save?", show_cancel=True)
-        else:
-            render_game_over()
-    elif is_game_won:
-        render_win()
-    else:
-        render_game()
-        render_pause_button()
-        if is_paused:
-            if is_confirm_save:
+        frame_profiler.lap("events")
+
+        # Processes game mechanics
+        if is_gameplay_active():
+            keys = pygame.key.get_pressed()
+            game.update(keys[pygame.K_a], keys[pygame.K_d])
+            if game.recorder is not None:
+                game.recorder.end_frame(game.clock.now, keys[pygame.K_a], keys[pygame.K_d], True)
+        elif game.recorder is not None:
+            game.recorder.end_frame(game.clock.now, False, False, False)
+
+        # Manages story sequence
+        if is_message_fade_out:
+            current_time = game.clock.now
+            if current_time - message_timer >= FADE_OUT_DURATION:
+                is_message_fade_out = False
+                is_message_screen = False
+                is_second_message = True
+                message_timer = game.clock.now
+        elif is_second_message_fade_out:
+            current_time = game.clock.now
+            if current_time - message_timer >= FADE_OUT_DURATION:
+                is_second_message = False
+                is_second_message_fade_out = False
+                is_third_message = True
+                message_timer = game.clock.now
+        elif is_third_message_fade_out:
+            current_time = game.clock.now
+            if current_time - message_timer >= FADE_OUT_DURATION:
+                is_third_message = False
+                is_third_message_fade_out = False
+                is_fourth_message = True
+                message_timer = game.clock.now
+        elif is_fourth_message_fade_out:
+            current_time = game.clock.now
+            if current_time - message_timer >= FADE_OUT_DURATION:
+                is_fourth_message = False
+                is_fourth_message_fade_out = False
+        frame_profiler.lap("story")
+
+        # Render Scene: Draws current screen
+        if is_title_screen:
+            render_title()
+        elif is_game_select_screen:
+            render_game_select()
+        elif is_resume_confirm:
+            render_confirm_save("Continue game?")
+        elif is_new_game_confirm:
+            render_confirm_save("Erase existing save?")
+        elif is_new_game_options:
+            render_new_game_options()
+        elif is_message_screen or is_message_fade_out or is_second_message or is_second_message_fade_out or is_third_message or is_third_message_fade_out or is_fourth_message or is_fourth_message_fade_out:
+            render_message()
+            render_skip_button()
+        elif game.is_game_over:
+            if is_confirm_save_game_over:
                 render_confirm_save("Do you want to save?", show_cancel=True)
             else:
-                render_pause_menu()
-
-    # Update Display: Refreshes screen
-    pygame.display.flip()
-    clock.tick(60)
-
-# Closes game
-checkpoint_manager.close()
-pygame.quit()
-sys.exit()
+                render_game_over()
+        elif game.is_game_won:
+            render_win()
+        else:
+            render_game()
+            render_pause_button()
+            if game.is_paused:
+                if is_confirm_save:
+                    render_confirm_save("Do you want to save?", show_cancel=True)
+                else:
+                    render_pause_menu()
+
+        frame_profiler.lap("render")
+
+        # Update Display: Refreshes screen
+        present_frame()
+        frame_profiler.lap("present")
+        clock.tick(60)
+        frame_profiler.lap("tick")
+        frame_profiler.end_frame()
+
+    # Closes game
+    if game.recorder is not None:
+        game.recorder.close_segment(game.replay_end_state(), game.clock.now)
+        game.recorder.save(RECORD_INPUT_FILE)
+        logger.info("Saved input recording to %s", RECORD_INPUT_FILE)
+    game.checkpoint_manager.close()
+    if FRAME_PROFILE_FILE and frame_profiler.frame_count:
+        frame_profiler.export(FRAME_PROFILE_FILE)
+        logger.info("Exported frame profile to %s", FRAME_PROFILE_FILE)
+    logger.close_file_sink()
+    pygame.quit()
+    sys.exit()
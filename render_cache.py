@@ -0,0 +1,92 @@
+# Loads modules for render caching
+from collections import OrderedDict
+
+import pygame  # type: ignore
+
+# Constants: Cache Settings
+TEXT_CACHE_SIZE = 256
+CHUNK_WIDTH = 512
+
+# Text Cache: Keeps rendered text surfaces so unchanged text is rasterized only once
+# Cached surfaces are shared between callers and must not be drawn on
+class TextCache:
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # Returns the surface for (font, text, antialias, color), evicting the least recently used entry when full
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    # Drops all cached surfaces and resets the counters
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Overlay Cache: Keeps prebuilt translucent full-screen overlays, rebuilt only when the resolution changes
+class OverlayCache:
+    def __init__(self):
+        self.size = None
+        self.surfaces = {}
+
+    # Returns an overlay of the given size filled with an RGBA color
+    def get(self, size, color):
+        if size != self.size:
+            self.size = size
+            self.surfaces.clear()
+        surface = self.surfaces.get(color)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            self.surfaces[color] = surface
+        return surface
+
+# Static Layer: Platforms pre-rendered into fixed-width world chunks, redrawn only when a platform is removed
+class StaticLayerCache:
+    def __init__(self, platform_grid, world_width, height, color, background, chunk_width=CHUNK_WIDTH):
+        self.platform_grid = platform_grid
+        self.height = height
+        self.color = color
+        self.background = background
+        self.chunk_width = chunk_width
+        self.chunks = [None] * -(-world_width // chunk_width)
+
+    # Chunk: Draws every platform overlapping one chunk onto a new surface
+    def _build(self, index):
+        left = index * self.chunk_width
+        surface = pygame.Surface((self.chunk_width, self.height))
+        surface.fill(self.background)
+        platforms = self.platform_grid.platforms
+        for i in self.platform_grid.query(left, left + self.chunk_width):
+            pygame.draw.rect(surface, self.color, platforms[i].rect.move(-left, 0))
+        self.chunks[index] = surface
+        return surface
+
+    # Chunks: Returns (surface, world_x) for every chunk overlapping [view_left, view_right)
+    def visible(self, view_left, view_right):
+        first = max(0, view_left // self.chunk_width)
+        last = min(len(self.chunks) - 1, (view_right - 1) // self.chunk_width)
+        for index in range(first, last + 1):
+            surface = self.chunks[index] or self._build(index)
+            yield surface, index * self.chunk_width
+
+    # Chunks: Drops the chunks a removed platform covered so they are rebuilt on next use
+    def invalidate(self, rect):
+        first = max(0, rect.left // self.chunk_width)
+        last = min(len(self.chunks) - 1, (rect.right - 1) // self.chunk_width)
+        for index in range(first, last + 1):
+            self.chunks[index] = None
@@ -0,0 +1,344 @@
+# Loads modules for save storage backends
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+
+from checkpoint_registry import Checkpoint
+from game_log import logger
+
+# Constants: Save Store Settings
+SQLITE_JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SQLITE_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+SQLITE_SCHEMA_VERSION = 1
+CHECKPOINT_COLUMNS = "id, x, y, width, height, reached, player_x, player_y"
+
+# Save Store Error: A store refused an operation, such as inserting a checkpoint ID that already exists
+class SaveStoreError(Exception):
+    pass
+
+# Save Store Errors: What a store raises when the save data or its storage fails; anything else is a bug
+SAVE_STORE_ERRORS = (sqlite3.Error, OSError, SaveStoreError, json.JSONDecodeError, UnicodeDecodeError)
+
+# Checkpoint Order: Splits an ID such as "10.2" into numeric (level, seq), or (None, None) when malformed
+def checkpoint_sequence(id):
+    try:
+        level, seq = id.split('.')
+        return int(level), int(seq)
+    except (ValueError, AttributeError):
+        return None, None
+
+# Checkpoint Row: Converts a checkpoints table row into a checkpoint record
+def checkpoint_from_row(row):
+    return Checkpoint(row[0], row[1], row[2], row[3], row[4], bool(row[5]), row[6], row[7])
+
+# Save Store: Storage interface behind CheckpointManager
+# Failures raise one of SAVE_STORE_ERRORS; Checkpoint records returned are copies the caller may keep and mutate
+class SaveStore(ABC):
+    supports_write_behind = False
+
+    # Inserts checkpoints; existing IDs raise unless ignore_existing is set
+    @abstractmethod
+    def insert_checkpoints(self, checkpoints, ignore_existing=False):
+        pass
+
+    # Returns one Checkpoint or None
+    @abstractmethod
+    def read_checkpoint(self, id):
+        pass
+
+    # Returns every stored Checkpoint
+    @abstractmethod
+    def read_checkpoints(self):
+        pass
+
+    # Applies {id: {column: value}} checkpoint updates and {key: value} game_state values as one write
+    @abstractmethod
+    def write_batch(self, checkpoints, state):
+        pass
+
+    # Removes a checkpoint
+    @abstractmethod
+    def delete_checkpoint(self, id):
+        pass
+
+    # Returns the highest reached checkpoint ID or None
+    @abstractmethod
+    def latest_reached_id(self):
+        pass
+
+    # Returns a game_state value or None
+    @abstractmethod
+    def read_state(self, key):
+        pass
+
+    # Returns a second store on the same data for a writer thread; only backends with supports_write_behind override it
+    def open_writer(self):
+        raise SaveStoreError(f"{type(self).__name__} does not support write-behind")
+
+    def close(self):
+        pass
+
+# SQLite Store: Tuned SQLite backend with configurable journal mode and durability
+class SQLiteSaveStore(SaveStore):
+    supports_write_behind = True
+
+    def __init__(self, path, journal_mode="WAL", synchronous="NORMAL"):
+        if journal_mode.upper() not in SQLITE_JOURNAL_MODES:
+            raise ValueError(f"Unknown SQLite journal mode: {journal_mode}")
+        if synchronous.upper() not in SQLITE_SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown SQLite synchronous mode: {synchronous}")
+        self.path = path
+        self.journal_mode = journal_mode.upper()
+        self.synchronous = synchronous.upper()
+        self.conn = None
+        self._init_db()
+
+    # Database Connection: Connects to SQLite and applies the journal and durability settings
+    def _connection(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path)
+            self.conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+            self.conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+            logger.info("Opened SQLite connection to %s (journal_mode=%s, synchronous=%s)", self.path, self.journal_mode, self.synchronous)
+        return self.conn
+
+    # Database Setup: Creates SQLite tables and migrates older save files
+    def _init_db(self):
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                id TEXT PRIMARY KEY,
+                x INTEGER,
+                y INTEGER,
+                width INTEGER,
+                height INTEGER,
+                reached BOOLEAN,
+                player_x INTEGER,
+                player_y INTEGER
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS game_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        conn.commit()
+        self._migrate()
+
+    # Schema Migration: Upgrades the save file one version at a time using PRAGMA user_version
+    def _migrate(self):
+        conn = self._connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SQLITE_SCHEMA_VERSION:
+            return
+        try:
+            if version < 1:
+                # Version 1: Numeric level/seq columns, backfilled from IDs, with a (reached, level, seq) index
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(checkpoints)")}
+                if "level" not in columns:
+                    conn.execute("ALTER TABLE checkpoints ADD COLUMN level INTEGER")
+                if "seq" not in columns:
+                    conn.execute("ALTER TABLE checkpoints ADD COLUMN seq INTEGER")
+                ids = [row[0] for row in conn.execute("SELECT id FROM checkpoints")]
+                conn.executemany("UPDATE checkpoints SET level = ?, seq = ? WHERE id = ?",
+                                 [(*checkpoint_sequence(id), id) for id in ids])
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_reached_level_seq ON checkpoints (reached, level, seq)")
+            conn.execute(f"PRAGMA user_version = {SQLITE_SCHEMA_VERSION}")
+            conn.commit()
+            logger.info("Migrated %s from schema version %s to %s", self.path, version, SQLITE_SCHEMA_VERSION)
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+    def insert_checkpoints(self, checkpoints, ignore_existing=False):
+        conn = self._connection()
+        verb = "INSERT OR IGNORE" if ignore_existing else "INSERT"
+        try:
+            conn.executemany(f"""
+                {verb} INTO checkpoints (id, x, y, width, height, reached, player_x, player_y, level, seq)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(cp.id, cp.x, cp.y, cp.width, cp.height, cp.reached, cp.player_x, cp.player_y,
+                   *checkpoint_sequence(cp.id)) for cp in checkpoints])
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+    def read_checkpoint(self, id):
+        row = self._connection().execute(f"SELECT {CHECKPOINT_COLUMNS} FROM checkpoints WHERE id = ?", (id,)).fetchone()
+        return checkpoint_from_row(row) if row else None
+
+    def read_checkpoints(self):
+        return [checkpoint_from_row(row) for row in self._connection().execute(f"SELECT {CHECKPOINT_COLUMNS} FROM checkpoints")]
+
+    def write_batch(self, checkpoints, state):
+        conn = self._connection()
+        try:
+            for id, columns in checkpoints.items():
+                assignments = ", ".join(f"{column} = ?" for column in columns)
+                conn.execute(f"UPDATE checkpoints SET {assignments} WHERE id = ?", (*columns.values(), id))
+            for key, value in state.items():
+                conn.execute("INSERT OR REPLACE INTO game_state (key, value) VALUES (?, ?)", (key, value))
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+    def delete_checkpoint(self, id):
+        conn = self._connection()
+        conn.execute("DELETE FROM checkpoints WHERE id = ?", (id,))
+        conn.commit()
+
+    # Latest Checkpoint: Reverse seek on the (reached, level, seq) index
+    def latest_reached_id(self):
+        row = self._connection().execute(
+            "SELECT id FROM checkpoints WHERE reached = 1 ORDER BY level DESC, seq DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    def read_state(self, key):
+        row = self._connection().execute("SELECT value FROM game_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def open_writer(self):
+        return SQLiteSaveStore(self.path, self.journal_mode, self.synchronous)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+            logger.info("Closed SQLite connection to %s", self.path)
+
+# Memory Store: Pure in-memory backend for headless simulation and tests
+class MemorySaveStore(SaveStore):
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self.checkpoints = {}
+        self.state = {}
+
+    def insert_checkpoints(self, checkpoints, ignore_existing=False):
+        if not ignore_existing:
+            for checkpoint in checkpoints:
+                if checkpoint.id in self.checkpoints:
+                    raise SaveStoreError(f"Checkpoint {checkpoint.id} already exists")
+        for checkpoint in checkpoints:
+            if checkpoint.id not in self.checkpoints:
+                self.checkpoints[checkpoint.id] = checkpoint.copy()
+
+    def read_checkpoint(self, id):
+        checkpoint = self.checkpoints.get(id)
+        return checkpoint.copy() if checkpoint else None
+
+    def read_checkpoints(self):
+        return [checkpoint.copy() for checkpoint in self.checkpoints.values()]
+
+    def write_batch(self, checkpoints, state):
+        for id, columns in checkpoints.items():
+            if id in self.checkpoints:
+                self.checkpoints[id].update(columns)
+        self.state.update(state)
+
+    def delete_checkpoint(self, id):
+        self.checkpoints.pop(id, None)
+
+    def latest_reached_id(self):
+        reached_ids = [id for id, checkpoint in self.checkpoints.items() if checkpoint.reached]
+        return max(reached_ids, key=lambda id: tuple(-1 if part is None else part for part in checkpoint_sequence(id)), default=None)
+
+    def read_state(self, key):
+        return self.state.get(key)
+
+# Append Log Store: Keeps data in memory and appends each write as one compact JSON line
+# The log is replayed on open and rewritten as a snapshot on close
+class AppendLogSaveStore(MemorySaveStore):
+    def __init__(self, path, fsync=False):
+        super().__init__(path)
+        self.fsync = fsync
+        self._replay()
+        self.file = open(self.path, "a", encoding="utf-8")
+        logger.info("Opened save log %s with %s checkpoints", self.path, len(self.checkpoints))
+
+    # Log: Rebuilds memory from the log, then cuts off a torn or damaged tail so new records start on a clean line
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        good_end = 0
+        with open(self.path, "rb") as log:
+            for line in log:
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning("Ignoring damaged record in %s", self.path)
+                    break
+                self._apply(record)
+                good_end += len(line)
+            size = log.seek(0, os.SEEK_END)
+            log.seek(max(good_end - 1, 0))
+            needs_newline = good_end > 0 and log.read(1) != b"\n"
+        if good_end < size:
+            logger.warning("Truncating %s bytes of damaged records from %s", size - good_end, self.path)
+            os.truncate(self.path, good_end)
+        if needs_newline:
+            with open(self.path, "ab") as log:
+                log.write(b"\n")
+
+    def _apply(self, record):
+        op = record["op"]
+        if op == "insert":
+            MemorySaveStore.insert_checkpoints(self, [Checkpoint.from_dict(cp) for cp in record["checkpoints"]], ignore_existing=True)
+        elif op == "batch":
+            MemorySaveStore.write_batch(self, record["checkpoints"], record["state"])
+        elif op == "delete":
+            MemorySaveStore.delete_checkpoint(self, record["id"])
+
+    # Log: Appends one record and flushes it, syncing to disk when fsync is enabled
+    def _append(self, record):
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+
+    def insert_checkpoints(self, checkpoints, ignore_existing=False):
+        new_checkpoints = [cp.to_dict() for cp in checkpoints if cp.id not in self.checkpoints]
+        super().insert_checkpoints(checkpoints, ignore_existing)
+        if new_checkpoints:
+            self._append({"op": "insert", "checkpoints": new_checkpoints})
+
+    def write_batch(self, checkpoints, state):
+        super().write_batch(checkpoints, state)
+        self._append({"op": "batch", "checkpoints": checkpoints, "state": state})
+
+    def delete_checkpoint(self, id):
+        super().delete_checkpoint(id)
+        self._append({"op": "delete", "id": id})
+
+    # Log: Rewrites the log as a two-record snapshot and swaps it in atomically
+    def compact(self):
+        temp_path = self.path + ".compact"
+        with open(temp_path, "w", encoding="utf-8") as snapshot:
+            snapshot.write(json.dumps({"op": "insert", "checkpoints": [cp.to_dict() for cp in self.checkpoints.values()]}, separators=(",", ":")) + "\n")
+            snapshot.write(json.dumps({"op": "batch", "checkpoints": {}, "state": self.state}, separators=(",", ":")) + "\n")
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        self.file.close()
+        os.replace(temp_path, self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.compact()
+        self.file.close()
+        logger.info("Compacted and closed save log %s", self.path)
+
+# Save Store Factory: Builds a backend by name ("sqlite", "memory" or "log")
+def create_save_store(backend, path, **options):
+    if backend == "sqlite":
+        return SQLiteSaveStore(path, **options)
+    if backend == "memory":
+        return MemorySaveStore(path)
+    if backend == "log":
+        return AppendLogSaveStore(path, **options)
+    raise ValueError(f"Unknown save backend: {backend}")
@@ -0,0 +1,112 @@
+# Loads modules for background saving
+import threading
+
+from game_log import logger
+from save_stores import SAVE_STORE_ERRORS
+
+# Save Writer: Applies queued save writes on a dedicated thread with its own store connection
+# Pending writes are coalesced, so only the latest values per checkpoint and per game_state key are written
+class SaveWriter:
+    def __init__(self, store):
+        self.store = store
+        self.pending_checkpoints = {}
+        self.pending_state = {}
+        self.condition = threading.Condition()
+        self.is_writing = False
+        self.is_closed = False
+        self.is_synchronous = False
+        self.thread = threading.Thread(target=self._run, name="SaveWriter", daemon=True)
+        self.thread.start()
+
+    # Queue: Merges checkpoint column updates into any pending update for the same ID
+    def queue_checkpoint(self, id, columns):
+        with self.condition:
+            self.pending_checkpoints.setdefault(id, {}).update(columns)
+            self.condition.notify_all()
+        self._write_if_stopped()
+
+    # Queue: Adds a whole batch under one lock so the writer commits it together
+    def queue_batch(self, checkpoints, state):
+        with self.condition:
+            for id, columns in checkpoints.items():
+                self.pending_checkpoints.setdefault(id, {}).update(columns)
+            self.pending_state.update(state)
+            self.condition.notify_all()
+        self._write_if_stopped()
+
+    # Flush: Blocks until every queued write has been committed
+    def flush(self):
+        with self.condition:
+            while (self.pending_checkpoints or self.pending_state or self.is_writing) and self.thread.is_alive():
+                self.condition.wait(0.1)
+        self._write_if_stopped()
+
+    # Fallback: Once the writer thread has died, commits pending writes on the caller's thread through the main store
+    def _write_if_stopped(self):
+        if self.thread.is_alive():
+            return
+        with self.condition:
+            checkpoints, self.pending_checkpoints = self.pending_checkpoints, {}
+            state, self.pending_state = self.pending_state, {}
+        if not (checkpoints or state):
+            return
+        if not self.is_synchronous:
+            self.is_synchronous = True
+            logger.warning("Save writer for %s stopped, saving synchronously", self.store.path)
+        self._write(self.store, checkpoints, state)
+
+    # Close: Flushes pending writes and stops the writer thread
+    def close(self):
+        self.flush()
+        with self.condition:
+            self.is_closed = True
+            self.condition.notify_all()
+        self.thread.join()
+
+    # Writer Thread: Takes every pending write and commits it as one transaction
+    def _run(self):
+        try:
+            writer_store = self.store.open_writer()
+        except SAVE_STORE_ERRORS as e:
+            logger.error("Save writer failed to open %s: %s", self.store.path, e)
+            with self.condition:
+                self.condition.notify_all()
+            return
+        while True:
+            with self.condition:
+                while not (self.pending_checkpoints or self.pending_state or self.is_closed):
+                    self.condition.wait()
+                if self.is_closed and not (self.pending_checkpoints or self.pending_state):
+                    break
+                checkpoints, self.pending_checkpoints = self.pending_checkpoints, {}
+                state, self.pending_state = self.pending_state, {}
+                self.is_writing = True
+            try:
+                self._write(writer_store, checkpoints, state)
+            except BaseException:
+                self._requeue(checkpoints, state)
+                raise
+            finally:
+                with self.condition:
+                    self.is_writing = False
+                    self.condition.notify_all()
+        writer_store.close()
+
+    # Writer Thread: Puts a batch the thread could not write back under any newer pending writes
+    def _requeue(self, checkpoints, state):
+        with self.condition:
+            for id, columns in self.pending_checkpoints.items():
+                checkpoints.setdefault(id, {}).update(columns)
+            state.update(self.pending_state)
+            self.pending_checkpoints = checkpoints
+            self.pending_state = state
+
+    # Writer Thread: Commits one coalesced batch, retrying like CheckpointManager.save_game
+    def _write(self, writer_store, checkpoints, state):
+        for attempt in range(3):
+            try:
+                writer_store.write_batch(checkpoints, state)
+                return True
+            except SAVE_STORE_ERRORS as e:
+                logger.error("Save writer failed to write batch (attempt %s/3): %s", attempt + 1, e)
+        return False
@@ -0,0 +1,78 @@
+# Loads modules for spatial lookups
+from bisect import bisect_right
+
+# Constants: Broadphase Settings
+GRID_CELL_WIDTH = 256
+
+# Platform Grid: Buckets platform indices by x so collision only checks nearby platforms
+class PlatformGrid:
+    def __init__(self, platforms, cell_width=GRID_CELL_WIDTH):
+        self.cell_width = cell_width
+        self.platforms = platforms
+        self.cells = {}
+        for index, platform in enumerate(platforms):
+            self._insert(index, platform.rect)
+
+    # Grid: Adds a platform index to every cell its rect spans
+    def _insert(self, index, rect):
+        for cell in range(rect.left // self.cell_width, (rect.right - 1) // self.cell_width + 1):
+            self.cells.setdefault(cell, []).append(index)
+
+    # Grid: Returns platform indices, in list order, whose cells overlap the x range [left, right)
+    def query(self, left, right):
+        first_cell = left // self.cell_width
+        last_cell = (right - 1) // self.cell_width
+        if first_cell == last_cell:
+            return self.cells.get(first_cell, ())
+        found = set()
+        for cell in range(first_cell, last_cell + 1):
+            found.update(self.cells.get(cell, ()))
+        return sorted(found)
+
+    # Grid: Removes a platform from the list and shifts the indices stored after it
+    def pop(self, index):
+        platform = self.platforms.pop(index)
+        for cell, indices in self.cells.items():
+            self.cells[cell] = [i - 1 if i > index else i for i in indices if i != index]
+        return platform
+
+# Ground Spans: Sorted table of merged ground segments for O(log n) "ground under x" checks
+class GroundSpans:
+    def __init__(self, platforms, ground_y):
+        self.ground_y = ground_y
+        self.lefts = []
+        self.rights = []
+        self.members = []
+        for left, right, members in self._merge([p for p in platforms if p.rect.y == ground_y]):
+            self.lefts.append(left)
+            self.rights.append(right)
+            self.members.append(members)
+
+    # Spans: Merges overlapping ground platforms into (left, right, members) spans sorted by left
+    @staticmethod
+    def _merge(ground_platforms):
+        spans = []
+        for platform in sorted(ground_platforms, key=lambda p: p.rect.left):
+            if spans and platform.rect.left <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], platform.rect.right)
+                spans[-1][2].append(platform)
+            else:
+                spans.append([platform.rect.left, platform.rect.right, [platform]])
+        return spans
+
+    # Spans: True when some ground platform satisfies left <= x <= right
+    def has_ground(self, x):
+        i = bisect_right(self.lefts, x) - 1
+        return i >= 0 and x <= self.rights[i]
+
+    # Spans: Re-merges only the span that held a removed ground platform
+    def remove(self, platform):
+        if platform.rect.y != self.ground_y:
+            return
+        i = bisect_right(self.lefts, platform.rect.left) - 1
+        if i < 0 or not any(member is platform for member in self.members[i]):
+            return
+        spans = self._merge([member for member in self.members[i] if member is not platform])
+        self.lefts[i:i + 1] = [span[0] for span in spans]
+        self.rights[i:i + 1] = [span[1] for span in spans]
+        self.members[i:i + 1] = [span[2] for span in spans]